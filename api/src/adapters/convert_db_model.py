@@ -1,8 +1,13 @@
+from sqlalchemy import RowMapping
+
 from src.domain.entities.product import Product
-from src.infrastructure.database.models import ProductModel
+from src.domain.entities.thumbnail import Thumbnail
+from src.infrastructure.database.models import ProductModel, ThumbnailModel
 
 
-def convert_db_model_to_entity(product_model: ProductModel) -> Product:
+def convert_db_model_to_entity(
+    product_model: ProductModel, include_picture: bool = True
+) -> Product:
     return Product(
         id=product_model.id,
         name=product_model.name,
@@ -12,5 +17,23 @@ def convert_db_model_to_entity(product_model: ProductModel) -> Product:
         price=product_model.price,
         active=product_model.active,
         selling_place=product_model.selling_place,
-        picture=product_model.picture,
+        picture=product_model.picture if include_picture else None,
+        picture_digest=product_model.picture_digest,
+        updated_at=product_model.updated_at,
+        change_seq=product_model.change_seq,
+        archived_at=product_model.archived_at,
+    )
+
+
+def convert_row_to_entity(row: RowMapping) -> Product:
+    return Product.model_validate({"picture": None, **row})
+
+
+def convert_thumbnail_model_to_entity(thumbnail_model: ThumbnailModel) -> Thumbnail:
+    return Thumbnail(
+        digest=thumbnail_model.digest,
+        size=thumbnail_model.size,
+        format=thumbnail_model.format,
+        content_type=thumbnail_model.content_type,
+        data=thumbnail_model.data,
     )
@@ -1,12 +1,12 @@
 from pydantic import BaseModel, Field
 
-from src.domain.entities.product import EANType, SellingPlaceEnum
+from src.domain.entities.product import EANType, PriceType, SellingPlaceEnum
 
 
 class CreateProductDTO(BaseModel):
     name: str = Field(..., max_length=150)
     ean: EANType
-    price: float
+    price: PriceType
     description: str = Field(..., max_length=250)
     active: bool
     selling_place: SellingPlaceEnum
@@ -0,0 +1,33 @@
+from typing import Any
+
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from src.domain.entities.job import JOB_PAYLOADS, JobKindEnum
+
+
+class EnqueueJobDTO(BaseModel):
+    kind: JobKindEnum
+    payload: dict[str, Any] = {}
+    max_attempts: int | None = Field(None, ge=1, le=20)
+
+    @model_validator(mode="after")
+    def check_payload(self) -> "EnqueueJobDTO":
+        # Rejected now rather than failing on the worker once claimed; the
+        # payload is kept as sent, so handler defaults apply when it runs
+        try:
+            payload = JOB_PAYLOADS[self.kind].model_validate(self.payload)
+        except ValidationError as e:
+            raise ValidationError.from_exception_data(
+                type(self).__name__,
+                [
+                    {
+                        "type": error["type"],
+                        "loc": ("payload", *error["loc"]),
+                        "input": error["input"],
+                        **({"ctx": error["ctx"]} if "ctx" in error else {}),
+                    }
+                    for error in e.errors()
+                ],
+            ) from e
+        self.payload = payload.model_dump(exclude_unset=True)
+        return self
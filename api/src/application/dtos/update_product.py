@@ -1,12 +1,12 @@
 from pydantic import BaseModel, Field
 
-from src.domain.entities.product import EANType, SellingPlaceEnum
+from src.domain.entities.product import EANType, PriceType, SellingPlaceEnum
 
 
 class UpdateProductDTO(BaseModel):
     name: str | None = Field(None, max_length=150)
     ean: EANType | None = None
-    price: float | None = None
+    price: PriceType | None = None
     description: str | None = Field(None, max_length=250)
     active: bool | None = None
     selling_place: SellingPlaceEnum | None = None
@@ -1,15 +1,77 @@
-class NoResultFoundException(Exception):
-    """Exception raised when no result is found in the database."""
+class ApplicationException(Exception):
+    """Base of the exceptions the API answers with their status code."""
 
-    def __init__(self, message: str = "No result found"):
+    def __init__(self, message: str, status_code: int):
         self.message = message
-        self.status_code = 404
+        self.status_code = status_code
         super().__init__(self.message)
 
 
-class DatabaseException(Exception):
+class NoResultFoundException(ApplicationException):
+    """Exception raised when no result is found in the database."""
+
+    def __init__(self, message: str = "No result found"):
+        super().__init__(message, status_code=404)
+
+
+class DatabaseException(ApplicationException):
     """Exception raised for database errors."""
 
     def __init__(self, message: str = "Database connection error"):
-        self.message = message
-        super().__init__(self.message)
+        super().__init__(message, status_code=409)
+
+
+class InvalidPictureException(ApplicationException):
+    """Exception raised when an uploaded picture cannot be processed."""
+
+    def __init__(self, message: str = "Invalid picture"):
+        super().__init__(message, status_code=422)
+
+
+class PictureTooLargeException(ApplicationException):
+    """Exception raised when an uploaded picture exceeds the size limit."""
+
+    def __init__(self, message: str = "Picture is too large"):
+        super().__init__(message, status_code=413)
+
+
+class QueryTimeoutException(ApplicationException):
+    """Exception raised when a database statement exceeds its time limit."""
+
+    def __init__(self, message: str = "Database query timed out"):
+        super().__init__(message, status_code=504)
+
+
+class IdempotencyKeyReusedException(ApplicationException):
+    """Exception raised when an idempotency key is reused for another request."""
+
+    def __init__(
+        self, message: str = "Idempotency key was already used for another request"
+    ):
+        super().__init__(message, status_code=422)
+
+
+class IdempotentRequestInProgressException(ApplicationException):
+    """Exception raised when a request with the same idempotency key is running."""
+
+    def __init__(
+        self,
+        message: str = "A request with this idempotency key is still in progress",
+    ):
+        super().__init__(message, status_code=409)
+
+
+class ReadOnlyCatalogException(ApplicationException):
+    """Exception raised when writing to a catalog served read-only."""
+
+    def __init__(self, message: str = "The product catalog is read-only"):
+        super().__init__(message, status_code=405)
+
+
+class CatalogVersionGoneException(ApplicationException):
+    """Exception raised when a delta is asked from a snapshot no longer kept."""
+
+    def __init__(
+        self, message: str = "Catalog version is no longer kept, download a snapshot"
+    ):
+        super().__init__(message, status_code=410)
@@ -0,0 +1,10 @@
+from uuid import UUID
+from src.domain.repositories.product_repository import ProductRepository
+
+
+class ArchiveProductUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, product_id: UUID) -> None:
+        await self.product_repository.archive_product(product_id)
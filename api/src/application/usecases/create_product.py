@@ -1,15 +1,67 @@
+import hashlib
+from datetime import timedelta
+
 from src.application.dtos.create_product import CreateProductDTO
+from src.application.exceptions.exceptions import (
+    IdempotencyKeyReusedException,
+    IdempotentRequestInProgressException,
+)
 from src.domain.entities.product import Product
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
 from src.domain.repositories.product_repository import ProductRepository
+from src.domain.repositories.thumbnail_repository import ThumbnailRepository
+from src.domain.services.thumbnail_generator import ThumbnailGenerator
 
 
 class CreateProductUseCase:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        thumbnail_repository: ThumbnailRepository,
+        thumbnail_generator: ThumbnailGenerator,
+        idempotency_repository: IdempotencyRepository,
+        idempotency_ttl: timedelta,
+    ):
         self.product_repository = product_repository
+        self.thumbnail_repository = thumbnail_repository
+        self.thumbnail_generator = thumbnail_generator
+        self.idempotency_repository = idempotency_repository
+        self.idempotency_ttl = idempotency_ttl
+
+    async def execute(
+        self, dto: CreateProductDTO, idempotency_key: str | None = None
+    ) -> Product:
+        if idempotency_key is None:
+            return await self._create(dto)
+
+        key = f"create_product:{idempotency_key}"
+        request_hash = hashlib.sha256(dto.model_dump_json().encode()).hexdigest()
+        record = await self.idempotency_repository.claim(
+            key, request_hash, self.idempotency_ttl
+        )
+        if record is not None:
+            if record.request_hash != request_hash:
+                raise IdempotencyKeyReusedException()
+            # Other transactions wait in claim until the first one ends, so
+            # this is only seen from the transaction still holding the claim
+            if record.response is None:
+                raise IdempotentRequestInProgressException()
+            # Replayed as first answered, even if the product changed since
+            return Product.model_validate(record.response)
+
+        product = await self._create(dto)
+        await self.idempotency_repository.complete(
+            key, product.model_dump(mode="json", exclude={"thumbnails"})
+        )
+        return product
 
-    async def execute(self, dto: CreateProductDTO) -> Product:
+    async def _create(self, dto: CreateProductDTO) -> Product:
         product = Product(
             id=None,
             **dto.model_dump(),
         )
+        if product.picture:
+            thumbnails = await self.thumbnail_generator.generate(product.picture)
+            await self.thumbnail_repository.save_thumbnails(thumbnails)
+            product.picture_digest = thumbnails[0].digest
         return await self.product_repository.create_product(product)
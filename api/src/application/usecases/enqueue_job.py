@@ -0,0 +1,14 @@
+from src.application.dtos.enqueue_job import EnqueueJobDTO
+from src.domain.entities.job import Job
+from src.domain.repositories.job_repository import JobRepository
+
+
+class EnqueueJobUseCase:
+    def __init__(self, job_repository: JobRepository, max_attempts: int):
+        self.job_repository = job_repository
+        self.max_attempts = max_attempts
+
+    async def execute(self, dto: EnqueueJobDTO) -> Job:
+        return await self.job_repository.enqueue(
+            dto.kind, dto.payload, dto.max_attempts or self.max_attempts
+        )
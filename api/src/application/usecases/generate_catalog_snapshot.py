@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+from src.domain.entities.catalog_snapshot import (
+    CatalogChanges,
+    CatalogSnapshot,
+    in_snapshot,
+)
+from src.domain.entities.product import SellingPlaceEnum
+from src.domain.repositories.product_repository import ProductRepository
+from src.domain.services.catalog_snapshot_store import CatalogSnapshotStore
+from src.utils.single_flight import SingleFlight
+
+
+class GenerateCatalogSnapshotUseCase:
+    """Keeps a snapshot of the catalog on sale for offline devices.
+
+    A new snapshot is the latest one with the change feed since its version
+    applied, so only changed products are read. Its version is the last
+    change it includes: rows changed while it is written come again later
+    in the feed, which is in commit order, so they end up in their newest
+    state. Purged products leave the feed without a trace, so a snapshot
+    older than retention, which must stay below the purge age, is rebuilt
+    from the whole feed instead, and older files are deleted.
+    """
+
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        snapshot_store: CatalogSnapshotStore,
+        single_flight: SingleFlight[CatalogSnapshot],
+        batch_size: int,
+        retention: timedelta,
+    ):
+        self.product_repository = product_repository
+        self.snapshot_store = snapshot_store
+        self.single_flight = single_flight
+        self.batch_size = batch_size
+        self.retention = retention
+
+    async def execute(
+        self, selling_place: SellingPlaceEnum | None, max_age: timedelta
+    ) -> CatalogSnapshot:
+        """The latest snapshot, refreshed first when older than max_age"""
+        scope = selling_place.value if selling_place else "all"
+        return await self.single_flight.do(
+            f"catalog_snapshot:{scope}",
+            lambda: self._generate(selling_place, max_age),
+        )
+
+    async def _generate(
+        self, selling_place: SellingPlaceEnum | None, max_age: timedelta
+    ) -> CatalogSnapshot:
+        now = datetime.now()
+        latest = await self.snapshot_store.latest(selling_place)
+        if latest and latest.created_at > now - max_age:
+            return latest
+
+        base = latest if latest and latest.created_at > now - self.retention else None
+        since = base.version if base else 0
+        if base and not (await self.product_repository.list_changes(since, 1)).items:
+            return base
+        snapshot = await self.snapshot_store.write_snapshot(
+            selling_place, base, self._changes(selling_place, since)
+        )
+        await self.snapshot_store.prune(selling_place, now - self.retention)
+        return snapshot
+
+    async def _changes(
+        self, selling_place: SellingPlaceEnum | None, since: int
+    ) -> AsyncIterator[CatalogChanges]:
+        while True:
+            feed = await self.product_repository.list_changes(
+                since=since, limit=self.batch_size
+            )
+            yield CatalogChanges(
+                listed=[
+                    product
+                    for product in feed.items
+                    if in_snapshot(product, selling_place)
+                ],
+                removed=[
+                    product.id
+                    for product in feed.items
+                    if not in_snapshot(product, selling_place)
+                ],
+                version=feed.next_token,
+            )
+            if not feed.has_more:
+                return
+            since = feed.next_token
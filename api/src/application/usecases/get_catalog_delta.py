@@ -0,0 +1,15 @@
+from src.application.exceptions.exceptions import CatalogVersionGoneException
+from src.domain.entities.catalog_snapshot import CatalogSnapshot
+from src.domain.services.catalog_snapshot_store import CatalogSnapshotStore
+
+
+class GetCatalogDeltaUseCase:
+    def __init__(self, snapshot_store: CatalogSnapshotStore):
+        self.snapshot_store = snapshot_store
+
+    async def execute(self, snapshot: CatalogSnapshot, since: int) -> CatalogSnapshot:
+        """The delta from the snapshot of version since to snapshot"""
+        base = await self.snapshot_store.get(snapshot.selling_place, since)
+        if base is None:
+            raise CatalogVersionGoneException()
+        return await self.snapshot_store.get_delta(base, snapshot)
@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta
+
+from src.domain.entities.catalog_stats import CatalogStats
+from src.domain.repositories.catalog_stats_repository import CatalogStatsRepository
+
+
+class GetCatalogStatsUseCase:
+    def __init__(
+        self,
+        catalog_stats_repository: CatalogStatsRepository,
+        refresh_interval: timedelta,
+    ):
+        self.catalog_stats_repository = catalog_stats_repository
+        self.refresh_interval = refresh_interval
+
+    async def execute(self) -> CatalogStats:
+        stats = await self.catalog_stats_repository.get_stats()
+        # The background refresher keeps the summary fresh; only compute it
+        # inline when it was never built or the refresher fell far behind.
+        if stats and stats.computed_at > datetime.now() - 2 * self.refresh_interval:
+            return stats
+        return await self.catalog_stats_repository.refresh_stats(
+            max_age=self.refresh_interval
+        )
@@ -0,0 +1,15 @@
+from uuid import UUID
+from src.application.exceptions.exceptions import NoResultFoundException
+from src.domain.entities.job import Job
+from src.domain.repositories.job_repository import JobRepository
+
+
+class GetJobUseCase:
+    def __init__(self, job_repository: JobRepository):
+        self.job_repository = job_repository
+
+    async def execute(self, job_id: UUID) -> Job:
+        job = await self.job_repository.get_job(job_id)
+        if not job:
+            raise NoResultFoundException("Job not found")
+        return job
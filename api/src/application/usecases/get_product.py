@@ -2,14 +2,23 @@ from uuid import UUID
 from src.application.exceptions.exceptions import NoResultFoundException
 from src.domain.entities.product import Product
 from src.domain.repositories.product_repository import ProductRepository
+from src.utils.single_flight import SingleFlight
 
 
 class GetProductUseCase:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        single_flight: SingleFlight[Product | None],
+    ):
         self.product_repository = product_repository
+        self.single_flight = single_flight
 
     async def execute(self, product_id: UUID) -> Product:
-        product = await self.product_repository.get_product_by_id(product_id)
+        product = await self.single_flight.do(
+            f"get_product:{product_id}",
+            lambda: self.product_repository.get_product_by_id(product_id),
+        )
         if not product:
             raise NoResultFoundException("Product not found")
         return product
@@ -0,0 +1,46 @@
+import base64
+import binascii
+from uuid import UUID
+
+from src.application.exceptions.exceptions import NoResultFoundException
+from src.domain.entities.picture import ProductPicture, sniff_content_type
+from src.domain.repositories.product_repository import ProductRepository
+from src.domain.services.picture_storage import PictureStorage
+
+
+class GetProductPictureUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        picture_storage: PictureStorage,
+    ):
+        self.product_repository = product_repository
+        self.picture_storage = picture_storage
+
+    async def execute(self, product_id: UUID) -> ProductPicture:
+        product = await self.product_repository.get_product_by_id(product_id)
+        if not product:
+            raise NoResultFoundException("Product not found")
+
+        if product.picture:
+            # Pictures sent inside JSON payloads are kept as base64 text
+            try:
+                data = base64.b64decode(product.picture)
+            except binascii.Error:
+                raise NoResultFoundException("Picture not found")
+            return ProductPicture(
+                digest=product.picture_digest,
+                content_type=sniff_content_type(data) or "application/octet-stream",
+                data=data,
+            )
+
+        if product.picture_digest:
+            stored = await self.picture_storage.get(product.picture_digest)
+            if stored:
+                return ProductPicture(
+                    digest=stored.digest,
+                    content_type=stored.content_type,
+                    location=stored.location,
+                )
+
+        raise NoResultFoundException("Picture not found")
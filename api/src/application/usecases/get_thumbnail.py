@@ -0,0 +1,27 @@
+from src.application.exceptions.exceptions import NoResultFoundException
+from src.domain.entities.thumbnail import Thumbnail
+from src.domain.repositories.thumbnail_repository import ThumbnailRepository
+from src.utils.cache import LRUCache
+
+
+class GetThumbnailUseCase:
+    def __init__(
+        self,
+        thumbnail_repository: ThumbnailRepository,
+        cache: LRUCache[Thumbnail],
+    ):
+        self.thumbnail_repository = thumbnail_repository
+        self.cache = cache
+
+    async def execute(self, digest: str, size: int, image_format: str) -> Thumbnail:
+        key = (digest, size, image_format)
+        thumbnail = self.cache.get(key)
+        if thumbnail:
+            return thumbnail
+        thumbnail = await self.thumbnail_repository.get_thumbnail(
+            digest, size, image_format
+        )
+        if not thumbnail:
+            raise NoResultFoundException("Thumbnail not found")
+        self.cache.set(key, thumbnail, len(thumbnail.data))
+        return thumbnail
@@ -0,0 +1,10 @@
+from src.domain.entities.change_feed import ChangeFeed
+from src.domain.repositories.product_repository import ProductRepository
+
+
+class ListProductChangesUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, since: int, limit: int) -> ChangeFeed:
+        return await self.product_repository.list_changes(since=since, limit=limit)
@@ -1,21 +1,45 @@
 from src.domain.entities.pagination import Pagination
 from src.domain.entities.product import Product
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
 from src.domain.repositories.product_repository import ProductRepository
+from src.utils.single_flight import SingleFlight
 
 
 class ListProductsUseCase:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        single_flight: SingleFlight[Pagination[Product]],
+    ):
         self.product_repository = product_repository
+        self.single_flight = single_flight
 
     async def execute(
-        self, page: int, size: int, filter_name: str = None
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum = ProductSortEnum.INSERTED_AT,
     ) -> Pagination[Product]:
-        products = await self.product_repository.list_products(
-            page=page, size=size, filter_name=filter_name
+        key = (
+            f"list_products:{page}:{size}:{sort.value}:"
+            f"{filters.model_dump_json(exclude_none=True)}"
+        )
+        return await self.single_flight.do(
+            key, lambda: self._list(page, size, filters, sort)
         )
-        total_items = await self.product_repository.count_products(
-            filter_name=filter_name
+
+    async def _list(
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
+    ) -> Pagination[Product]:
+        products = await self.product_repository.list_products(
+            page=page, size=size, filters=filters, sort=sort
         )
+        total_items = await self.product_repository.count_products(filters=filters)
         return Pagination[Product](
             page=page, size=size, total=total_items, items=products
         )
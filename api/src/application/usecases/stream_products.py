@@ -0,0 +1,26 @@
+from collections.abc import AsyncIterator
+
+from src.domain.entities.product import Product
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.domain.repositories.product_repository import ProductRepository
+
+
+class StreamProductsUseCase:
+    def __init__(self, product_repository: ProductRepository, batch_size: int):
+        self.product_repository = product_repository
+        self.batch_size = batch_size
+
+    def execute(
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum = ProductSortEnum.INSERTED_AT,
+    ) -> AsyncIterator[list[Product]]:
+        return self.product_repository.stream_products(
+            offset=(page - 1) * size,
+            limit=size,
+            filters=filters,
+            sort=sort,
+            batch_size=self.batch_size,
+        )
@@ -0,0 +1,12 @@
+from uuid import UUID
+
+from src.domain.entities.product_suggestion import ProductSuggestion
+from src.utils.prefix_index import PrefixIndex
+
+
+class SuggestProductsUseCase:
+    def __init__(self, index: PrefixIndex[UUID, ProductSuggestion]):
+        self.index = index
+
+    async def execute(self, query: str, limit: int) -> list[ProductSuggestion]:
+        return self.index.search(query, limit)
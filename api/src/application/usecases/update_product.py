@@ -1,12 +1,29 @@
 from uuid import UUID
 from src.application.dtos.update_product import UpdateProductDTO
 from src.domain.repositories.product_repository import ProductRepository
+from src.domain.repositories.thumbnail_repository import ThumbnailRepository
+from src.domain.services.thumbnail_generator import ThumbnailGenerator
 
 
 class UpdateProductUseCase:
-    def __init__(self, product_repository: ProductRepository):
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        thumbnail_repository: ThumbnailRepository,
+        thumbnail_generator: ThumbnailGenerator,
+    ):
         self.product_repository = product_repository
+        self.thumbnail_repository = thumbnail_repository
+        self.thumbnail_generator = thumbnail_generator
 
     async def execute(self, product_id: UUID, dto: UpdateProductDTO) -> None:
         update_fields = dto.model_dump(exclude_unset=True, exclude={"id"})
+        if "picture" in update_fields:
+            update_fields["picture_digest"] = None
+            if update_fields["picture"]:
+                thumbnails = await self.thumbnail_generator.generate(
+                    update_fields["picture"]
+                )
+                await self.thumbnail_repository.save_thumbnails(thumbnails)
+                update_fields["picture_digest"] = thumbnails[0].digest
         await self.product_repository.update_product(product_id, update_fields)
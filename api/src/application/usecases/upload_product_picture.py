@@ -0,0 +1,44 @@
+from collections.abc import AsyncIterator
+from uuid import UUID
+
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import ProductRepository
+from src.domain.repositories.thumbnail_repository import ThumbnailRepository
+from src.domain.services.picture_storage import PictureStorage
+from src.domain.services.thumbnail_generator import ThumbnailGenerator
+
+
+class UploadProductPictureUseCase:
+    def __init__(
+        self,
+        product_repository: ProductRepository,
+        thumbnail_repository: ThumbnailRepository,
+        thumbnail_generator: ThumbnailGenerator,
+        picture_storage: PictureStorage,
+    ):
+        self.product_repository = product_repository
+        self.thumbnail_repository = thumbnail_repository
+        self.thumbnail_generator = thumbnail_generator
+        self.picture_storage = picture_storage
+
+    async def execute(
+        self, product_id: UUID, content_type: str, chunks: AsyncIterator[bytes]
+    ) -> Product:
+        # The upload and thumbnails run before the first query, so the
+        # session holds no connection while the client sends the body
+        stored = await self.picture_storage.save(chunks, content_type)
+        try:
+            thumbnails = await self.thumbnail_generator.generate_from_file(
+                stored.location
+            )
+            await self.product_repository.update_product(
+                product_id, {"picture": None, "picture_digest": stored.digest}
+            )
+            await self.thumbnail_repository.save_thumbnails(thumbnails)
+            return await self.product_repository.get_product_by_id(product_id)
+        except BaseException:
+            # The file was not there before this upload, so nothing else
+            # refers to it; the thumbnail rows roll back with the request
+            if stored.created:
+                await self.picture_storage.delete(stored.digest)
+            raise
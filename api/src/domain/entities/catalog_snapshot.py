@@ -0,0 +1,39 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.entities.product import Product, SellingPlaceEnum
+
+
+class CatalogSnapshot(BaseModel):
+    """A catalog file for offline devices.
+
+    A snapshot lists every product on sale as of version; a delta lists the
+    products changed and removed between since_version and version.
+    """
+
+    selling_place: SellingPlaceEnum | None
+    version: int
+    since_version: int | None = None
+    products: int
+    removed: int = 0
+    size: int
+    created_at: datetime
+    location: str
+
+
+class CatalogChanges(BaseModel):
+    """One page of the change feed, split by whether products stay listed"""
+
+    listed: list[Product]
+    removed: list[UUID]
+    version: int
+
+
+def in_snapshot(product: Product, selling_place: SellingPlaceEnum | None) -> bool:
+    return (
+        product.active
+        and product.archived_at is None
+        and selling_place in (None, product.selling_place)
+    )
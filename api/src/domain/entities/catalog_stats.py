@@ -0,0 +1,35 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from src.domain.entities.product import PriceType
+
+
+class PriceStats(BaseModel):
+    min: PriceType | None
+    max: PriceType | None
+    avg: PriceType | None
+    p50: PriceType | None
+    p90: PriceType | None
+    p99: PriceType | None
+
+
+class DailyCount(BaseModel):
+    day: date
+    count: int
+
+
+class CatalogStats(BaseModel):
+    computed_at: datetime
+    total: int
+    by_selling_place: dict[str, int]
+    by_active: dict[str, int]
+    price: PriceStats
+    added_per_day: list[DailyCount]
+
+
+def round_price(value: Decimal | float | None) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(Decimal("0.01"))
@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+from src.domain.entities.product import Product
+
+
+class ChangeFeed(BaseModel):
+    items: list[Product]
+    next_token: int
+    has_more: bool
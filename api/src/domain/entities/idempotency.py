@@ -0,0 +1,9 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class IdempotencyRecord(BaseModel):
+    key: str
+    request_hash: str
+    response: dict[str, Any] | None
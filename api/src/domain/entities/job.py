@@ -0,0 +1,61 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class JobKindEnum(Enum):
+    REFRESH_STATS = "refresh_stats"
+    BACKFILL_THUMBNAILS = "backfill_thumbnails"
+    PURGE_ARCHIVED = "purge_archived"
+
+
+class JobPayload(BaseModel):
+    """Arguments of a job's handler, checked when the job is enqueued."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RefreshStatsPayload(JobPayload):
+    pass
+
+
+class BackfillThumbnailsPayload(JobPayload):
+    batch_size: int = Field(100, ge=1, le=10_000)
+
+
+class PurgeArchivedPayload(JobPayload):
+    older_than_days: int = Field(30, ge=0)
+    batch_size: int = Field(1000, ge=1, le=100_000)
+
+
+JOB_PAYLOADS: dict[JobKindEnum, type[JobPayload]] = {
+    JobKindEnum.REFRESH_STATS: RefreshStatsPayload,
+    JobKindEnum.BACKFILL_THUMBNAILS: BackfillThumbnailsPayload,
+    JobKindEnum.PURGE_ARCHIVED: PurgeArchivedPayload,
+}
+
+
+class JobStatusEnum(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(BaseModel):
+    id: UUID
+    kind: JobKindEnum
+    payload: dict[str, Any]
+    status: JobStatusEnum
+    attempts: int
+    max_attempts: int
+    # Next time the job may be claimed; for a running job, its lease expiry
+    run_at: datetime
+    last_error: str | None = None
+    result: dict[str, Any] | None = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
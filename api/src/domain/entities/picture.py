@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+
+PICTURE_CONTENT_TYPES = (
+    "image/jpeg",
+    "image/png",
+    "image/gif",
+    "image/webp",
+    "image/avif",
+)
+
+
+class StoredPicture(BaseModel):
+    digest: str
+    size: int
+    content_type: str
+    location: str
+    # Whether this save wrote the file, rather than finding it already stored
+    created: bool = False
+
+
+class ProductPicture(BaseModel):
+    digest: str | None
+    content_type: str
+    data: bytes | None = None
+    location: str | None = None
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """Detect the image type from the leading bytes of a picture."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:12] in (b"ftypavif", b"ftypavis"):
+        return "image/avif"
+    return None
@@ -1,8 +1,21 @@
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
 from typing import Annotated
 from uuid import UUID
-from pydantic import BaseModel, BeforeValidator, Field
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    PlainSerializer,
+    computed_field,
+)
+
+from src.domain.entities.thumbnail import (
+    THUMBNAIL_FORMATS,
+    THUMBNAIL_SIZES,
+    thumbnail_url,
+)
 
 
 class SellingPlaceEnum(Enum):
@@ -23,14 +36,38 @@ EANType = Annotated[
     BeforeValidator(ean_validator),
 ]
 
+# Prices are exact decimals, but keep being plain numbers in JSON payloads.
+PriceType = Annotated[
+    Decimal,
+    Field(max_digits=10, decimal_places=2),
+    PlainSerializer(float, return_type=float, when_used="json"),
+]
+
 
 class Product(BaseModel):
     id: UUID | None
     name: str = Field(..., max_length=150)
     ean: EANType
     inserted_at: datetime | None = None
-    price: float
+    price: PriceType
     description: str = Field(..., max_length=250)
     active: bool
     selling_place: SellingPlaceEnum
     picture: bytes | None
+    picture_digest: str | None = None
+    updated_at: datetime | None = None
+    change_seq: int | None = None
+    archived_at: datetime | None = None
+
+    @computed_field
+    @property
+    def thumbnails(self) -> dict[int, dict[str, str]] | None:
+        if not self.picture_digest:
+            return None
+        return {
+            size: {
+                image_format: thumbnail_url(self.picture_digest, size, image_format)
+                for image_format in THUMBNAIL_FORMATS
+            }
+            for size in THUMBNAIL_SIZES
+        }
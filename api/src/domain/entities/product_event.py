@@ -0,0 +1,16 @@
+from enum import Enum
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ProductEventTypeEnum(Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    ARCHIVED = "archived"
+
+
+class ProductEvent(BaseModel):
+    type: ProductEventTypeEnum
+    product_id: UUID
+    change_seq: int
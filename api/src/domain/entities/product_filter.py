@@ -0,0 +1,27 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+
+from pydantic import BaseModel
+
+from src.domain.entities.product import SellingPlaceEnum
+
+
+class ProductSortEnum(Enum):
+    NAME = "name"
+    NAME_DESC = "-name"
+    PRICE = "price"
+    PRICE_DESC = "-price"
+    INSERTED_AT = "inserted_at"
+    INSERTED_AT_DESC = "-inserted_at"
+
+
+class ProductFilter(BaseModel):
+    name: str | None = None
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    active: bool | None = None
+    selling_place: SellingPlaceEnum | None = None
+    inserted_from: datetime | None = None
+    inserted_to: datetime | None = None
+    include_archived: bool = False
@@ -0,0 +1,9 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ProductSuggestion(BaseModel):
+    id: UUID
+    name: str
+    ean: str
@@ -0,0 +1,16 @@
+from pydantic import BaseModel
+
+THUMBNAIL_SIZES = (64, 256)
+THUMBNAIL_FORMATS = ("webp", "avif")
+
+
+class Thumbnail(BaseModel):
+    digest: str
+    size: int
+    format: str
+    content_type: str
+    data: bytes
+
+
+def thumbnail_url(digest: str, size: int, image_format: str) -> str:
+    return f"/api/v1/pictures/{digest}/{size}.{image_format}"
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+
+from src.domain.entities.catalog_stats import CatalogStats
+
+
+class CatalogStatsRepository(ABC):
+    @abstractmethod
+    async def get_stats(self) -> CatalogStats | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def refresh_stats(self, max_age: timedelta) -> CatalogStats:
+        """Recompute the stats unless they are younger than max_age."""
+        raise NotImplementedError
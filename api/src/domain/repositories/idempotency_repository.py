@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Any
+
+from src.domain.entities.idempotency import IdempotencyRecord
+
+
+class IdempotencyRepository(ABC):
+    @abstractmethod
+    async def claim(
+        self, key: str, request_hash: str, ttl: timedelta
+    ) -> IdempotencyRecord | None:
+        """Reserve key for the current transaction.
+
+        Returns None when the caller now holds the key and should perform
+        the request, or the record left by an earlier request with the same
+        key. Waits while another transaction holding the key is in progress.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_expired(self, batch_size: int) -> int:
+        raise NotImplementedError
@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from src.domain.entities.job import Job, JobKindEnum
+
+
+class JobRepository(ABC):
+    @abstractmethod
+    async def enqueue(
+        self, kind: JobKindEnum, payload: dict[str, Any], max_attempts: int
+    ) -> Job:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_job(self, job_id: UUID) -> Job | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim(self, lease: timedelta) -> Job | None:
+        """Take the next due job without waiting on jobs claimed by others.
+
+        The claimed job counts an attempt and is leased until now + lease;
+        if the worker dies, the job becomes claimable again once it expires.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def extend_lease(self, job_id: UUID, attempt: int, lease: timedelta) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(
+        self, job_id: UUID, attempt: int, result: dict[str, Any] | None
+    ) -> bool:
+        """Mark the job succeeded, unless the attempt lost its lease"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def fail(
+        self, job_id: UUID, attempt: int, error: str, retry_at: datetime | None
+    ) -> bool:
+        """Requeue the job at retry_at, or mark it failed when it is None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def purge_finished(self, before: datetime, batch_size: int) -> int:
+        raise NotImplementedError
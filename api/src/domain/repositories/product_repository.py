@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID
+from src.domain.entities.change_feed import ChangeFeed
 from src.domain.entities.product import Product
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
 
 
 class ProductRepository(ABC):
@@ -10,15 +13,30 @@ class ProductRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def count_products(self, filter_name: str | None) -> int:
+    async def count_products(self, filters: ProductFilter) -> int:
         raise NotImplementedError
 
     @abstractmethod
     async def list_products(
-        self, page: int, size: int, filter_name: str | None
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
     ) -> list[Product]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream_products(
+        self,
+        offset: int,
+        limit: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
+        batch_size: int,
+    ) -> AsyncIterator[list[Product]]:
+        raise NotImplementedError
+
     @abstractmethod
     async def create_product(self, product_data: Product) -> Product:
         raise NotImplementedError
@@ -28,3 +46,11 @@ class ProductRepository(ABC):
         self, product_id: UUID, update_fields: dict[str, Any]
     ) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def archive_product(self, product_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_changes(self, since: int, limit: int) -> ChangeFeed:
+        raise NotImplementedError
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.thumbnail import Thumbnail
+
+
+class ThumbnailRepository(ABC):
+    @abstractmethod
+    async def save_thumbnails(self, thumbnails: list[Thumbnail]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_thumbnail(
+        self, digest: str, size: int, image_format: str
+    ) -> Thumbnail | None:
+        raise NotImplementedError
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from src.domain.entities.catalog_snapshot import CatalogChanges, CatalogSnapshot
+from src.domain.entities.product import SellingPlaceEnum
+
+
+class CatalogSnapshotStore(ABC):
+    @abstractmethod
+    async def latest(
+        self, selling_place: SellingPlaceEnum | None
+    ) -> CatalogSnapshot | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(
+        self, selling_place: SellingPlaceEnum | None, version: int
+    ) -> CatalogSnapshot | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def write_snapshot(
+        self,
+        selling_place: SellingPlaceEnum | None,
+        base: CatalogSnapshot | None,
+        changes: AsyncIterator[CatalogChanges],
+    ) -> CatalogSnapshot:
+        """Write the snapshot of base, or of an empty catalog, with changes applied"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_delta(
+        self, base: CatalogSnapshot, snapshot: CatalogSnapshot
+    ) -> CatalogSnapshot:
+        """The delta turning base into snapshot, written on first use"""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def prune(
+        self, selling_place: SellingPlaceEnum | None, created_before: datetime
+    ) -> int:
+        """Delete older snapshots and their deltas, always keeping the latest"""
+        raise NotImplementedError
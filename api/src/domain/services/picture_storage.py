@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from src.domain.entities.picture import StoredPicture
+
+
+class PictureStorage(ABC):
+    @abstractmethod
+    async def save(
+        self, chunks: AsyncIterator[bytes], content_type: str
+    ) -> StoredPicture:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, digest: str) -> StoredPicture | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, digest: str) -> None:
+        raise NotImplementedError
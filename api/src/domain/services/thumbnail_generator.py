@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.thumbnail import Thumbnail
+
+
+class ThumbnailGenerator(ABC):
+    @abstractmethod
+    async def generate(self, picture: bytes) -> list[Thumbnail]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def generate_from_file(self, location: str) -> list[Thumbnail]:
+        raise NotImplementedError
@@ -1,49 +1,290 @@
+from datetime import timedelta
+from uuid import UUID
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import AsyncGenerator
 
+from src.application.usecases.archive_product import ArchiveProductUseCase
+from src.application.usecases.enqueue_job import EnqueueJobUseCase
+from src.application.usecases.generate_catalog_snapshot import (
+    GenerateCatalogSnapshotUseCase,
+)
+from src.application.usecases.get_catalog_delta import GetCatalogDeltaUseCase
+from src.application.usecases.get_catalog_stats import GetCatalogStatsUseCase
+from src.application.usecases.get_job import GetJobUseCase
 from src.application.usecases.get_product import GetProductUseCase
+from src.application.usecases.get_product_picture import GetProductPictureUseCase
+from src.application.usecases.get_thumbnail import GetThumbnailUseCase
+from src.application.usecases.list_product_changes import ListProductChangesUseCase
 from src.application.usecases.list_products import ListProductsUseCase
 from src.application.usecases.create_product import CreateProductUseCase
+from src.application.usecases.stream_products import StreamProductsUseCase
+from src.application.usecases.suggest_products import SuggestProductsUseCase
 from src.application.usecases.update_product import UpdateProductUseCase
+from src.application.usecases.upload_product_picture import (
+    UploadProductPictureUseCase,
+)
+from src.domain.entities.catalog_snapshot import CatalogSnapshot
+from src.domain.entities.pagination import Pagination
+from src.domain.entities.product import Product
+from src.domain.entities.product_suggestion import ProductSuggestion
+from src.domain.entities.thumbnail import Thumbnail
 from src.domain.repositories.product_repository import ProductRepository
-from src.infrastructure.database.connection import get_db
+from src.domain.services.picture_storage import PictureStorage
+from src.domain.services.thumbnail_generator import ThumbnailGenerator
+from src.infrastructure.api.sessions import get_db, get_read_db
+from src.infrastructure.config import settings
+from src.infrastructure.database.connection import (
+    bind_session,
+    current_bind_name,
+    set_statement_timeout,
+)
+from src.infrastructure.events.broker import ProductEventBroker
+from src.infrastructure.images.thumbnails import PillowThumbnailGenerator
+from src.infrastructure.repositories.catalog_stats_repository import (
+    SQLAlchemyCatalogStatsRepository,
+)
+from src.infrastructure.repositories.idempotency_repository import (
+    SQLAlchemyIdempotencyRepository,
+)
+from src.infrastructure.repositories.in_memory_product_repository import (
+    InMemoryProductRepository,
+)
+from src.infrastructure.repositories.job_repository import SQLAlchemyJobRepository
 from src.infrastructure.repositories.product_repository import (
     SQLAlchemyProductRepository,
 )
+from src.infrastructure.repositories.thumbnail_repository import (
+    SQLAlchemyThumbnailRepository,
+)
+from src.infrastructure.storage.catalog_snapshots import SQLiteCatalogSnapshotStore
+from src.infrastructure.storage.picture_storage import FilesystemPictureStorage
+from src.utils.cache import LRUCache
+from src.utils.loop_lag import LoopLagMonitor
+from src.utils.prefix_index import PrefixIndex
+from src.utils.single_flight import SingleFlight
+
+loop_lag_monitor = LoopLagMonitor(
+    interval=settings.loop_lag_interval_ms / 1000,
+    window=int(settings.loop_lag_window_seconds * 1000 / settings.loop_lag_interval_ms),
+    slow_callback=settings.loop_slow_callback_ms / 1000,
+)
+thumbnail_generator = PillowThumbnailGenerator()
+thumbnail_cache = LRUCache[Thumbnail](max_bytes=settings.thumbnail_cache_max_bytes)
+picture_storage = FilesystemPictureStorage(
+    base_path=settings.picture_storage_path,
+    max_bytes=settings.picture_max_bytes,
+)
+catalog_snapshot_store = SQLiteCatalogSnapshotStore(
+    base_path=settings.snapshot_storage_path
+)
+# Scoped by engine so a read pinned to the primary never joins a replica read
+get_product_flight = SingleFlight[Product | None](
+    max_tracked_keys=settings.single_flight_tracked_keys, scope=current_bind_name
+)
+list_products_flight = SingleFlight[Pagination[Product]](
+    max_tracked_keys=settings.single_flight_tracked_keys, scope=current_bind_name
+)
+# Not scoped: a request waiting on another's snapshot needs no session of its own
+catalog_snapshot_flight = SingleFlight[CatalogSnapshot](
+    max_tracked_keys=settings.single_flight_tracked_keys
+)
+suggest_index = PrefixIndex[UUID, ProductSuggestion](max_scan=settings.suggest_max_scan)
+product_event_broker = ProductEventBroker(
+    database_url=settings.database_url,
+    queue_size=settings.events_queue_size,
+)
+
+# Repositories and use cases hold no per-request state: repositories run on
+# the session bound by get_session, so a single instance serves every request.
+product_repository: ProductRepository = (
+    InMemoryProductRepository.from_ndjson(settings.catalog_path)
+    if settings.catalog_path
+    else SQLAlchemyProductRepository()
+)
+thumbnail_repository = SQLAlchemyThumbnailRepository()
+idempotency_repository = SQLAlchemyIdempotencyRepository()
+job_repository = SQLAlchemyJobRepository()
+catalog_stats_repository = SQLAlchemyCatalogStatsRepository(
+    daily_window_days=settings.stats_daily_window_days
+)
+
+list_products = ListProductsUseCase(product_repository, list_products_flight)
+stream_products = StreamProductsUseCase(
+    product_repository, batch_size=settings.list_stream_batch_size
+)
+list_product_changes = ListProductChangesUseCase(product_repository)
+suggest_products = SuggestProductsUseCase(suggest_index)
+generate_catalog_snapshot = GenerateCatalogSnapshotUseCase(
+    product_repository,
+    catalog_snapshot_store,
+    catalog_snapshot_flight,
+    batch_size=settings.snapshot_batch_size,
+    retention=timedelta(days=settings.snapshot_retention_days),
+)
+get_catalog_delta = GetCatalogDeltaUseCase(catalog_snapshot_store)
+create_product = CreateProductUseCase(
+    product_repository,
+    thumbnail_repository,
+    thumbnail_generator,
+    idempotency_repository,
+    idempotency_ttl=timedelta(seconds=settings.idempotency_ttl_seconds),
+)
+update_product = UpdateProductUseCase(
+    product_repository, thumbnail_repository, thumbnail_generator
+)
+archive_product = ArchiveProductUseCase(product_repository)
+get_product = GetProductUseCase(product_repository, get_product_flight)
+get_thumbnail = GetThumbnailUseCase(thumbnail_repository, thumbnail_cache)
+upload_product_picture = UploadProductPictureUseCase(
+    product_repository, thumbnail_repository, thumbnail_generator, picture_storage
+)
+get_product_picture = GetProductPictureUseCase(product_repository, picture_storage)
+enqueue_job = EnqueueJobUseCase(job_repository, settings.jobs_max_attempts)
+get_job = GetJobUseCase(job_repository)
+get_catalog_stats = GetCatalogStatsUseCase(
+    catalog_stats_repository,
+    refresh_interval=timedelta(seconds=settings.stats_refresh_interval_seconds),
+)
 
 
 async def get_session(
-    session: AsyncSession = Depends(get_db),
-) -> AsyncGenerator[AsyncSession, None]:
+    # Close the session when the endpoint returns rather than after the
+    # response is sent, so the connection is not held during the send.
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> AsyncSession:
+    bind_session(session)
     return session
 
 
-async def get_product_repository(
-    session: AsyncSession = Depends(get_session),
-) -> ProductRepository:
-    return SQLAlchemyProductRepository(session)
+async def get_read_session(
+    session: AsyncSession = Depends(get_read_db, scope="function"),
+) -> AsyncSession:
+    bind_session(session)
+    return session
+
+
+def limit_statements(session: AsyncSession, use_case: str) -> None:
+    set_statement_timeout(
+        session,
+        settings.statement_timeouts_ms.get(use_case, settings.statement_timeout_ms),
+    )
+
+
+async def get_thumbnail_generator() -> ThumbnailGenerator:
+    return thumbnail_generator
+
+
+async def get_picture_storage() -> PictureStorage:
+    return picture_storage
+
+
+async def get_product_event_broker() -> ProductEventBroker:
+    return product_event_broker
 
 
 async def list_products_usecase(
-    product_repository: ProductRepository = Depends(get_product_repository),
+    session: AsyncSession = Depends(get_read_session),
 ) -> ListProductsUseCase:
-    return ListProductsUseCase(product_repository)
+    limit_statements(session, "list_products")
+    return list_products
+
+
+async def stream_products_usecase(
+    session: AsyncSession = Depends(get_read_session),
+) -> StreamProductsUseCase:
+    # Runs under the timeout set for list_products in the same request
+    return stream_products
+
+
+async def list_product_changes_usecase(
+    session: AsyncSession = Depends(get_read_session),
+) -> ListProductChangesUseCase:
+    limit_statements(session, "list_product_changes")
+    return list_product_changes
+
+
+async def suggest_products_usecase() -> SuggestProductsUseCase:
+    # No session: suggestions come from the worker's index, not the database
+    return suggest_products
+
+
+async def generate_catalog_snapshot_usecase(
+    session: AsyncSession = Depends(get_read_session),
+) -> GenerateCatalogSnapshotUseCase:
+    limit_statements(session, "generate_catalog_snapshot")
+    return generate_catalog_snapshot
+
+
+async def get_catalog_delta_usecase() -> GetCatalogDeltaUseCase:
+    # No session: deltas are computed from two snapshot files
+    return get_catalog_delta
 
 
 async def create_product_usecase(
-    product_repository: ProductRepository = Depends(get_product_repository),
+    session: AsyncSession = Depends(get_session),
 ) -> CreateProductUseCase:
-    return CreateProductUseCase(product_repository)
+    limit_statements(session, "create_product")
+    return create_product
 
 
 async def update_product_usecase(
-    product_repository: ProductRepository = Depends(get_product_repository),
+    session: AsyncSession = Depends(get_session),
 ) -> UpdateProductUseCase:
-    return UpdateProductUseCase(product_repository)
+    limit_statements(session, "update_product")
+    return update_product
+
+
+async def archive_product_usecase(
+    session: AsyncSession = Depends(get_session),
+) -> ArchiveProductUseCase:
+    limit_statements(session, "archive_product")
+    return archive_product
 
 
 async def get_product_usecase(
-    product_repository: ProductRepository = Depends(get_product_repository),
+    session: AsyncSession = Depends(get_read_session),
 ) -> GetProductUseCase:
-    return GetProductUseCase(product_repository)
+    limit_statements(session, "get_product")
+    return get_product
+
+
+async def get_thumbnail_usecase(
+    session: AsyncSession = Depends(get_read_session),
+) -> GetThumbnailUseCase:
+    limit_statements(session, "get_thumbnail")
+    return get_thumbnail
+
+
+async def upload_product_picture_usecase(
+    session: AsyncSession = Depends(get_session),
+) -> UploadProductPictureUseCase:
+    limit_statements(session, "upload_product_picture")
+    return upload_product_picture
+
+
+async def get_product_picture_usecase(
+    session: AsyncSession = Depends(get_read_session),
+) -> GetProductPictureUseCase:
+    limit_statements(session, "get_product_picture")
+    return get_product_picture
+
+
+async def get_catalog_stats_usecase(
+    session: AsyncSession = Depends(get_session),
+) -> GetCatalogStatsUseCase:
+    limit_statements(session, "get_catalog_stats")
+    return get_catalog_stats
+
+
+async def enqueue_job_usecase(
+    session: AsyncSession = Depends(get_session),
+) -> EnqueueJobUseCase:
+    limit_statements(session, "enqueue_job")
+    return enqueue_job
+
+
+async def get_job_usecase(
+    session: AsyncSession = Depends(get_session),
+) -> GetJobUseCase:
+    limit_statements(session, "get_job")
+    return get_job
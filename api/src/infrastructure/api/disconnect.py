@@ -0,0 +1,70 @@
+import asyncio
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+WATCHED_METHODS = ("GET", "HEAD")
+
+
+class CancelOnDisconnectMiddleware:
+    """Cancels a read request's handler as soon as its client disconnects.
+
+    Cancelling the handler task interrupts the query it is awaiting: asyncpg
+    sends Postgres a cancel request, so an abandoned search stops running and
+    gives its pooled connection back. Only body-less methods are watched;
+    watching a request with a body would mean reading it ahead of the handler.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WATCHED_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        request_message = await receive()
+        if request_message["type"] == "http.disconnect":
+            return
+        # The request message read above, until the handler receives it
+        replayed: Message | None = request_message
+        disconnected = asyncio.Event()
+        response_complete = False
+
+        async def handler_receive() -> Message:
+            nonlocal replayed
+            if replayed is not None:
+                message, replayed = replayed, None
+                return message
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+
+        async def handler_send(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                response_complete = True
+            await send(message)
+
+        handler = asyncio.create_task(self.app(scope, handler_receive, handler_send))
+
+        async def watch_disconnect() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    break
+            disconnected.set()
+            # Servers also report a disconnect once the response is sent;
+            # cleanup after the response must still run
+            if not response_complete:
+                handler.cancel()
+
+        watcher = asyncio.create_task(watch_disconnect())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected.is_set() or response_complete:
+                raise
+        finally:
+            watcher.cancel()
+            handler.cancel()
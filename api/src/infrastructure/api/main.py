@@ -1,34 +1,59 @@
+import asyncio
+import math
 import time
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from src.application.exceptions.exceptions import (
-    NoResultFoundException,
-    DatabaseException,
+from src.application.exceptions.exceptions import ApplicationException
+from src.infrastructure.api.container import (
+    loop_lag_monitor,
+    product_event_broker,
+    product_repository,
+    suggest_index,
 )
+from src.infrastructure.api.disconnect import CancelOnDisconnectMiddleware
+from src.infrastructure.api.routes.changes import router as changes_router
+from src.infrastructure.api.routes.events import router as events_router
+from src.infrastructure.api.routes.jobs import router as jobs_router
+from src.infrastructure.api.routes.metrics import router as metrics_router
+from src.infrastructure.api.routes.picture import router as picture_router
 from src.infrastructure.api.routes.product import router as product_router
+from src.infrastructure.api.routes.snapshot import router as snapshot_router
+from src.infrastructure.api.routes.stats import router as stats_router
+from src.infrastructure.api.routes.suggest import router as suggest_router
+from src.infrastructure.config import settings
+from src.infrastructure.api.sessions import READ_PRIMARY_COOKIE
+from src.infrastructure.database import connection
+from src.infrastructure.rate_limit.limiter import RateLimiter
+from src.infrastructure.rate_limit.shedding import LoadShedder
+from src.infrastructure.rate_limit.store import (
+    InMemoryTokenBucketStore,
+    TokenBucketStore,
+)
+from src.infrastructure.executors.pools import shutdown_pools
+from src.infrastructure.tasks.idempotency_purger import run_idempotency_purger
+from src.infrastructure.tasks.replica_health import run_replica_health_checks
+from src.infrastructure.tasks.stats_refresher import run_stats_refresher
+from src.infrastructure.tasks.suggest_index_sync import (
+    run_suggest_index_sync,
+    sync_suggest_index,
+)
 from src.utils.logs import get_logger
 
 logger = get_logger(__name__)
 
 
 def additional_exception_handlers(app: FastAPI):
-    @app.exception_handler(NoResultFoundException)
-    async def no_result_found_exception_handler(
-        request: Request, exc: NoResultFoundException
+    @app.exception_handler(ApplicationException)
+    async def application_exception_handler(
+        request: Request, exc: ApplicationException
     ):
         return JSONResponse(
             status_code=exc.status_code,
             content={"detail": str(exc)},
         )
 
-    @app.exception_handler(DatabaseException)
-    async def database_exception_handler(request: Request, exc: DatabaseException):
-        return JSONResponse(
-            status_code=409,
-            content={"detail": str(exc)},
-        )
-
 
 def http_middleware(app: FastAPI):
     @app.middleware("http")
@@ -43,11 +68,105 @@ def http_middleware(app: FastAPI):
         return response
 
 
-def create_app() -> FastAPI:
+def read_your_writes_middleware(app: FastAPI):
+    @app.middleware("http")
+    async def pin_reads_after_write(request: Request, call_next):
+        response = await call_next(request)
+        if (
+            request.method not in ("GET", "HEAD", "OPTIONS")
+            and response.status_code < 400
+        ):
+            until = time.time() + settings.replica_sticky_seconds
+            response.set_cookie(
+                READ_PRIMARY_COOKIE,
+                f"{until:.3f}",
+                max_age=int(settings.replica_sticky_seconds) + 1,
+                httponly=True,
+                samesite="lax",
+            )
+        return response
+
+
+def rate_limit_middleware(app: FastAPI, store: TokenBucketStore):
+    limiter = RateLimiter(
+        store=store,
+        default=settings.rate_limit_default,
+        routes=settings.rate_limit_routes,
+        expensive=settings.rate_limit_expensive,
+        expensive_routes=settings.rate_limit_expensive_routes,
+        deep_page=settings.rate_limit_deep_page,
+        max_page_size=settings.list_max_page_size,
+    )
+    shedder = LoadShedder(
+        loop_lag=loop_lag_monitor,
+        engines=lambda: [
+            connection.replica_router.primary,
+            *connection.replica_router.replicas,
+        ],
+        max_loop_lag=settings.shed_max_loop_lag_ms / 1000,
+        max_pool_wait=settings.shed_max_pool_wait_ms / 1000,
+    )
+
+    @app.middleware("http")
+    async def limit_requests(request: Request, call_next):
+        if not request.url.path.startswith("/api/"):
+            return await call_next(request)
+
+        overloaded = shedder.overloaded()
+        if overloaded:
+            logger.warning(
+                f"Shedding {request.method} {request.url}: {overloaded} saturated"
+            )
+            return JSONResponse(
+                status_code=503,
+                content={"detail": "Service overloaded, retry later"},
+                headers={"Retry-After": str(settings.shed_retry_after_seconds)},
+            )
+
+        retry_after = await limiter.retry_after(request)
+        if retry_after:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        return await call_next(request)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background_tasks = [
+        asyncio.create_task(loop_lag_monitor.run()),
+        asyncio.create_task(run_idempotency_purger()),
+    ]
+    if settings.stats_refresher_enabled:
+        background_tasks.append(asyncio.create_task(run_stats_refresher()))
+    if settings.database_replica_urls:
+        background_tasks.append(asyncio.create_task(run_replica_health_checks()))
+    if settings.catalog_path:
+        # A read-only catalog never changes, so it is indexed once
+        await sync_suggest_index(suggest_index, product_repository, since=0)
+    else:
+        background_tasks.append(
+            asyncio.create_task(
+                run_suggest_index_sync(suggest_index, product_event_broker)
+            )
+        )
+    yield
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await product_event_broker.close()
+    shutdown_pools()
+
+
+def create_app(rate_limit_store: TokenBucketStore | None = None) -> FastAPI:
     app = FastAPI(
         title="Stoq API",
         description="API for Stoq e-commerce platform",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -58,13 +177,33 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Static /products/* paths must be registered before /products/{product_id}
+    app.include_router(stats_router, prefix="/api/v1")
+    app.include_router(suggest_router, prefix="/api/v1")
+    app.include_router(snapshot_router, prefix="/api/v1")
+    app.include_router(changes_router, prefix="/api/v1")
+    app.include_router(events_router, prefix="/api/v1")
     app.include_router(product_router, prefix="/api/v1")
+    app.include_router(picture_router, prefix="/api/v1")
+    app.include_router(metrics_router, prefix="/api/v1")
+    app.include_router(jobs_router, prefix="/api/v1")
 
     @app.get("/health")
     async def health_check():
-        return {"status": "ok"}
+        lag = loop_lag_monitor.percentiles()
+        if lag["p99"] > settings.health_max_loop_lag_p99_ms:
+            return JSONResponse(
+                status_code=503,
+                content={"status": "degraded", "loop_lag_ms": lag},
+            )
+        return {"status": "ok", "loop_lag_ms": lag}
 
+    app.add_middleware(CancelOnDisconnectMiddleware)
+    if settings.rate_limit_enabled:
+        rate_limit_middleware(app, rate_limit_store or InMemoryTokenBucketStore())
     http_middleware(app)
+    if settings.database_replica_urls:
+        read_your_writes_middleware(app)
     additional_exception_handlers(app)
 
     return app
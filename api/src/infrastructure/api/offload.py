@@ -0,0 +1,60 @@
+import json
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from src.domain.entities.pagination import Pagination
+from src.domain.entities.product import Product
+from src.infrastructure.executors.pools import offload
+
+
+def picture_bytes(products: Iterable[Product]) -> int:
+    """Pictures dominate the size of encoded products"""
+    return sum(len(product.picture or b"") for product in products)
+
+
+def dump_json(model: BaseModel) -> str:
+    return model.model_dump_json()
+
+
+def dump_ndjson(models: list[BaseModel]) -> str:
+    return "".join(model.model_dump_json() + "\n" for model in models)
+
+
+async def product_response(product: Product) -> Response:
+    """Encode a product, off the event loop when its picture is large"""
+    return Response(
+        content=await offload(dump_json, product, size=picture_bytes([product])),
+        media_type="application/json",
+    )
+
+
+async def page_response(page: Pagination[Product]) -> Response:
+    """Encode a page of products, off the event loop when it is large"""
+    return Response(
+        content=await offload(dump_json, page, size=picture_bytes(page.items)),
+        media_type="application/json",
+    )
+
+
+class OffloadingRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = await offload(json.loads, body, size=len(body))
+        return self._json
+
+
+class OffloadingRoute(APIRoute):
+    """Route that parses large JSON bodies off the event loop."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(OffloadingRequest(request.scope, request.receive))
+
+        return route_handler
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.application.usecases.list_product_changes import ListProductChangesUseCase
+from src.infrastructure.api.container import list_product_changes_usecase
+
+router = APIRouter()
+
+
+@router.get("/products/changes")
+async def list_product_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    list_product_changes_usecase: ListProductChangesUseCase = Depends(
+        list_product_changes_usecase
+    ),
+):
+    return await list_product_changes_usecase.execute(since=since, limit=limit)
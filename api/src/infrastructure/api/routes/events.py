@@ -0,0 +1,75 @@
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header
+from fastapi.responses import StreamingResponse
+
+from src.application.usecases.list_product_changes import ListProductChangesUseCase
+from src.infrastructure.api.container import (
+    get_product_event_broker,
+    list_product_changes_usecase,
+)
+from src.infrastructure.config import settings
+from src.infrastructure.events.broker import ProductEventBroker, Subscription
+
+router = APIRouter()
+
+
+async def product_event_stream(
+    broker: ProductEventBroker, subscription: Subscription, resync_from: int | None
+) -> AsyncIterator[str]:
+    try:
+        yield "retry: 3000\n\n"
+        if resync_from is not None:
+            # One event for all the changes missed while disconnected, so a
+            # reconnecting client reloads once instead of once per change
+            yield (
+                f"id: {resync_from}\n"
+                "event: product.resync\n"
+                f'data: {{"type": "resync", "change_seq": {resync_from}}}\n\n'
+            )
+        while True:
+            event = await subscription.get(timeout=settings.events_heartbeat_seconds)
+            if subscription.dropped:
+                # Closing lets the client reconnect, and its Last-Event-ID
+                # tells whether it missed changes in the meantime
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield (
+                f"id: {event.change_seq}\n"
+                f"event: product.{event.type.value}\n"
+                f"data: {event.model_dump_json()}\n\n"
+            )
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/products/events")
+async def stream_product_events(
+    last_event_id: int | None = Header(None),
+    broker: ProductEventBroker = Depends(get_product_event_broker),
+    list_product_changes_usecase: ListProductChangesUseCase = Depends(
+        list_product_changes_usecase
+    ),
+):
+    # Subscribed before reading the feed, so a change committed in between
+    # is either in the feed or pushed; the session is released on return,
+    # before the stream starts
+    subscription = await broker.subscribe()
+    resync_from = None
+    try:
+        if last_event_id is not None:
+            missed = await list_product_changes_usecase.execute(
+                since=last_event_id, limit=1
+            )
+            if missed.items:
+                resync_from = missed.next_token
+    except BaseException:
+        broker.unsubscribe(subscription)
+        raise
+    return StreamingResponse(
+        product_event_stream(broker, subscription, resync_from),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
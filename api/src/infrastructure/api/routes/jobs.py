@@ -0,0 +1,28 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, Response
+
+from src.application.dtos.enqueue_job import EnqueueJobDTO
+from src.application.usecases.enqueue_job import EnqueueJobUseCase
+from src.application.usecases.get_job import GetJobUseCase
+from src.infrastructure.api.container import enqueue_job_usecase, get_job_usecase
+
+router = APIRouter()
+
+
+@router.post("/jobs", status_code=202)
+async def enqueue_job(
+    dto: EnqueueJobDTO,
+    response: Response,
+    enqueue_job_usecase: EnqueueJobUseCase = Depends(enqueue_job_usecase),
+):
+    job = await enqueue_job_usecase.execute(dto)
+    response.headers["Location"] = f"/api/v1/jobs/{job.id}"
+    return job
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(
+    job_id: UUID,
+    get_job_usecase: GetJobUseCase = Depends(get_job_usecase),
+):
+    return await get_job_usecase.execute(job_id)
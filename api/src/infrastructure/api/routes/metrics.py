@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+
+from src.infrastructure.api.container import (
+    get_product_flight,
+    list_products_flight,
+    loop_lag_monitor,
+    suggest_index,
+)
+from src.infrastructure.executors.pools import pool_stats
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics():
+    return {
+        "single_flight": {
+            "get_product": get_product_flight.stats(),
+            "list_products": list_products_flight.stats(),
+        },
+        "event_loop": {
+            "lag_ms": loop_lag_monitor.percentiles(),
+            "slow_callbacks": loop_lag_monitor.slow_callback_count,
+            "recent_slow_callbacks": loop_lag_monitor.slow_callbacks(),
+        },
+        "executors": pool_stats(),
+        "suggest_index": {"entries": len(suggest_index)},
+    }
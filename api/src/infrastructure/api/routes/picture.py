@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Response
+
+from src.application.usecases.get_thumbnail import GetThumbnailUseCase
+from src.infrastructure.api.container import get_thumbnail_usecase
+
+router = APIRouter()
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/pictures/{digest}/{size}.{image_format}")
+async def get_thumbnail(
+    digest: str,
+    size: int,
+    image_format: str,
+    get_thumbnail_usecase: GetThumbnailUseCase = Depends(get_thumbnail_usecase),
+):
+    thumbnail = await get_thumbnail_usecase.execute(digest, size, image_format)
+    return Response(
+        content=thumbnail.data,
+        media_type=thumbnail.content_type,
+        headers={
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+            "ETag": f'"{digest}-{size}-{image_format}"',
+        },
+    )
@@ -1,20 +1,53 @@
+from datetime import datetime
+from decimal import Decimal
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from collections.abc import AsyncIterator
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 
+from src.application.exceptions.exceptions import PictureTooLargeException
+from src.application.usecases.archive_product import ArchiveProductUseCase
 from src.application.usecases.get_product import GetProductUseCase
+from src.application.usecases.get_product_picture import GetProductPictureUseCase
 from src.application.dtos.update_product import UpdateProductDTO
 from src.application.usecases.update_product import UpdateProductUseCase
 from src.application.dtos.create_product import CreateProductDTO
 from src.application.usecases.create_product import CreateProductUseCase
 from src.application.usecases.list_products import ListProductsUseCase
+from src.application.usecases.stream_products import StreamProductsUseCase
+from src.domain.entities.product import Product, SellingPlaceEnum
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.application.usecases.upload_product_picture import (
+    UploadProductPictureUseCase,
+)
 from src.infrastructure.api.container import (
+    archive_product_usecase,
     create_product_usecase,
     list_products_usecase,
     update_product_usecase,
     get_product_usecase,
+    get_product_picture_usecase,
+    stream_products_usecase,
+    upload_product_picture_usecase,
+)
+from src.infrastructure.api.offload import (
+    OffloadingRoute,
+    dump_ndjson,
+    page_response,
+    picture_bytes,
+    product_response,
 )
+from src.infrastructure.api.uploads import MultipartFileStream
+from src.infrastructure.config import settings
+from src.infrastructure.executors.pools import offload
+
+router = APIRouter(route_class=OffloadingRoute)
+
 
-router = APIRouter()
+async def ndjson_lines(batches: AsyncIterator[list[Product]]) -> AsyncIterator[str]:
+    # One chunk per cursor batch keeps memory bounded by the batch size
+    async for products in batches:
+        yield await offload(dump_ndjson, products, size=picture_bytes(products))
 
 
 @router.get("/products/{product_id}")
@@ -22,25 +55,60 @@ async def get_product(
     product_id: UUID,
     get_product_usecase: GetProductUseCase = Depends(get_product_usecase),
 ):
-    return await get_product_usecase.execute(product_id)
+    product = await get_product_usecase.execute(product_id)
+    return await product_response(product)
 
 
 @router.get("/products")
 async def list_products(
-    page: int = 1,
-    size: int = 20,
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1),
     name: str | None = None,
+    min_price: Decimal | None = None,
+    max_price: Decimal | None = None,
+    active: bool | None = None,
+    selling_place: SellingPlaceEnum | None = None,
+    inserted_from: datetime | None = None,
+    inserted_to: datetime | None = None,
+    include_archived: bool = False,
+    sort: ProductSortEnum = ProductSortEnum.INSERTED_AT,
     list_products_usecase: ListProductsUseCase = Depends(list_products_usecase),
+    stream_products_usecase: StreamProductsUseCase = Depends(stream_products_usecase),
 ):
-    return await list_products_usecase.execute(page=page, size=size, filter_name=name)
+    filters = ProductFilter(
+        name=name,
+        min_price=min_price,
+        max_price=max_price,
+        active=active,
+        selling_place=selling_place,
+        inserted_from=inserted_from,
+        inserted_to=inserted_to,
+        include_archived=include_archived,
+    )
+    if size > settings.list_max_page_size:
+        # Pages above the limit are streamed from a server-side cursor
+        # instead of being built into one response body
+        return StreamingResponse(
+            ndjson_lines(
+                stream_products_usecase.execute(
+                    page=page, size=size, filters=filters, sort=sort
+                )
+            ),
+            media_type="application/x-ndjson",
+        )
+    products = await list_products_usecase.execute(
+        page=page, size=size, filters=filters, sort=sort
+    )
+    return await page_response(products)
 
 
 @router.post("/products")
 async def create_product(
     dto: CreateProductDTO,
+    idempotency_key: str | None = Header(None, max_length=255),
     create_product_usecase: CreateProductUseCase = Depends(create_product_usecase),
 ):
-    return await create_product_usecase.execute(dto)
+    return await create_product_usecase.execute(dto, idempotency_key=idempotency_key)
 
 
 @router.put("/products/{product_id}")
@@ -50,3 +118,56 @@ async def update_product(
     update_product_usecase: UpdateProductUseCase = Depends(update_product_usecase),
 ):
     return await update_product_usecase.execute(product_id, update_data)
+
+
+@router.delete("/products/{product_id}", status_code=204)
+async def archive_product(
+    product_id: UUID,
+    archive_product_usecase: ArchiveProductUseCase = Depends(archive_product_usecase),
+):
+    await archive_product_usecase.execute(product_id)
+
+
+@router.put("/products/{product_id}/picture")
+async def upload_product_picture(
+    product_id: UUID,
+    request: Request,
+    upload_product_picture_usecase: UploadProductPictureUseCase = Depends(
+        upload_product_picture_usecase
+    ),
+):
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        upload = MultipartFileStream(request, field_name="picture")
+        content_type = await upload.read_headers()
+        chunks = upload.chunks()
+    else:
+        content_length = request.headers.get("content-length")
+        if content_length and not content_length.isdigit():
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if content_length and int(content_length) > settings.picture_max_bytes:
+            raise PictureTooLargeException(
+                f"Picture exceeds the limit of {settings.picture_max_bytes} bytes"
+            )
+        chunks = request.stream()
+    return await upload_product_picture_usecase.execute(
+        product_id, content_type, chunks
+    )
+
+
+@router.get("/products/{product_id}/picture")
+async def get_product_picture(
+    product_id: UUID,
+    get_product_picture_usecase: GetProductPictureUseCase = Depends(
+        get_product_picture_usecase
+    ),
+):
+    picture = await get_product_picture_usecase.execute(product_id)
+    headers = {"ETag": f'"{picture.digest}"'} if picture.digest else None
+    if picture.location:
+        return FileResponse(
+            picture.location, media_type=picture.content_type, headers=headers
+        )
+    return Response(
+        content=picture.data, media_type=picture.content_type, headers=headers
+    )
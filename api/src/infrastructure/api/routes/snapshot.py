@@ -0,0 +1,68 @@
+import os
+from datetime import timedelta
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import FileResponse
+
+from src.application.usecases.generate_catalog_snapshot import (
+    GenerateCatalogSnapshotUseCase,
+)
+from src.application.usecases.get_catalog_delta import GetCatalogDeltaUseCase
+from src.domain.entities.catalog_snapshot import CatalogSnapshot
+from src.domain.entities.product import SellingPlaceEnum
+from src.infrastructure.api.container import (
+    generate_catalog_snapshot_usecase,
+    get_catalog_delta_usecase,
+)
+from src.infrastructure.config import settings
+from src.infrastructure.storage.catalog_snapshots import MEDIA_TYPE
+
+router = APIRouter()
+
+CATALOG_VERSION_HEADER = "X-Catalog-Version"
+
+
+def catalog_file_response(catalog: CatalogSnapshot) -> FileResponse:
+    name = os.path.basename(catalog.location)
+    return FileResponse(
+        catalog.location,
+        media_type=MEDIA_TYPE,
+        filename=name,
+        headers={"ETag": f'"{name}"', CATALOG_VERSION_HEADER: str(catalog.version)},
+    )
+
+
+@router.get("/products/snapshot")
+async def get_catalog_snapshot(
+    selling_place: SellingPlaceEnum | None = Query(None),
+    generate_catalog_snapshot_usecase: GenerateCatalogSnapshotUseCase = Depends(
+        generate_catalog_snapshot_usecase
+    ),
+):
+    snapshot = await generate_catalog_snapshot_usecase.execute(
+        selling_place, max_age=timedelta(seconds=settings.snapshot_max_age_seconds)
+    )
+    return catalog_file_response(snapshot)
+
+
+@router.get("/products/snapshot/delta")
+async def get_catalog_delta(
+    since: int = Query(..., ge=0),
+    selling_place: SellingPlaceEnum | None = Query(None),
+    generate_catalog_snapshot_usecase: GenerateCatalogSnapshotUseCase = Depends(
+        generate_catalog_snapshot_usecase
+    ),
+    get_catalog_delta_usecase: GetCatalogDeltaUseCase = Depends(
+        get_catalog_delta_usecase
+    ),
+):
+    """Changes from the snapshot of version since to the latest one.
+
+    Answers 410 when that snapshot is no longer kept, in which case the
+    device downloads the whole snapshot again.
+    """
+    snapshot = await generate_catalog_snapshot_usecase.execute(
+        selling_place, max_age=timedelta(seconds=settings.snapshot_max_age_seconds)
+    )
+    delta = await get_catalog_delta_usecase.execute(snapshot, since)
+    return catalog_file_response(delta)
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+
+from src.application.usecases.get_catalog_stats import GetCatalogStatsUseCase
+from src.infrastructure.api.container import get_catalog_stats_usecase
+
+router = APIRouter()
+
+
+@router.get("/products/stats")
+async def get_catalog_stats(
+    get_catalog_stats_usecase: GetCatalogStatsUseCase = Depends(
+        get_catalog_stats_usecase
+    ),
+):
+    return await get_catalog_stats_usecase.execute()
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.application.usecases.suggest_products import SuggestProductsUseCase
+from src.infrastructure.api.container import suggest_products_usecase
+from src.infrastructure.config import settings
+
+router = APIRouter()
+
+
+@router.get("/products/suggest")
+async def suggest_products(
+    q: str = Query(..., min_length=1, max_length=150),
+    limit: int = Query(
+        settings.suggest_default_limit, ge=1, le=settings.suggest_max_limit
+    ),
+    suggest_products_usecase: SuggestProductsUseCase = Depends(
+        suggest_products_usecase
+    ),
+):
+    return await suggest_products_usecase.execute(q, limit)
@@ -0,0 +1,51 @@
+import time
+from typing import AsyncGenerator
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database import connection
+from src.infrastructure.database.connection import HAS_WRITES
+
+# Holds the time until which a client that just wrote reads from the primary
+READ_PRIMARY_COOKIE = "stoq_read_primary_until"
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a request session.
+
+    The session only checks out a connection when the first query runs, and
+    is committed only if the request wrote something, so read-only requests
+    release their connection without a COMMIT round trip.
+    """
+    async with connection.async_session_maker() as session:
+        try:
+            yield session
+            if session.info.get(HAS_WRITES):
+                await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Yield a session for read-only use cases.
+
+    It runs on a read replica unless the client wrote within the last
+    replica_sticky_seconds, in which case it reads from the primary so the
+    client sees its own writes.
+    """
+    try:
+        read_primary_until = float(request.cookies.get(READ_PRIMARY_COOKIE, 0))
+    except ValueError:
+        read_primary_until = 0
+    if read_primary_until > time.time():
+        bind = connection.replica_router.primary
+    else:
+        bind = connection.replica_router.read_engine()
+    async with connection.async_session_maker(bind=bind) as session:
+        try:
+            yield session
+        finally:
+            await session.close()
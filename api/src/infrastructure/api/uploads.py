@@ -0,0 +1,99 @@
+from collections import deque
+from collections.abc import AsyncIterator
+
+from fastapi import Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from src.application.exceptions.exceptions import InvalidPictureException
+
+
+class MultipartFileStream:
+    """Streams one file field out of a multipart/form-data request body.
+
+    The body is fed to the parser as it arrives, and only the data parsed
+    from the current network chunk is held in memory at any time.
+    """
+
+    def __init__(self, request: Request, field_name: str):
+        self.field_name = field_name
+        self.content_type: str | None = None
+        self._stream = request.stream().__aiter__()
+        self._pending: deque[bytes] = deque()
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._in_field = False
+        self._field_done = False
+
+        _, params = parse_options_header(request.headers.get("content-type", ""))
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise InvalidPictureException("Multipart boundary is missing")
+        self._parser = MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._on_part_begin,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+            },
+        )
+
+    async def read_headers(self) -> str:
+        """Consume the body up to the start of the file field's data."""
+        while self.content_type is None:
+            if not await self._feed():
+                raise InvalidPictureException(
+                    f"Multipart field '{self.field_name}' is missing"
+                )
+        return self.content_type
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        while True:
+            while self._pending:
+                yield self._pending.popleft()
+            if self._field_done or not await self._feed():
+                return
+
+    async def _feed(self) -> bool:
+        try:
+            chunk = await anext(self._stream)
+        except StopAsyncIteration:
+            return False
+        self._parser.write(chunk)
+        return True
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(
+            self._headers.get(b"content-disposition", b"")
+        )
+        name = options.get(b"name", b"").decode()
+        if name == self.field_name and self.content_type is None:
+            self._in_field = True
+            self.content_type = self._headers.get(b"content-type", b"").decode()
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_field:
+            self._pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_field:
+            self._in_field = False
+            self._field_done = True
@@ -0,0 +1,240 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import typer
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import defer
+
+from src.adapters.convert_db_model import convert_db_model_to_entity
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.database.partitioning import create_indexes, create_partitions
+from src.infrastructure.repositories.product_repository import (
+    SORT_COLUMNS,
+    SQLAlchemyProductRepository,
+)
+
+app = typer.Typer(help="Benchmark commands")
+
+
+async def measure(
+    fn: Callable[[], Awaitable[object]], iterations: int
+) -> tuple[float, float]:
+    """Return the mean CPU and wall time of fn in microseconds"""
+    for _ in range(min(iterations, 50)):
+        await fn()
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    cpu = (time.process_time() - cpu_start) / iterations * 1_000_000
+    wall = (time.perf_counter() - wall_start) / iterations * 1_000_000
+    return cpu, wall
+
+
+async def orm_get(session: AsyncSession, product_id):
+    session.expunge_all()
+    product = await session.get(ProductModel, product_id)
+    return convert_db_model_to_entity(product)
+
+
+async def orm_list(session: AsyncSession, size: int):
+    session.expunge_all()
+    result = await session.execute(
+        select(ProductModel)
+        .options(defer(ProductModel.picture, raiseload=True))
+        .order_by(*SORT_COLUMNS[ProductSortEnum.INSERTED_AT])
+        .limit(size)
+    )
+    return [
+        convert_db_model_to_entity(product, include_picture=False)
+        for product in result.scalars().all()
+    ]
+
+
+async def benchmark_queries(
+    iterations: int, size: int
+) -> list[tuple[str, float, float]]:
+    # Statement logging would dominate the numbers
+    connection.engine.echo = False
+    filters = ProductFilter()
+    async with connection.async_session_maker() as session:
+        repository = SQLAlchemyProductRepository(session)
+        product_id = (
+            await session.execute(select(ProductModel.id).limit(1))
+        ).scalar_one_or_none()
+        if product_id is None:
+            raise RuntimeError("No products to query, run `seed products` first")
+
+        cases = {
+            "get (ORM)": lambda: orm_get(session, product_id),
+            "get (fast path)": lambda: repository.get_product_by_id(product_id),
+            "list (ORM)": lambda: orm_list(session, size),
+            "list (fast path)": lambda: repository.list_products(
+                1, size, filters, ProductSortEnum.INSERTED_AT
+            ),
+            "count": lambda: repository.count_products(filters),
+        }
+        results = []
+        for label, fn in cases.items():
+            cpu, wall = await measure(fn, iterations)
+            results.append((label, cpu, wall))
+        return results
+
+
+async def timed(conn: AsyncConnection, *statements: str, **params) -> float:
+    """Run statements in order and return the elapsed wall time in milliseconds"""
+    start = time.perf_counter()
+    for statement in statements:
+        await conn.execute(text(statement), params)
+    return (time.perf_counter() - start) * 1000
+
+
+async def benchmark_layout(
+    conn: AsyncConnection, table: str, rows: int, partitions: int, lookups: int
+) -> dict[str, float]:
+    # Scratch copy of the products schema with its own change_seq values, so
+    # the benchmark never touches the real table or its sequence
+    if partitions:
+        await conn.execute(
+            text(f"CREATE TABLE {table} (LIKE products) PARTITION BY HASH (id)")
+        )
+        for statement in create_partitions(table, f"{table}_p", partitions):
+            await conn.execute(text(statement))
+    else:
+        await conn.execute(text(f"CREATE TABLE {table} (LIKE products)"))
+
+    results = {}
+    results["load"] = await timed(
+        conn,
+        f"""
+        INSERT INTO {table} (
+            id, name, ean, description, inserted_at, price, active,
+            selling_place, updated_at, change_seq
+        )
+        SELECT
+            gen_random_uuid(), 'product ' || g, lpad(g::text, 13, '0'),
+            'benchmark product', now() - g * interval '1 second',
+            (g % 100000) / 100.0, g % 2 = 0,
+            CASE WHEN g % 3 = 0 THEN 'EVENT' ELSE 'STORE' END::sellingplaceenum,
+            now(), g
+        FROM generate_series(1, :rows) AS g
+        """,
+        rows=rows,
+    )
+    results["index build"] = await timed(
+        conn,
+        f"ALTER TABLE {table} ADD PRIMARY KEY (id)",
+        *create_indexes(table, partitioned=bool(partitions)),
+    )
+    results["vacuum analyze"] = await timed(conn, f"VACUUM ANALYZE {table}")
+    results["reindex"] = await timed(conn, f"REINDEX TABLE {table}")
+    results["count(*)"] = await timed(
+        conn, f"SELECT count(*) FROM {table} WHERE archived_at IS NULL"
+    )
+
+    # Ids are random uuids, so the reads spread over every partition
+    ids = (
+        (await conn.execute(text(f"SELECT id FROM {table} LIMIT :n"), {"n": lookups}))
+        .scalars()
+        .all()
+    )
+    start = time.perf_counter()
+    for product_id in ids:
+        await conn.execute(
+            text(f"SELECT * FROM {table} WHERE id = :id AND archived_at IS NULL"),
+            {"id": product_id},
+        )
+    results["get by id (avg)"] = (time.perf_counter() - start) * 1000 / len(ids)
+    results["name filter"] = await timed(
+        conn,
+        f"""
+        SELECT * FROM {table}
+        WHERE archived_at IS NULL AND name ILIKE :name
+        ORDER BY inserted_at, id LIMIT 20
+        """,
+        name="%product 4242%",
+    )
+    return results
+
+
+async def benchmark_partitions(
+    rows: int, partitions: int, lookups: int
+) -> dict[str, dict[str, float]]:
+    connection.engine.echo = False
+    layouts = {"plain": 0, f"hash x{partitions}": partitions}
+    results = {}
+    # VACUUM cannot run inside a transaction block
+    async with connection.engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for index, (label, count) in enumerate(layouts.items()):
+            table = f"benchmark_products_{index}"
+            await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+            try:
+                results[label] = await benchmark_layout(
+                    conn, table, rows, count, lookups
+                )
+            finally:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+    return results
+
+
+@app.command()
+def queries(
+    iterations: int = typer.Option(
+        1000, "--iterations", help="Number of timed runs per query"
+    ),
+    size: int = typer.Option(20, "--size", help="Page size of list queries"),
+):
+    """Compare per-query CPU time of the ORM and fast read paths."""
+
+    async def run():
+        try:
+            results = await benchmark_queries(iterations, size)
+        except Exception as e:
+            typer.secho(f"✗ Benchmark failed: {e}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        finally:
+            await connection.engine.dispose()
+
+        typer.echo(f"{'query':<20}{'cpu µs':>12}{'wall µs':>12}")
+        for label, cpu, wall in results:
+            typer.echo(f"{label:<20}{cpu:>12.1f}{wall:>12.1f}")
+
+    asyncio.run(run())
+
+
+@app.command()
+def partitions(
+    rows: int = typer.Option(
+        1_000_000, "--rows", help="Number of products loaded per layout"
+    ),
+    partitions: int = typer.Option(
+        16, "--partitions", help="Number of hash partitions"
+    ),
+    lookups: int = typer.Option(
+        1000, "--lookups", help="Number of timed single-product reads"
+    ),
+):
+    """Compare maintenance and query time of plain and hash-partitioned products."""
+
+    async def run():
+        try:
+            results = await benchmark_partitions(rows, partitions, lookups)
+        except Exception as e:
+            typer.secho(f"✗ Benchmark failed: {e}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(code=1)
+        finally:
+            await connection.engine.dispose()
+
+        labels = list(results)
+        typer.echo(f"{'operation':<20}" + "".join(f"{label:>16}" for label in labels))
+        for operation in results[labels[0]]:
+            timings = "".join(
+                f"{results[label][operation]:>13.1f} ms" for label in labels
+            )
+            typer.echo(f"{operation:<20}{timings}")
+
+    asyncio.run(run())
@@ -0,0 +1,48 @@
+import typer
+
+from src.utils.import_time import profile_imports
+
+app = typer.Typer(help="Startup and runtime diagnostics")
+
+# Entry points worth watching; any other module path can be profiled too
+TARGETS = {
+    "api": "src.infrastructure.api.main",
+    "cli": "src.infrastructure.cli.main",
+}
+
+
+@app.command()
+def startup(
+    target: str = typer.Option(
+        "api", "--target", help="api, cli or the dotted path of any module"
+    ),
+    top: int = typer.Option(15, "--top", help="Number of slowest modules listed"),
+    budget_ms: float | None = typer.Option(
+        None, "--budget-ms", help="Exit with an error above this import time"
+    ),
+):
+    """Profile the import time of an entry point in a fresh interpreter."""
+    module = TARGETS.get(target, target)
+    try:
+        profile = profile_imports(module)
+    except RuntimeError as e:
+        typer.secho(f"✗ {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    typer.echo(f"Importing {module} took {profile.total_ms:.1f} ms\n")
+    typer.echo(f"{'package':<40}{'ms':>10}")
+    for package, ms in list(profile.by_package().items())[:top]:
+        typer.echo(f"{package:<40}{ms:>10.1f}")
+    typer.echo(f"\n{'module':<60}{'self ms':>10}{'cumul. ms':>12}")
+    for timing in profile.slowest(top):
+        typer.echo(
+            f"{timing.module:<60}{timing.self_ms:>10.1f}{timing.cumulative_ms:>12.1f}"
+        )
+
+    if budget_ms is not None and profile.total_ms > budget_ms:
+        typer.secho(
+            f"✗ {profile.total_ms:.1f} ms is over the budget of {budget_ms:.0f} ms",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(code=1)
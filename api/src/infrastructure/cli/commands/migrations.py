@@ -0,0 +1,83 @@
+import asyncio
+from argparse import Namespace
+
+import typer
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import MigrationProgressModel
+from src.infrastructure.database.online_migrations import retry_on_lock_timeout
+
+app = typer.Typer(help="Database migration commands")
+
+
+@app.command()
+def upgrade(
+    revision: str = typer.Argument("head", help="Revision to upgrade to"),
+    config: str = typer.Option("alembic.ini", "--config", help="Alembic config"),
+    lock_timeout_ms: int = typer.Option(
+        settings.migration_lock_timeout_ms,
+        "--lock-timeout-ms",
+        help="Longest wait of a DDL statement for a lock before it is retried",
+    ),
+    attempts: int = typer.Option(
+        settings.migration_lock_attempts,
+        "--attempts",
+        help="Attempts at a revision that keeps timing out on a lock",
+    ),
+):
+    """Apply migrations online, without queueing writes behind their locks.
+
+    Same as alembic -x online=true upgrade: each revision commits on its own,
+    and one that times out waiting for a lock is retried with backoff from
+    where the upgrade stopped.
+    """
+    alembic_config = Config(config)
+    alembic_config.cmd_opts = Namespace(
+        x=["online=true", f"lock_timeout_ms={lock_timeout_ms}"]
+    )
+    try:
+        retry_on_lock_timeout(
+            lambda: command.upgrade(alembic_config, revision),
+            f"Upgrade to {revision}",
+            attempts,
+        )
+    except DBAPIError as e:
+        typer.secho(f"✗ Error upgrading: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    typer.secho(f"✓ Upgraded to {revision}", fg=typer.colors.GREEN)
+
+
+@app.command()
+def status():
+    """Show the progress of batched backfills."""
+
+    async def run():
+        try:
+            async with connection.async_session_maker() as session:
+                query = select(MigrationProgressModel).order_by(
+                    MigrationProgressModel.updated_at
+                )
+                return list((await session.execute(query)).scalars())
+        finally:
+            await connection.engine.dispose()
+
+    backfills = asyncio.run(run())
+    if not backfills:
+        typer.echo("No backfills recorded")
+        return
+    typer.echo(f"{'backfill':<40}{'rows':>12}  {'updated at':<20}{'state'}")
+    for backfill in backfills:
+        state = (
+            "finished"
+            if backfill.finished_at
+            else f"unfinished, at {backfill.last_key or 'start'}"
+        )
+        typer.echo(
+            f"{backfill.name:<40}{backfill.rows:>12}  "
+            f"{backfill.updated_at:%Y-%m-%d %H:%M:%S}  {state}"
+        )
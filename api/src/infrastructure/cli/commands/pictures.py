@@ -0,0 +1,31 @@
+import asyncio
+import typer
+from src.infrastructure.executors.pools import shutdown_pools
+from src.infrastructure.tasks.thumbnail_backfill import backfill_thumbnails
+
+app = typer.Typer(help="Product picture commands")
+
+
+@app.command()
+def thumbnails(
+    batch_size: int = typer.Option(
+        100, "--batch-size", help="Number of products processed per transaction"
+    ),
+):
+    """Generate thumbnail renditions for existing product pictures."""
+
+    async def run():
+        try:
+            count = await backfill_thumbnails(batch_size)
+            typer.secho(
+                f"✓ Generated thumbnails for {count} products", fg=typer.colors.GREEN
+            )
+        except Exception as e:
+            typer.secho(
+                f"✗ Error generating thumbnails: {e}", fg=typer.colors.RED, err=True
+            )
+            raise typer.Exit(code=1)
+        finally:
+            shutdown_pools()
+
+    asyncio.run(run())
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import timedelta
+import typer
+from src.application.usecases.generate_catalog_snapshot import (
+    GenerateCatalogSnapshotUseCase,
+)
+from src.application.usecases.get_catalog_delta import GetCatalogDeltaUseCase
+from src.domain.entities.product import SellingPlaceEnum
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.executors.pools import shutdown_pools
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+from src.infrastructure.storage.catalog_snapshots import SQLiteCatalogSnapshotStore
+from src.infrastructure.tasks.archived_purger import purge_archived_products
+from src.utils.single_flight import SingleFlight
+
+app = typer.Typer(help="Product maintenance commands")
+
+
+@app.command("purge-archived")
+def purge_archived(
+    older_than_days: int = typer.Option(
+        30, "--older-than-days", help="Only purge products archived this long ago"
+    ),
+    batch_size: int = typer.Option(
+        1000, "--batch-size", help="Number of products deleted per transaction"
+    ),
+):
+    """Permanently delete products that were archived long enough ago."""
+
+    async def run():
+        try:
+            count = await purge_archived_products(
+                timedelta(days=older_than_days), batch_size
+            )
+            typer.secho(f"✓ Purged {count} archived products", fg=typer.colors.GREEN)
+        except Exception as e:
+            typer.secho(
+                f"✗ Error purging archived products: {e}", fg=typer.colors.RED, err=True
+            )
+            raise typer.Exit(code=1)
+
+    asyncio.run(run())
+
+
+@app.command()
+def snapshot(
+    selling_place: SellingPlaceEnum | None = typer.Option(
+        None, "--selling-place", help="Only products sold at this place"
+    ),
+    since: int | None = typer.Option(
+        None, "--since", help="Write the delta from this snapshot version instead"
+    ),
+):
+    """Write a snapshot of the catalog on sale for offline devices."""
+    store = SQLiteCatalogSnapshotStore(base_path=settings.snapshot_storage_path)
+
+    async def run():
+        try:
+            async with connection.async_session_maker() as session:
+                generate = GenerateCatalogSnapshotUseCase(
+                    SQLAlchemyProductRepository(session),
+                    store,
+                    SingleFlight(),
+                    batch_size=settings.snapshot_batch_size,
+                    retention=timedelta(days=settings.snapshot_retention_days),
+                )
+                catalog = await generate.execute(selling_place, max_age=timedelta(0))
+            if since is not None:
+                catalog = await GetCatalogDeltaUseCase(store).execute(catalog, since)
+            typer.secho(
+                f"✓ Wrote version {catalog.version} with {catalog.products} products"
+                f" and {catalog.removed} removed ({catalog.size} bytes) to "
+                f"{catalog.location}",
+                fg=typer.colors.GREEN,
+            )
+        except Exception as e:
+            typer.secho(
+                f"✗ Error writing catalog snapshot: {e}", fg=typer.colors.RED, err=True
+            )
+            raise typer.Exit(code=1)
+        finally:
+            await connection.engine.dispose()
+            shutdown_pools()
+
+    asyncio.run(run())
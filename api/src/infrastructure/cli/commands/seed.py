@@ -1,7 +1,7 @@
 import asyncio
 import typer
 from sqlalchemy import select
-from src.infrastructure.database.connection import async_session_maker
+from src.infrastructure.database import connection
 from src.infrastructure.database.models import ProductModel
 from src.domain.entities.product import SellingPlaceEnum
 from src.utils.logs import get_logger
@@ -12,7 +12,7 @@ app = typer.Typer(help="Database seeding commands")
 
 async def seed_products():
     """Seed the database with initial product data"""
-    async with async_session_maker() as session:
+    async with connection.async_session_maker() as session:
         # Check if data already exists
         result = await session.execute(select(ProductModel).limit(1))
         existing = result.scalar_one_or_none()
@@ -304,7 +304,7 @@ async def seed_products():
 
 async def clear_products():
     """Clear all products from the database"""
-    async with async_session_maker() as session:
+    async with connection.async_session_maker() as session:
         result = await session.execute(select(ProductModel))
         products = result.scalars().all()
         count = len(products)
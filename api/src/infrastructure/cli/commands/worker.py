@@ -0,0 +1,42 @@
+import asyncio
+from datetime import timedelta
+import typer
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.executors.pools import shutdown_pools
+from src.infrastructure.jobs.handlers import JOB_HANDLERS
+from src.infrastructure.jobs.worker import JobWorker
+
+
+def worker(
+    concurrency: int = typer.Option(
+        settings.jobs_worker_concurrency,
+        "--concurrency",
+        help="Number of jobs run at the same time",
+    ),
+):
+    """Run queued background jobs until interrupted."""
+    job_worker = JobWorker(
+        session_maker=connection.async_session_maker,
+        handlers=JOB_HANDLERS,
+        concurrency=concurrency,
+        poll_interval=settings.jobs_poll_interval_seconds,
+        lease=timedelta(seconds=settings.jobs_lease_seconds),
+        backoff_base=settings.jobs_backoff_base_seconds,
+        backoff_max=settings.jobs_backoff_max_seconds,
+        retention=timedelta(days=settings.jobs_retention_days),
+    )
+
+    async def run():
+        try:
+            await job_worker.run()
+        finally:
+            await connection.engine.dispose()
+            shutdown_pools()
+
+    typer.secho(f"Running jobs with concurrency {concurrency}", fg=typer.colors.GREEN)
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        # Interrupted jobs are picked up again once their lease expires
+        typer.secho("Worker stopped", fg=typer.colors.YELLOW)
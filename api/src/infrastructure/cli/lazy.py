@@ -0,0 +1,44 @@
+import importlib
+from typing import ClassVar
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class UnloadedCommand(click.Command):
+    """Stands in for a lazy subcommand in help and completion listings."""
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports a subcommand's module only to run it.
+
+    lazy_commands maps each subcommand name to the "module:attribute" of a
+    Typer app or command function, and to the help shown when listing, so
+    --help and every other command skip the imports (SQLAlchemy, FastAPI,
+    Pillow, the engine) of commands that are not run.
+    """
+
+    lazy_commands: ClassVar[dict[str, tuple[str, str]]] = {}
+
+    def __init__(self, **attrs):
+        super().__init__(**attrs)
+        for name, (_, help) in self.lazy_commands.items():
+            self.commands[name] = UnloadedCommand(name, help=help)
+
+    def resolve_command(self, ctx: click.Context, args: list[str]):
+        if args and isinstance(self.commands.get(args[0]), UnloadedCommand):
+            self.commands[args[0]] = self._load(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load(self, name: str) -> click.Command:
+        module_name, attribute = self.lazy_commands[name][0].split(":")
+        target = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            single = typer.Typer()
+            single.command(name=name)(target)
+            command = typer.main.get_command(single)
+        command.name = name
+        return command
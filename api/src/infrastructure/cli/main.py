@@ -1,12 +1,44 @@
+from typing import ClassVar
+
 import typer
-from src.infrastructure.cli.commands.seed import app as seed_app
+
+from src.infrastructure.cli.lazy import LazyTyperGroup
+
+COMMANDS = "src.infrastructure.cli.commands"
+
+
+class StoqCLI(LazyTyperGroup):
+    lazy_commands: ClassVar[dict[str, tuple[str, str]]] = {
+        "seed": (f"{COMMANDS}.seed:app", "Database seeding commands"),
+        "pictures": (f"{COMMANDS}.pictures:app", "Product picture commands"),
+        "products": (f"{COMMANDS}.products:app", "Product maintenance commands"),
+        "migrations": (
+            f"{COMMANDS}.migrations:app",
+            "Database migration commands",
+        ),
+        "benchmark": (f"{COMMANDS}.benchmark:app", "Benchmark commands"),
+        "worker": (
+            f"{COMMANDS}.worker:worker",
+            "Run queued background jobs until interrupted.",
+        ),
+        "diagnostics": (
+            f"{COMMANDS}.diagnostics:app",
+            "Startup and runtime diagnostics",
+        ),
+    }
+
 
 app = typer.Typer(
     name="stoq-cli",
     help="Stoq API CLI - Database management and utilities",
+    cls=StoqCLI,
 )
 
-app.add_typer(seed_app, name="seed")
+
+@app.callback()
+def main():
+    # Subcommands are all lazy, so the callback is what makes this a group
+    pass
 
 
 if __name__ == "__main__":
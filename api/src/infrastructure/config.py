@@ -1,11 +1,108 @@
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 __all__ = ["settings"]
 
 
+class RateLimitRule(BaseModel):
+    rate: float  # tokens refilled per second
+    burst: int
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
     database_url: str
+    database_replica_urls: list[str] = []
+    database_statement_cache_size: int = 100
+    database_query_cache_size: int = 500
+    database_pgbouncer: bool = False
+    replica_sticky_seconds: float = 5
+    replica_health_check_seconds: float = 10
+    executor_threads: int = 4
+    executor_processes: int = 2
+    # Smaller inputs are processed on the event loop
+    executor_offload_min_bytes: int = 256 * 1024
+    thumbnail_cache_max_bytes: int = 64 * 1024 * 1024
+    # Serve products read-only from this NDJSON export instead of the database
+    catalog_path: str | None = None
+    picture_storage_path: str = "storage/pictures"
+    # Offline catalog files for POS devices, refreshed on request at most
+    # every snapshot_max_age_seconds. Snapshots are kept snapshot_retention_days
+    # for deltas, which must stay below the age at which archived products are
+    # purged (30 days by default) for refreshes to see every removal
+    snapshot_storage_path: str = "storage/snapshots"
+    snapshot_max_age_seconds: int = 300
+    snapshot_retention_days: int = 7
+    snapshot_batch_size: int = 5000
+    picture_max_bytes: int = 5 * 1024 * 1024
+    stats_refresh_interval_seconds: int = 60
+    stats_daily_window_days: int = 90
+    stats_refresher_enabled: bool = True
+    events_queue_size: int = 100
+    events_heartbeat_seconds: float = 15
+    single_flight_tracked_keys: int = 1000
+    # Per use case, applied with SET LOCAL statement_timeout; streamed pages
+    # use the list_products limit for each cursor fetch
+    statement_timeout_ms: int = 5000
+    statement_timeouts_ms: dict[str, int] = {
+        "get_product": 500,
+        "get_thumbnail": 500,
+        "get_product_picture": 1000,
+        "list_products": 10_000,
+        "list_product_changes": 2000,
+        "generate_catalog_snapshot": 10_000,
+        "get_catalog_stats": 30_000,
+    }
+    # Larger pages are streamed as NDJSON in batches of list_stream_batch_size
+    list_max_page_size: int = 100
+    list_stream_batch_size: int = 500
+    # Each worker keeps a typeahead index of names and EANs for /products/suggest
+    suggest_default_limit: int = 10
+    suggest_max_limit: int = 50
+    suggest_max_scan: int = 1000
+    suggest_sync_batch_size: int = 5000
+    # Longest wait for a change made while the product event listener is down
+    suggest_sync_interval_seconds: float = 5
+    idempotency_ttl_seconds: int = 24 * 60 * 60
+    idempotency_purge_interval_seconds: int = 60 * 60
+    jobs_max_attempts: int = 5
+    jobs_worker_concurrency: int = 4
+    jobs_poll_interval_seconds: float = 1
+    jobs_lease_seconds: int = 60
+    jobs_backoff_base_seconds: float = 5
+    jobs_backoff_max_seconds: float = 10 * 60
+    jobs_retention_days: int = 7
+    # Online migrations (alembic -x online=true): DDL gives up on a lock after
+    # the timeout rather than queueing writes behind it, and is retried with
+    # a doubling backoff
+    migration_lock_timeout_ms: int = 2000
+    migration_lock_attempts: int = 10
+    migration_lock_backoff_seconds: float = 1
+    migration_lock_backoff_max_seconds: float = 30
+    migration_backfill_batch_size: int = 5000
+    migration_backfill_pause_seconds: float = 0.1
+    rate_limit_enabled: bool = True
+    rate_limit_default: RateLimitRule = RateLimitRule(rate=50, burst=100)
+    # Keyed by "METHOD /path/template"
+    rate_limit_routes: dict[str, RateLimitRule] = {
+        "POST /api/v1/products": RateLimitRule(rate=10, burst=50),
+        "PUT /api/v1/products/{product_id}": RateLimitRule(rate=10, burst=50),
+        "DELETE /api/v1/products/{product_id}": RateLimitRule(rate=10, burst=50),
+        "PUT /api/v1/products/{product_id}/picture": RateLimitRule(rate=2, burst=10),
+        "POST /api/v1/jobs": RateLimitRule(rate=1, burst=10),
+    }
+    # Separate budget for deep pages, name searches and expensive_routes
+    rate_limit_expensive: RateLimitRule = RateLimitRule(rate=2, burst=20)
+    rate_limit_expensive_routes: list[str] = []
+    rate_limit_deep_page: int = 50
+    loop_lag_interval_ms: float = 100
+    loop_lag_window_seconds: float = 60
+    loop_slow_callback_ms: float = 100
+    # /health reports not ready while the p99 loop lag is above this
+    health_max_loop_lag_p99_ms: float = 500
+    shed_max_loop_lag_ms: float = 250
+    shed_max_pool_wait_ms: float = 500
+    shed_retry_after_seconds: int = 1
 
 
 settings = Settings()
@@ -29,6 +29,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# Online mode (-x online=true), for migrating large tables while the API runs
+# (see src.infrastructure.database.online_migrations): each revision commits
+# on its own, so a rerun resumes after the last one applied, and DDL gives up
+# waiting for a lock after lock_timeout_ms rather than queueing writes behind
+options = context.get_x_argument(as_dictionary=True)
+online = options.get("online", "").lower() in ("1", "true", "yes")
+lock_timeout_ms = int(
+    options.get("lock_timeout_ms", settings.migration_lock_timeout_ms)
+)
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -53,14 +63,21 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=online,
     )
 
+    if online:
+        context.execute(f"SET lock_timeout = {lock_timeout_ms}")
     with context.begin_transaction():
         context.run_migrations()
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        transaction_per_migration=online,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
@@ -76,6 +93,11 @@ async def run_async_migrations() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=(
+            {"server_settings": {"lock_timeout": str(lock_timeout_ms)}}
+            if online
+            else {}
+        ),
     )
 
     async with connectable.connect() as connection:
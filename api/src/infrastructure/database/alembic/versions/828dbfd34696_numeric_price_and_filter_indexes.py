@@ -0,0 +1,56 @@
+"""numeric_price_and_filter_indexes
+
+Revision ID: 828dbfd34696
+Revises: 046c76a38153
+Create Date: 2026-10-19 15:21:04.118532
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "828dbfd34696"
+down_revision: Union[str, Sequence[str], None] = "046c76a38153"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "products",
+        "price",
+        existing_type=sa.Float(),
+        type_=sa.Numeric(10, 2),
+        existing_nullable=False,
+        postgresql_using="price::numeric(10, 2)",
+    )
+    op.create_index("ix_products_price", "products", ["price"], unique=False)
+    op.create_index(
+        "ix_products_inserted_at", "products", ["inserted_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_products_active_selling_place_price",
+        "products",
+        ["selling_place", "price"],
+        unique=False,
+        postgresql_where=sa.text("active = true"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_products_active_selling_place_price", table_name="products")
+    op.drop_index("ix_products_inserted_at", table_name="products")
+    op.drop_index("ix_products_price", table_name="products")
+    op.alter_column(
+        "products",
+        "price",
+        existing_type=sa.Numeric(10, 2),
+        type_=sa.Float(),
+        existing_nullable=False,
+        postgresql_using="price::double precision",
+    )
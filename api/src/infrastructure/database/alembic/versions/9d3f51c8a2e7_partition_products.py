@@ -0,0 +1,49 @@
+"""partition_products
+
+Revision ID: 9d3f51c8a2e7
+Revises: e41a7c9d2b56
+Create Date: 2026-10-19 17:04:21.730915
+
+Opt-in: the table is only partitioned when the number of hash partitions is
+given, e.g. ``alembic -x products_partitions=16 upgrade head``. Without it
+this revision is a no-op. To partition a database that already ran it,
+downgrade to e41a7c9d2b56 and upgrade again with the option.
+
+"""
+
+from typing import Sequence, Union
+from alembic import context, op
+import sqlalchemy as sa
+
+from src.infrastructure.database.partitioning import (
+    IS_PARTITIONED,
+    partition_products,
+    unpartition_products,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3f51c8a2e7"
+down_revision: Union[str, Sequence[str], None] = "e41a7c9d2b56"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    options = context.get_x_argument(as_dictionary=True)
+    partitions = int(options.get("products_partitions", 0))
+    if not partitions:
+        return
+    for statement in partition_products(partitions):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if context.is_offline_mode():
+        return
+    if not op.get_bind().execute(sa.text(IS_PARTITIONED)).scalar_one():
+        return
+    for statement in unpartition_products():
+        op.execute(statement)
@@ -0,0 +1,62 @@
+"""product_change_tracking
+
+Revision ID: b83d20d17709
+Revises: a6d3e0f3e2ba
+Create Date: 2026-10-19 15:44:12.907311
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b83d20d17709"
+down_revision: Union[str, Sequence[str], None] = "a6d3e0f3e2ba"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(sa.schema.CreateSequence(sa.Sequence("products_change_seq")))
+    op.add_column("products", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.add_column("products", sa.Column("change_seq", sa.BigInteger(), nullable=True))
+    # Existing rows enter the feed in insertion order
+    op.execute(
+        """
+        UPDATE products
+        SET updated_at = products.inserted_at, change_seq = ordered.seq
+        FROM (
+            SELECT id, row_number() OVER (ORDER BY inserted_at, id) AS seq
+            FROM products
+        ) AS ordered
+        WHERE products.id = ordered.id
+        """
+    )
+    op.execute(
+        """
+        SELECT setval(
+            'products_change_seq',
+            (SELECT COALESCE(max(change_seq), 0) + 1 FROM products),
+            false
+        )
+        """
+    )
+    op.alter_column("products", "updated_at", nullable=False)
+    op.alter_column(
+        "products",
+        "change_seq",
+        nullable=False,
+        server_default=sa.text("nextval('products_change_seq')"),
+    )
+    op.create_index("ix_products_change_seq", "products", ["change_seq"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_products_change_seq", table_name="products")
+    op.drop_column("products", "change_seq")
+    op.drop_column("products", "updated_at")
+    op.execute(sa.schema.DropSequence(sa.Sequence("products_change_seq")))
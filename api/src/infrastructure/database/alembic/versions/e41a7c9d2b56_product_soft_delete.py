@@ -0,0 +1,88 @@
+"""product_soft_delete
+
+Revision ID: e41a7c9d2b56
+Revises: 6cecf96061f0
+Create Date: 2026-10-19 16:12:44.518302
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e41a7c9d2b56"
+down_revision: Union[str, Sequence[str], None] = "6cecf96061f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("products", sa.Column("archived_at", sa.DateTime(), nullable=True))
+    # Listing indexes are rebuilt as partial indexes over live rows only
+    op.drop_index("ix_products_name", table_name="products")
+    op.drop_index("ix_products_price", table_name="products")
+    op.drop_index("ix_products_inserted_at", table_name="products")
+    op.drop_index("ix_products_active_selling_place_price", table_name="products")
+    op.create_index(
+        "ix_products_name",
+        "products",
+        ["name"],
+        unique=False,
+        postgresql_where=sa.text("archived_at IS NULL"),
+    )
+    op.create_index(
+        "ix_products_price",
+        "products",
+        ["price"],
+        unique=False,
+        postgresql_where=sa.text("archived_at IS NULL"),
+    )
+    op.create_index(
+        "ix_products_inserted_at",
+        "products",
+        ["inserted_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("archived_at IS NULL"),
+    )
+    op.create_index(
+        "ix_products_active_selling_place_price",
+        "products",
+        ["selling_place", "price"],
+        unique=False,
+        postgresql_where=sa.text("active = true AND archived_at IS NULL"),
+    )
+    op.create_index(
+        "ix_products_archived_at",
+        "products",
+        ["archived_at"],
+        unique=False,
+        postgresql_where=sa.text("archived_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_products_archived_at", table_name="products")
+    op.drop_index("ix_products_active_selling_place_price", table_name="products")
+    op.drop_index("ix_products_inserted_at", table_name="products")
+    op.drop_index("ix_products_price", table_name="products")
+    op.drop_index("ix_products_name", table_name="products")
+    # Archived rows are kept, hidden as inactive products, as the previous
+    # schema has no other way to tell them apart
+    op.execute("UPDATE products SET active = false WHERE archived_at IS NOT NULL")
+    op.drop_column("products", "archived_at")
+    op.create_index("ix_products_name", "products", ["name"], unique=False)
+    op.create_index("ix_products_price", "products", ["price"], unique=False)
+    op.create_index(
+        "ix_products_inserted_at", "products", ["inserted_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_products_active_selling_place_price",
+        "products",
+        ["selling_place", "price"],
+        unique=False,
+        postgresql_where=sa.text("active = true"),
+    )
@@ -0,0 +1,63 @@
+"""lock_free_change_feed
+
+Revision ID: f7c2a9e4b8d1
+Revises: c5a7e2d94f1b
+Create Date: 2026-10-19 19:21:05.113840
+
+"""
+
+from typing import Sequence, Union
+from alembic import op
+
+from src.infrastructure.database.change_feed import (
+    COUNTER_LIMIT,
+    CREATE_FUNCTIONS,
+    DROP_FUNCTIONS,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f7c2a9e4b8d1"
+down_revision: Union[str, Sequence[str], None] = "c5a7e2d94f1b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in CREATE_FUNCTIONS:
+        op.execute(statement)
+    # New numbers start at the current transaction id, so they must be above
+    # every number the sequence handed out for clients' tokens to stay valid
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF (SELECT max(change_seq) FROM products)
+                >= pg_current_xact_id()::text::bigint * {COUNTER_LIMIT}
+            THEN
+                RAISE EXCEPTION 'change_seq is ahead of transaction ids';
+            END IF;
+        END
+        $$
+        """
+    )
+    op.execute(
+        "ALTER TABLE products "
+        "ALTER COLUMN change_seq SET DEFAULT next_product_change_seq()"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The sequence carries on above the numbers given out in the meantime
+    op.execute(
+        "SELECT setval('products_change_seq', "
+        "(SELECT COALESCE(max(change_seq), 0) + 1 FROM products), false)"
+    )
+    op.execute(
+        "ALTER TABLE products "
+        "ALTER COLUMN change_seq SET DEFAULT nextval('products_change_seq')"
+    )
+    for statement in DROP_FUNCTIONS:
+        op.execute(statement)
@@ -0,0 +1,87 @@
+"""Ordering of the product change feed without a shared write lock.
+
+A product's change_seq holds the id of the transaction that wrote it in its
+high bits and a counter of that transaction's product writes in the low
+bits. Any transaction still able to commit has an id at or above the
+oldest one running, so every row below ``product_change_horizon()`` is
+final: nothing can still commit with a lower change_seq, and a reader
+that stops at the horizon never moves its token past a row yet to appear.
+
+Writers share nothing but the transaction id they already have. The cost
+is on the read side: the feed does not move past the oldest transaction
+running in the same database, until it ends, whether or not that
+transaction writes products. A transaction may take its id before its
+first product write, so only the database, not the products table, can
+tell which ones are safe to skip.
+
+The statements are plain SQL kept here, so the migration keeps producing
+the same functions as the models evolve.
+"""
+
+# Up to 2^24 product writes per transaction; the transaction id has the
+# remaining 39 bits, far beyond what a cluster ever assigns.
+COUNTER_BITS = 24
+COUNTER_LIMIT = 1 << COUNTER_BITS
+
+# The counter lives in a transaction-local setting, so it starts over in
+# every transaction and rolls back with a savepoint.
+NEXT_CHANGE_SEQ = f"""
+    CREATE OR REPLACE FUNCTION next_product_change_seq() RETURNS bigint
+    LANGUAGE plpgsql VOLATILE AS $$
+    DECLARE
+        counter bigint := coalesce(
+            nullif(current_setting('stoq.product_changes', true), ''), '0'
+        )::bigint;
+    BEGIN
+        IF counter >= {COUNTER_LIMIT} THEN
+            RAISE EXCEPTION 'More than {COUNTER_LIMIT} product changes in a transaction';
+        END IF;
+        PERFORM set_config('stoq.product_changes', (counter + 1)::text, true);
+        RETURN pg_current_xact_id()::text::bigint * {COUNTER_LIMIT} + counter;
+    END
+    $$
+"""
+
+# The oldest transaction that may still commit into this database, leaving
+# out the caller's own so it sees its writes. The snapshot lists running ids
+# below its xmax only; a writer's own id is often xmax itself, and then the
+# horizon is the id after it. Transactions other backends run in another
+# database never write products and are skipped, so they do not hold the
+# feed back. A transaction whose backend is not visible counts as running.
+CHANGE_HORIZON = f"""
+    CREATE OR REPLACE FUNCTION product_change_horizon() RETURNS bigint
+    LANGUAGE sql STABLE AS $$
+        WITH snapshot AS (
+            SELECT
+                pg_current_snapshot() AS snapshot,
+                pg_current_xact_id_if_assigned() AS own
+        )
+        SELECT {COUNTER_LIMIT} * least(
+            (
+                SELECT min(running::text::bigint)
+                FROM pg_snapshot_xip(snapshot) AS running
+                WHERE running IS DISTINCT FROM own
+                AND NOT EXISTS (
+                    SELECT FROM pg_stat_activity
+                    WHERE backend_xid = running::xid
+                    AND datid <> (
+                        SELECT oid FROM pg_database
+                        WHERE datname = current_database()
+                    )
+                )
+            ),
+            CASE
+                WHEN pg_snapshot_xmax(snapshot) = own
+                THEN own::text::bigint + 1
+                ELSE pg_snapshot_xmax(snapshot)::text::bigint
+            END
+        )
+        FROM snapshot
+    $$
+"""
+
+CREATE_FUNCTIONS = (NEXT_CHANGE_SEQ, CHANGE_HORIZON)
+DROP_FUNCTIONS = (
+    "DROP FUNCTION IF EXISTS product_change_horizon()",
+    "DROP FUNCTION IF EXISTS next_product_change_seq()",
+)
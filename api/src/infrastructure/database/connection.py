@@ -1,29 +1,156 @@
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+import uuid
+from contextvars import ContextVar
+from functools import cache
+from typing import Any
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.functions import Function
 
 from src.infrastructure.config import settings
+from src.infrastructure.database.pool import TimedAsyncAdaptedQueuePool
+from src.infrastructure.database.replicas import ReplicaRouter
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=True,
-)
-async_session_maker = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
-)
+
+def engine_options() -> dict[str, Any]:
+    """Statement caching options shared by the primary and replica engines."""
+    if settings.database_pgbouncer:
+        # In transaction mode consecutive statements may run on different
+        # server connections, so prepared statements get unique names and
+        # are never reused.
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    else:
+        connect_args = {
+            "prepared_statement_cache_size": settings.database_statement_cache_size
+        }
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool,
+        "query_cache_size": settings.database_query_cache_size,
+        "connect_args": connect_args,
+    }
+
+
+@cache
+def _engine() -> AsyncEngine:
+    return create_async_engine(
+        settings.database_url,
+        echo=True,
+        **engine_options(),
+    )
+
+
+@cache
+def _session_maker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(_engine(), class_=AsyncSession, expire_on_commit=False)
+
+
+@cache
+def _replica_router() -> ReplicaRouter:
+    return ReplicaRouter(
+        primary=_engine(),
+        replicas=[
+            create_async_engine(url, echo=True, pool_pre_ping=True, **engine_options())
+            for url in settings.database_replica_urls
+        ],
+        retry_seconds=settings.replica_health_check_seconds,
+    )
+
+
+LAZY_ATTRIBUTES = {
+    "engine": _engine,
+    "async_session_maker": _session_maker,
+    "replica_router": _replica_router,
+}
+
+
+def __getattr__(name: str) -> Any:
+    # The engines, and the asyncpg driver they load, are built on first use,
+    # so importing the models, the migrations or the CLI does not pay for them
+    if name in LAZY_ATTRIBUTES:
+        return LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+HAS_WRITES = "has_writes"
+# Functions whose effect is lost unless the transaction commits, even when
+# they run in a SELECT
+WRITE_FUNCTIONS = frozenset({"pg_notify", "nextval", "setval"})
+STATEMENT_TIMEOUT = "statement_timeout_ms"
+
+_request_session: ContextVar[AsyncSession] = ContextVar("request_session")
 
 
 class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+@event.listens_for(Session, "after_flush")
+def _mark_flush_as_write(session: Session, flush_context) -> None:
+    session.info[HAS_WRITES] = True
+
+
+def _calls_write_function(state: ORMExecuteState) -> bool:
+    return any(
+        isinstance(element, Function) and element.name in WRITE_FUNCTIONS
+        for column in state.statement.selected_columns
+        for element in visitors.iterate(column)
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement_as_write(state: ORMExecuteState) -> None:
+    # Anything but a SELECT counts as a write, text() included, as its SQL
+    # is not looked into; a read-only request should only SELECT
+    if not state.is_select or _calls_write_function(state):
+        state.session.info[HAS_WRITES] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session: Session) -> None:
+    session.info.pop(HAS_WRITES, None)
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_statement_timeout(session: Session, transaction, connection) -> None:
+    timeout_ms = session.info.get(STATEMENT_TIMEOUT)
+    if timeout_ms:
+        # SET LOCAL ends with the transaction, so the pooled connection
+        # goes back with the server default
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+
+def set_statement_timeout(session: AsyncSession, timeout_ms: int) -> None:
+    """Limit each statement the session runs from its next transaction on."""
+    session.info[STATEMENT_TIMEOUT] = timeout_ms
+
+
+def bind_session(session: AsyncSession) -> None:
+    """Make session the one used by repositories in the current request."""
+    _request_session.set(session)
+
+
+def current_session() -> AsyncSession:
+    try:
+        return _request_session.get()
+    except LookupError:
+        raise RuntimeError("No database session is bound to the current request")
+
+
+def current_bind_name() -> str:
+    """Name the engine behind the current request's session."""
+    bind = current_session().get_bind()
+    # A session may be bound to a connection, as in tests, rather than to
+    # its engine
+    engine = bind if isinstance(bind, Engine) else bind.engine
+    return str(engine.url)
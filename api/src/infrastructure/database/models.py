@@ -1,17 +1,68 @@
 from datetime import datetime
+from decimal import Decimal
 import uuid
 
-from sqlalchemy import UUID, Boolean, DateTime, Enum, Float, String, LargeBinary
+from sqlalchemy import (
+    DDL,
+    UUID,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    LargeBinary,
+    Numeric,
+    Sequence,
+    String,
+    Text,
+    event,
+    func,
+    text,
+)
+from src.domain.entities.job import JobKindEnum, JobStatusEnum
 from src.domain.entities.product import SellingPlaceEnum
+from src.infrastructure.database.change_feed import CREATE_FUNCTIONS, DROP_FUNCTIONS
 from src.infrastructure.database.connection import Base
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 
+# Numbered change_seq before next_product_change_seq, and again after a
+# downgrade of the lock-free change feed
+change_seq_sequence = Sequence("products_change_seq", metadata=Base.metadata)
+LIVE_PRODUCTS = text("archived_at IS NULL")
+
+
 class ProductModel(Base):
     __tablename__ = "products"
+    __table_args__ = (
+        # Listing indexes only cover live rows, so archived products do not
+        # grow them; the change feed index covers every row.
+        Index("ix_products_name", "name", postgresql_where=LIVE_PRODUCTS),
+        Index("ix_products_price", "price", postgresql_where=LIVE_PRODUCTS),
+        Index(
+            "ix_products_inserted_at",
+            "inserted_at",
+            "id",
+            postgresql_where=LIVE_PRODUCTS,
+        ),
+        Index("ix_products_change_seq", "change_seq", unique=True),
+        Index(
+            "ix_products_active_selling_place_price",
+            "selling_place",
+            "price",
+            postgresql_where=text("active = true AND archived_at IS NULL"),
+        ),
+        Index(
+            "ix_products_archived_at",
+            "archived_at",
+            postgresql_where=text("archived_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(), primary_key=True, default=uuid.uuid4)
-    name: Mapped[str] = mapped_column(String(150), nullable=False, index=True)
+    name: Mapped[str] = mapped_column(String(150), nullable=False)
     ean: Mapped[str] = mapped_column(
         String(13),
         nullable=False,
@@ -20,9 +71,97 @@ class ProductModel(Base):
     inserted_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, nullable=False
     )
-    price: Mapped[float] = mapped_column(Float, nullable=False)
+    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     active: Mapped[bool] = mapped_column(Boolean, nullable=False)
     selling_place: Mapped[SellingPlaceEnum] = mapped_column(
         Enum(SellingPlaceEnum), nullable=False
     )
     picture: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    picture_digest: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, onupdate=datetime.now, nullable=False
+    )
+    # Ordered by writing transaction, see change_feed
+    change_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=func.next_product_change_seq(),
+        onupdate=func.next_product_change_seq(),
+        nullable=False,
+    )
+    archived_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+class ThumbnailModel(Base):
+    __tablename__ = "product_thumbnails"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    size: Mapped[int] = mapped_column(Integer, primary_key=True)
+    format: Mapped[str] = mapped_column(String(8), primary_key=True)
+    content_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+
+class CatalogStatsModel(Base):
+    __tablename__ = "catalog_stats"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+
+class IdempotencyKeyModel(Base):
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    response: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+
+class JobModel(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers only ever look for due jobs among the unfinished ones
+        Index(
+            "ix_jobs_pending_run_at",
+            "run_at",
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+        Index(
+            "ix_jobs_finished_at",
+            "finished_at",
+            postgresql_where=text("finished_at IS NOT NULL"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(), primary_key=True, default=uuid.uuid4)
+    kind: Mapped[JobKindEnum] = mapped_column(Enum(JobKindEnum), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    status: Mapped[JobStatusEnum] = mapped_column(Enum(JobStatusEnum), nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+# Position of each batched backfill of a migration, so an interrupted one
+# resumes after the last batch it committed
+class MigrationProgressModel(Base):
+    __tablename__ = "migration_progress"
+
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    last_key: Mapped[str | None] = mapped_column(Text, nullable=True)
+    rows: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
+for statement in CREATE_FUNCTIONS:
+    event.listen(ProductModel.__table__, "before_create", DDL(statement))
+for statement in DROP_FUNCTIONS:
+    event.listen(ProductModel.__table__, "after_drop", DDL(statement))
@@ -0,0 +1,380 @@
+"""Migration helpers for changing large tables without blocking writes.
+
+Alembic runs a revision in one transaction, so every lock its DDL takes is
+held until the revision commits: a plain ``op.create_index`` on products
+blocks writes for the whole build. These helpers run their statements
+outside of that transaction, in Alembic's autocommit block, and are meant
+for revisions applied in online mode (``alembic -x online=true upgrade
+head`` or ``stoq-cli migrations upgrade``), where each revision commits on
+its own and DDL waits at most ``migration_lock_timeout_ms`` for a lock.
+
+- ``create_index_concurrently`` builds an index while writes go on, one
+  partition at a time on a partitioned table, and rebuilds the invalid
+  index a failed or interrupted build leaves behind.
+- ``execute_with_lock_timeout`` runs a statement that holds an exclusive
+  lock only briefly, such as ``ADD COLUMN`` without a volatile default. It
+  gives up waiting for the lock after a short timeout and retries, rather
+  than queueing every write behind a long transaction while it waits.
+- ``backfill`` fills a new column in small keyset batches, each its own
+  transaction with a pause after it, and records its position in
+  ``migration_progress`` so that a rerun resumes after the last batch.
+
+A revision adding a column that the application then reads could be::
+
+    def upgrade() -> None:
+        execute_with_lock_timeout("ALTER TABLE products ADD COLUMN slug text")
+        backfill(
+            "c0ffee_products_slug", "products", "slug = lower(name)",
+            where="slug IS NULL",
+        )
+        create_index_concurrently("ix_products_slug", "products", ["slug"])
+"""
+
+import random
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import partial
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.exc import DBAPIError
+
+from src.infrastructure.config import settings
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+RELATION_KIND = "SELECT relkind::text FROM pg_class WHERE oid = to_regclass(:name)"
+PARTITIONS = """
+    SELECT inhrelid::regclass::text FROM pg_inherits
+    WHERE inhparent = to_regclass(:table)
+    ORDER BY 1
+"""
+INDEX_IS_VALID = "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+KEY_TYPE = """
+    SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+    WHERE attrelid = to_regclass(:table) AND attname = :key
+"""
+
+SELECT_PROGRESS = """
+    SELECT last_key, rows, finished_at FROM migration_progress WHERE name = :name
+"""
+# Updates the next batch and moves the progress in the same transaction, so
+# the recorded position never runs ahead of or behind the committed rows. No
+# row is returned once a batch comes up empty.
+BACKFILL_BATCH = """
+    WITH batch AS (
+        SELECT {key} FROM {table}
+        WHERE ({where}){after}
+        ORDER BY {key}
+        LIMIT :batch_size
+    ), updated AS (
+        UPDATE {table} SET {assignments}
+        WHERE {key} IN (SELECT {key} FROM batch)
+        RETURNING 1
+    )
+    INSERT INTO migration_progress (name, last_key, rows, updated_at)
+    SELECT
+        :name,
+        (SELECT {key} FROM batch ORDER BY {key} DESC LIMIT 1)::text,
+        (SELECT count(*) FROM updated),
+        LOCALTIMESTAMP
+    WHERE EXISTS (SELECT 1 FROM batch)
+    ON CONFLICT (name) DO UPDATE SET
+        last_key = EXCLUDED.last_key,
+        rows = migration_progress.rows + EXCLUDED.rows,
+        updated_at = EXCLUDED.updated_at
+    RETURNING last_key, rows
+"""
+FINISH_BACKFILL = """
+    INSERT INTO migration_progress (name, rows, updated_at, finished_at)
+    VALUES (:name, 0, LOCALTIMESTAMP, LOCALTIMESTAMP)
+    ON CONFLICT (name) DO UPDATE SET
+        updated_at = EXCLUDED.updated_at,
+        finished_at = EXCLUDED.finished_at
+"""
+
+
+def is_lock_timeout(error: Exception) -> bool:
+    return getattr(getattr(error, "orig", None), "sqlstate", None) == LOCK_NOT_AVAILABLE
+
+
+def lock_backoff(attempt: int) -> float:
+    delay = min(
+        settings.migration_lock_backoff_seconds * 2 ** (attempt - 1),
+        settings.migration_lock_backoff_max_seconds,
+    )
+    # Jitter keeps concurrent deploys from retrying in lockstep
+    return delay * random.uniform(0.5, 1)
+
+
+def retry_on_lock_timeout[T](
+    operation: Callable[[], T], description: str, attempts: int | None = None
+) -> T:
+    """Run operation, retrying with backoff while it times out on a lock"""
+    attempts = attempts or settings.migration_lock_attempts
+    for attempt in range(1, attempts):
+        try:
+            return operation()
+        except DBAPIError as e:
+            if not is_lock_timeout(e):
+                raise
+            delay = lock_backoff(attempt)
+            logger.warning(
+                f"{description} timed out waiting for a lock, "
+                f"retrying in {delay:.1f}s ({attempt}/{attempts})"
+            )
+            time.sleep(delay)
+    # The last attempt is not retried: its lock timeout reaches the caller
+    return operation()
+
+
+@contextmanager
+def lock_timeout(timeout_ms: int) -> Iterator[None]:
+    """SET lock_timeout for the statements inside, restoring it afterwards"""
+    if op.get_context().as_sql:
+        previous = None
+    else:
+        previous = op.get_bind().execute(sa.text("SHOW lock_timeout")).scalar_one()
+    op.execute(f"SET lock_timeout = {int(timeout_ms)}")
+    try:
+        yield
+    finally:
+        op.execute(
+            "RESET lock_timeout"
+            if previous is None
+            else f"SET lock_timeout = '{previous}'"
+        )
+
+
+def execute_with_lock_timeout(
+    statement: str, timeout_ms: int | None = None, attempts: int | None = None
+) -> None:
+    """Run statement in its own transaction, under a short lock_timeout.
+
+    A statement waiting for an exclusive lock blocks every query queued
+    behind it, so it gives up after timeout_ms and is retried with backoff.
+    """
+    with op.get_context().autocommit_block():
+        _execute_with_lock_timeout(statement, timeout_ms, attempts)
+
+
+def create_index_statement(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    where: str | None = None,
+    using: str | None = None,
+    concurrently: bool = False,
+    only: bool = False,
+) -> str:
+    return " ".join(
+        part
+        for part in (
+            "CREATE UNIQUE INDEX" if unique else "CREATE INDEX",
+            "CONCURRENTLY" if concurrently else "",
+            f"IF NOT EXISTS {index_name} ON",
+            "ONLY" if only else "",
+            table_name,
+            f"USING {using}" if using else "",
+            f"({', '.join(columns)})",
+            f"WHERE {where}" if where else "",
+        )
+        if part
+    )
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: Sequence[str],
+    unique: bool = False,
+    where: str | None = None,
+    using: str | None = None,
+) -> None:
+    """CREATE INDEX CONCURRENTLY, which lets writes go on during the build.
+
+    columns are column names or expressions, where the predicate of a
+    partial index and using its access method, such as gin. A partitioned
+    table cannot build concurrently, so the index is created on the parent
+    alone, built concurrently on each partition and attached to the parent,
+    which becomes valid with the last partition.
+
+    Lock waits are not limited while building: the build takes no lock that
+    blocks writes, but waits for the transactions running when it starts.
+    """
+    context = op.get_context()
+    index = partial(
+        create_index_statement,
+        columns=columns,
+        unique=unique,
+        where=where,
+        using=using,
+        concurrently=True,
+    )
+    with context.autocommit_block(), lock_timeout(0):
+        if context.as_sql or _relation_kind(table_name) != "p":
+            _build_concurrently(index_name, index(index_name, table_name))
+            return
+        # Creating the parent's index and attaching to it lock the parent,
+        # briefly, as writes to any partition do too
+        _execute_with_lock_timeout(
+            index(index_name, table_name, concurrently=False, only=True)
+        )
+        for partition in _partitions(table_name):
+            partition_index = (
+                index_name.replace(table_name, partition, 1)
+                if table_name in index_name
+                else f"{index_name}_{partition}"
+            )
+            _build_concurrently(partition_index, index(partition_index, partition))
+            _execute_with_lock_timeout(
+                f"ALTER INDEX {index_name} ATTACH PARTITION {partition_index}"
+            )
+
+
+def drop_index_concurrently(index_name: str) -> None:
+    """DROP INDEX CONCURRENTLY, which lets writes go on while it waits.
+
+    An index of a partitioned table cannot be dropped concurrently and is
+    dropped under a short lock_timeout instead.
+    """
+    context = op.get_context()
+    if not context.as_sql and _relation_kind(index_name) == "I":
+        execute_with_lock_timeout(f"DROP INDEX IF EXISTS {index_name}")
+        return
+    with context.autocommit_block(), lock_timeout(0):
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+
+
+def backfill(
+    name: str,
+    table_name: str,
+    assignments: str,
+    where: str = "true",
+    key: str = "id",
+    batch_size: int | None = None,
+    pause_seconds: float | None = None,
+) -> int:
+    """UPDATE table_name SET assignments in batches of the rows matching where.
+
+    Batches follow the order of key, the primary key, and each one is its
+    own transaction that also records the last key it updated under name in
+    migration_progress. A rerun after an interruption resumes after the last
+    committed batch, and one that finished is skipped, so name must be
+    unique, such as the revision id and column. Sleeping pause_seconds
+    between batches leaves room for other writes and for replicas to keep
+    up.
+
+    Rows are not revisited once the batches have passed their key, so the
+    application must already fill the column on writes. Returns the number
+    of rows this run updated.
+    """
+    context = op.get_context()
+    if context.as_sql:
+        raise RuntimeError(f"Backfill {name} needs a database and cannot run --sql")
+    batch_size = batch_size or settings.migration_backfill_batch_size
+    if pause_seconds is None:
+        pause_seconds = settings.migration_backfill_pause_seconds
+
+    with context.autocommit_block():
+        bind = op.get_bind()
+        progress = bind.execute(sa.text(SELECT_PROGRESS), {"name": name}).one_or_none()
+        if progress is not None and progress.finished_at is not None:
+            logger.info(f"Backfill {name} already finished")
+            return 0
+        last_key, done = (progress.last_key, progress.rows) if progress else (None, 0)
+        if last_key is not None:
+            logger.info(f"Resuming backfill {name} after {key} {last_key}")
+
+        key_type = bind.execute(
+            sa.text(KEY_TYPE), {"table": table_name, "key": key}
+        ).scalar_one()
+        first_batch, next_batch = (
+            sa.text(
+                BACKFILL_BATCH.format(
+                    table=table_name,
+                    assignments=assignments,
+                    where=where,
+                    key=key,
+                    # Two statements rather than a NULL check on the key, so
+                    # the plan of each seeks straight to where it starts
+                    after=f" AND {key} > CAST(:last_key AS {key_type})"
+                    if after
+                    else "",
+                )
+            )
+            for after in (False, True)
+        )
+
+        updated = 0
+        started = time.monotonic()
+        while True:
+            run_batch = partial(
+                bind.execute,
+                first_batch if last_key is None else next_batch,
+                {"name": name, "last_key": last_key, "batch_size": batch_size},
+            )
+            row = retry_on_lock_timeout(run_batch, f"Backfill {name}").one_or_none()
+            if row is None:
+                break
+            updated += row.rows - done
+            last_key, done = row.last_key, row.rows
+            rate = updated / max(time.monotonic() - started, 0.001)
+            logger.info(
+                f"Backfill {name}: {done} rows done, {rate:.0f} rows/s, "
+                f"last {key} {last_key}"
+            )
+            time.sleep(pause_seconds)
+
+        bind.execute(sa.text(FINISH_BACKFILL), {"name": name})
+        logger.info(f"Backfill {name} finished, {updated} rows updated by this run")
+    return updated
+
+
+def reset_backfill(name: str) -> None:
+    """Forget the progress of a backfill, for the downgrade of its revision"""
+    op.execute(
+        sa.text("DELETE FROM migration_progress WHERE name = :name").bindparams(
+            name=name
+        )
+    )
+
+
+def _execute_with_lock_timeout(
+    statement: str, timeout_ms: int | None = None, attempts: int | None = None
+) -> None:
+    if timeout_ms is None:
+        timeout_ms = settings.migration_lock_timeout_ms
+    with lock_timeout(timeout_ms):
+        if op.get_context().as_sql:
+            op.execute(statement)
+        else:
+            retry_on_lock_timeout(partial(op.execute, statement), statement, attempts)
+
+
+def _build_concurrently(index_name: str, statement: str) -> None:
+    # A failed or interrupted build leaves an invalid index behind, which
+    # IF NOT EXISTS would keep, so it is dropped and built again
+    if not op.get_context().as_sql and _index_is_valid(index_name) is False:
+        logger.warning(f"Rebuilding invalid index {index_name}")
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+    op.execute(statement)
+
+
+def _relation_kind(name: str) -> str | None:
+    return op.get_bind().execute(sa.text(RELATION_KIND), {"name": name}).scalar()
+
+
+def _index_is_valid(name: str) -> bool | None:
+    return op.get_bind().execute(sa.text(INDEX_IS_VALID), {"name": name}).scalar()
+
+
+def _partitions(table_name: str) -> list[str]:
+    return list(
+        op.get_bind().execute(sa.text(PARTITIONS), {"table": table_name}).scalars()
+    )
@@ -0,0 +1,86 @@
+"""Hash partitioning of the products table.
+
+The conversion is opt-in (see the ``partition_products`` migration) and
+rewrites the table, so it runs under an exclusive lock for the duration of
+the copy. Partitioning is by hash of ``id``: the primary key stays ``(id)``,
+single-product reads prune to one partition, and every partition can be
+vacuumed and reindexed on its own. Filters on other columns, such as name,
+cannot prune and scan each partition's local index instead.
+
+The statements are plain SQL kept here, rather than derived from the models,
+so the migration keeps producing the same schema as the models evolve.
+"""
+
+# Unique indexes on a partitioned table must contain the partition key, so
+# change_seq loses its unique flag there; next_product_change_seq still keeps
+# it unique.
+PRODUCT_INDEXES = (
+    "CREATE INDEX ix_{table}_name ON {table} (name) WHERE archived_at IS NULL",
+    "CREATE INDEX ix_{table}_price ON {table} (price) WHERE archived_at IS NULL",
+    """
+    CREATE INDEX ix_{table}_inserted_at ON {table} (inserted_at, id)
+    WHERE archived_at IS NULL
+    """,
+    "CREATE {unique}INDEX ix_{table}_change_seq ON {table} (change_seq)",
+    """
+    CREATE INDEX ix_{table}_active_selling_place_price
+    ON {table} (selling_place, price)
+    WHERE active = true AND archived_at IS NULL
+    """,
+    """
+    CREATE INDEX ix_{table}_archived_at ON {table} (archived_at)
+    WHERE archived_at IS NOT NULL
+    """,
+)
+
+IS_PARTITIONED = """
+    SELECT EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('products')
+    )
+"""
+
+
+def create_partitions(parent: str, prefix: str, partitions: int) -> list[str]:
+    """Statements creating the hash partitions of parent"""
+    if partitions < 2:
+        raise ValueError("Partitioning needs at least 2 partitions")
+    return [
+        f"CREATE TABLE {prefix}{remainder} PARTITION OF {parent} "
+        f"FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})"
+        for remainder in range(partitions)
+    ]
+
+
+def create_indexes(table: str, partitioned: bool) -> list[str]:
+    """Statements creating the products indexes on table"""
+    unique = "" if partitioned else "UNIQUE "
+    return [index.format(table=table, unique=unique) for index in PRODUCT_INDEXES]
+
+
+def partition_products(partitions: int) -> list[str]:
+    """Statements converting products into a hash-partitioned table"""
+    return [
+        """
+        CREATE TABLE products_partitioned (LIKE products INCLUDING DEFAULTS)
+        PARTITION BY HASH (id)
+        """,
+        *create_partitions("products_partitioned", "products_p", partitions),
+        "INSERT INTO products_partitioned SELECT * FROM products",
+        "DROP TABLE products",
+        "ALTER TABLE products_partitioned RENAME TO products",
+        "ALTER TABLE products ADD CONSTRAINT products_pkey PRIMARY KEY (id)",
+        *create_indexes("products", partitioned=True),
+    ]
+
+
+def unpartition_products() -> list[str]:
+    """Statements converting a partitioned products table back to a plain one"""
+    return [
+        "CREATE TABLE products_unpartitioned (LIKE products INCLUDING DEFAULTS)",
+        "INSERT INTO products_unpartitioned SELECT * FROM products",
+        "DROP TABLE products",
+        "ALTER TABLE products_unpartitioned RENAME TO products",
+        "ALTER TABLE products ADD CONSTRAINT products_pkey PRIMARY KEY (id)",
+        *create_indexes("products", partitioned=False),
+    ]
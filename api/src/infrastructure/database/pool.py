@@ -0,0 +1,23 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.utils.loop_lag import RecentMax
+
+# How long a slow checkout keeps counting towards load shedding
+CHECKOUT_WAIT_WINDOW_SECONDS = 5.0
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long connection checkouts wait."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_wait = RecentMax(window=CHECKOUT_WAIT_WINDOW_SECONDS)
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.checkout_wait.record(time.perf_counter() - start)
@@ -0,0 +1,76 @@
+import time
+from itertools import count
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReplicaRouter:
+    """Picks the engine read-only sessions run on.
+
+    Reads go to the healthy replica with the fewest checked-out connections,
+    rotating between replicas that tie, and to the primary when no replica
+    is configured or healthy. A replica leaves the rotation when a health
+    check fails or one of its connections is found disconnected, and
+    returns once a health check succeeds.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        retry_seconds: float,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_seconds = retry_seconds
+        self._down_until = {id(replica): 0.0 for replica in replicas}
+        self._turn = count()
+        for replica in replicas:
+            event.listen(replica.sync_engine, "handle_error", self._on_error(replica))
+
+    def read_engine(self) -> AsyncEngine:
+        now = time.monotonic()
+        healthy = [
+            replica for replica in self.replicas if self._down_until[id(replica)] <= now
+        ]
+        if not healthy:
+            return self.primary
+        start = next(self._turn) % len(healthy)
+        rotated = healthy[start:] + healthy[:start]
+        return min(rotated, key=lambda replica: replica.pool.checkedout())
+
+    def is_healthy(self, replica: AsyncEngine) -> bool:
+        return self._down_until[id(replica)] <= time.monotonic()
+
+    def mark_unhealthy(self, replica: AsyncEngine) -> None:
+        if self.is_healthy(replica):
+            logger.warning(f"Read replica {replica.url} marked unhealthy")
+        self._down_until[id(replica)] = time.monotonic() + self.retry_seconds
+
+    def mark_healthy(self, replica: AsyncEngine) -> None:
+        if not self.is_healthy(replica):
+            logger.info(f"Read replica {replica.url} is healthy again")
+        self._down_until[id(replica)] = 0.0
+
+    async def check_health(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            except Exception:
+                self.mark_unhealthy(replica)
+            else:
+                self.mark_healthy(replica)
+
+    def _on_error(self, replica: AsyncEngine):
+        def handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                self.mark_unhealthy(replica)
+
+        return handle_error
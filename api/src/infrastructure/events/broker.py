@@ -0,0 +1,105 @@
+import asyncio
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.domain.entities.product_event import ProductEvent
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+PRODUCT_EVENTS_CHANNEL = "product_events"
+
+
+class Subscription:
+    """Bounded queue of events for one connected client."""
+
+    def __init__(self, max_size: int):
+        self.queue: asyncio.Queue[ProductEvent | None] = asyncio.Queue(max_size)
+        self.dropped = False
+
+    async def get(self, timeout: float) -> ProductEvent | None:
+        """Wait for the next event, returning None on timeout or drop."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def drop(self) -> None:
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+
+class ProductEventBroker:
+    """Fans Postgres product notifications out to in-process subscribers.
+
+    Each worker holds a single LISTEN connection, opened on the first
+    subscription. Subscribers that fall behind by more than queue_size
+    events are dropped instead of buffering without bound, and so are all
+    subscribers when the listener connection is lost; clients reconnect
+    and catch up through the change feed.
+    """
+
+    def __init__(self, database_url: str, queue_size: int):
+        self.dsn = make_url(database_url).set(drivername="postgresql")
+        self.queue_size = queue_size
+        self._connection: asyncpg.Connection | None = None
+        self._subscriptions: set[Subscription] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    async def subscribe(self) -> Subscription:
+        await self._ensure_listening()
+        subscription = Subscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    async def close(self) -> None:
+        for subscription in self._subscriptions:
+            subscription.drop()
+        self._subscriptions.clear()
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+    async def _ensure_listening(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            return
+        async with self._lock:
+            if self._connection is not None and not self._connection.is_closed():
+                return
+            connection = await asyncpg.connect(
+                self.dsn.render_as_string(hide_password=False)
+            )
+            await connection.add_listener(PRODUCT_EVENTS_CHANNEL, self._on_notification)
+            connection.add_termination_listener(self._on_termination)
+            self._connection = connection
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        self.publish(ProductEvent.model_validate_json(payload))
+
+    def publish(self, event: ProductEvent) -> None:
+        for subscription in list(self._subscriptions):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Dropping slow product event subscriber")
+                self._subscriptions.discard(subscription)
+                subscription.drop()
+
+    def _on_termination(self, connection: asyncpg.Connection) -> None:
+        logger.warning("Product event listener connection lost")
+        self._connection = None
+        for subscription in self._subscriptions:
+            subscription.drop()
+        self._subscriptions.clear()
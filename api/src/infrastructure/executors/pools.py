@@ -0,0 +1,103 @@
+"""Thread and process pools for work that would otherwise stall the loop.
+
+The thread pool is for blocking I/O, hashing and file writes, and for JSON
+parsing and encoding of large bodies. The process pool is for image work
+with Pillow, whose small inputs and outputs are cheap to ship to another
+process. JSON is not: pickling a parsed body or a product back costs as
+much loop time as the step itself, and several times its latency. Both
+pools start on first use.
+"""
+
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.infrastructure.config import settings
+from src.utils.loop_lag import RecentMax
+
+# How long a slow queue wait keeps showing in the metrics
+QUEUE_WAIT_WINDOW_SECONDS = 60.0
+
+
+def _timed[T](fn: Callable[..., T], *args) -> tuple[float, T]:
+    # Wall clock, as the start is compared across processes
+    return time.time(), fn(*args)
+
+
+class MeteredExecutor:
+    """Executor created on first use that tracks its queue."""
+
+    def __init__(self, name: str, workers: int, factory: Callable[[int], Executor]):
+        self.name = name
+        self.workers = workers
+        self.factory = factory
+        self.in_flight = 0
+        self.completed = 0
+        self.queue_wait = RecentMax(window=QUEUE_WAIT_WINDOW_SECONDS)
+        self._executor: Executor | None = None
+
+    async def run[T](self, fn: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            self._executor = self.factory(self.workers)
+        loop = asyncio.get_running_loop()
+        submitted_at = time.time()
+        self.in_flight += 1
+        try:
+            started_at, result = await loop.run_in_executor(
+                self._executor, _timed, fn, *args
+            )
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+        self.queue_wait.record(max(0.0, started_at - submitted_at))
+        return result
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "workers": self.workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.workers),
+            "completed": self.completed,
+            "max_queue_wait_ms": round(self.queue_wait.value * 1000, 3),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+thread_pool = MeteredExecutor(
+    "thread",
+    settings.executor_threads,
+    lambda workers: ThreadPoolExecutor(workers, thread_name_prefix="offload"),
+)
+process_pool = MeteredExecutor(
+    "process",
+    settings.executor_processes,
+    lambda workers: ProcessPoolExecutor(
+        workers, mp_context=multiprocessing.get_context("spawn")
+    ),
+)
+
+
+async def offload[T](fn: Callable[..., T], *args, size: int) -> T:
+    """Run a JSON step in the thread pool when its input is large.
+
+    Below executor_offload_min_bytes, handing the step to a thread costs
+    more than running it in place.
+    """
+    if size < settings.executor_offload_min_bytes:
+        return fn(*args)
+    return await thread_pool.run(fn, *args)
+
+
+def pool_stats() -> dict[str, dict[str, int | float]]:
+    return {pool.name: pool.stats() for pool in (thread_pool, process_pool)}
+
+
+def shutdown_pools() -> None:
+    thread_pool.shutdown()
+    process_pool.shutdown()
@@ -0,0 +1,81 @@
+import base64
+import binascii
+import hashlib
+import io
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from src.application.exceptions.exceptions import InvalidPictureException
+from src.domain.entities.thumbnail import THUMBNAIL_FORMATS, THUMBNAIL_SIZES, Thumbnail
+from src.domain.services.thumbnail_generator import ThumbnailGenerator
+from src.infrastructure.executors.pools import process_pool
+
+CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def decode_picture(picture: bytes) -> bytes:
+    """Pictures arrive as base64 text inside the JSON payloads."""
+    try:
+        return base64.b64decode(picture, validate=True)
+    except binascii.Error:
+        raise InvalidPictureException("Picture must be a base64 encoded image")
+
+
+def render_thumbnails(picture: bytes) -> list[tuple[str, int, str, bytes]]:
+    """Render every fixed size and format of a base64 encoded picture.
+
+    Runs inside the process pool, so decoding and checking the image stay
+    off the event loop, and it only returns plain tuples.
+    """
+    image_bytes = decode_picture(picture)
+    digest = hashlib.sha256(image_bytes).hexdigest()
+    return _render(io.BytesIO(image_bytes), digest)
+
+
+def render_thumbnails_from_file(path: str) -> list[tuple[str, int, str, bytes]]:
+    """Same as render_thumbnails, reading the picture from disk in the worker."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(1024 * 1024):
+            digest.update(chunk)
+    return _render(path, digest.hexdigest())
+
+
+def _render(source, digest: str) -> list[tuple[str, int, str, bytes]]:
+    try:
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            renditions = []
+            for size in THUMBNAIL_SIZES:
+                resized = image.copy()
+                resized.thumbnail((size, size))
+                for image_format in THUMBNAIL_FORMATS:
+                    buffer = io.BytesIO()
+                    resized.save(buffer, format=image_format.upper(), quality=80)
+                    renditions.append((digest, size, image_format, buffer.getvalue()))
+            return renditions
+    except (UnidentifiedImageError, OSError, ValueError):
+        raise InvalidPictureException("Picture is not a supported image")
+
+
+class PillowThumbnailGenerator(ThumbnailGenerator):
+    async def generate(self, picture: bytes) -> list[Thumbnail]:
+        return await self._run(render_thumbnails, picture)
+
+    async def generate_from_file(self, location: str) -> list[Thumbnail]:
+        return await self._run(render_thumbnails_from_file, location)
+
+    async def _run(self, render, source) -> list[Thumbnail]:
+        renditions = await process_pool.run(render, source)
+        return [
+            Thumbnail(
+                digest=digest,
+                size=size,
+                format=image_format,
+                content_type=CONTENT_TYPES[image_format],
+                data=data,
+            )
+            for digest, size, image_format, data in renditions
+        ]
@@ -0,0 +1,44 @@
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from src.domain.entities.job import JobKindEnum
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.repositories.catalog_stats_repository import (
+    SQLAlchemyCatalogStatsRepository,
+)
+from src.infrastructure.tasks.archived_purger import purge_archived_products
+from src.infrastructure.tasks.thumbnail_backfill import backfill_thumbnails
+
+JobHandler = Callable[..., Awaitable[dict[str, Any] | None]]
+
+
+async def refresh_stats() -> dict[str, Any]:
+    async with connection.async_session_maker() as session:
+        repository = SQLAlchemyCatalogStatsRepository(
+            session, daily_window_days=settings.stats_daily_window_days
+        )
+        stats = await repository.refresh_stats(max_age=timedelta(0))
+        await session.commit()
+    return {"computed_at": stats.computed_at.isoformat()}
+
+
+async def backfill_picture_thumbnails(batch_size: int) -> dict[str, Any]:
+    return {"processed": await backfill_thumbnails(batch_size)}
+
+
+async def purge_archived(older_than_days: int, batch_size: int) -> dict[str, Any]:
+    purged = await purge_archived_products(timedelta(days=older_than_days), batch_size)
+    return {"purged": purged}
+
+
+# Handlers are called with their kind's payload from JOB_PAYLOADS, defaults
+# filled in. Jobs run at least once: a worker that dies mid-job leaves it to
+# be retried once its lease expires, so every handler must be safe to run
+# again.
+JOB_HANDLERS: dict[JobKindEnum, JobHandler] = {
+    JobKindEnum.REFRESH_STATS: refresh_stats,
+    JobKindEnum.BACKFILL_THUMBNAILS: backfill_picture_thumbnails,
+    JobKindEnum.PURGE_ARCHIVED: purge_archived,
+}
@@ -0,0 +1,161 @@
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.job import JOB_PAYLOADS, Job, JobKindEnum
+from src.domain.repositories.job_repository import JobRepository
+from src.infrastructure.jobs.handlers import JobHandler
+from src.infrastructure.repositories.job_repository import SQLAlchemyJobRepository
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+PURGE_BATCH_SIZE = 1000
+
+
+class JobWorker:
+    """Runs queued jobs with a fixed number of concurrent slots.
+
+    Claiming, recording the outcome and the job itself each run in their own
+    transaction, so no row lock is held while a handler works. Failed jobs
+    are retried with jittered exponential backoff until max_attempts.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        handlers: dict[JobKindEnum, JobHandler],
+        concurrency: int,
+        poll_interval: float,
+        lease: timedelta,
+        backoff_base: float,
+        backoff_max: float,
+        retention: timedelta,
+    ):
+        self.session_maker = session_maker
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retention = retention
+
+    async def run(self) -> None:
+        await asyncio.gather(
+            self._purge_finished(),
+            *(self._work() for _ in range(self.concurrency)),
+        )
+
+    async def run_once(self) -> Job | None:
+        """Claim and run a single due job, returning it or None when idle"""
+        async with self.session_maker() as session:
+            job = await SQLAlchemyJobRepository(session).claim(self.lease)
+            await session.commit()
+        if job:
+            await self._execute(job)
+        return job
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Job worker iteration failed: {e}")
+                job = None
+            if job is None:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _execute(self, job: Job) -> None:
+        if job.attempts > job.max_attempts:
+            # A worker died holding the job on its last attempt
+            await self._record(
+                job, lambda jobs: jobs.fail(job.id, job.attempts, "Lease expired", None)
+            )
+            return
+        handler = self.handlers[job.kind]
+        try:
+            payload = JOB_PAYLOADS[job.kind].model_validate(job.payload)
+        except ValidationError as e:
+            # Enqueued before its payload was checked; retrying cannot fix it
+            reason = f"Invalid payload: {e}"
+            await self._record(
+                job, lambda jobs: jobs.fail(job.id, job.attempts, reason, None)
+            )
+            return
+
+        logger.info(f"Running job {job.id} ({job.kind.value}), attempt {job.attempts}")
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            result = await handler(**payload.model_dump())
+            error = None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            heartbeat.cancel()
+
+        if error is None:
+            await self._record(
+                job, lambda jobs: jobs.complete(job.id, job.attempts, result)
+            )
+            return
+
+        retry_at = self._retry_at(job)
+        logger.warning(
+            f"Job {job.id} ({job.kind.value}) failed on attempt {job.attempts}: "
+            f"{error}" + (f", retrying at {retry_at}" if retry_at else "")
+        )
+        message = f"{type(error).__name__}: {error}"
+        await self._record(
+            job, lambda jobs: jobs.fail(job.id, job.attempts, message, retry_at)
+        )
+
+    def _retry_at(self, job: Job) -> datetime | None:
+        if job.attempts >= job.max_attempts:
+            return None
+        delay = min(self.backoff_base * 2 ** (job.attempts - 1), self.backoff_max)
+        # Jitter spreads out retries of jobs that failed together
+        return datetime.now() + timedelta(seconds=delay * random.uniform(0.5, 1))
+
+    async def _heartbeat(self, job: Job) -> None:
+        while True:
+            await asyncio.sleep(self.lease.total_seconds() / 3)
+            try:
+                await self._record(
+                    job,
+                    lambda jobs: jobs.extend_lease(job.id, job.attempts, self.lease),
+                )
+            except Exception as e:
+                logger.warning(f"Could not extend the lease of job {job.id}: {e}")
+
+    async def _record(
+        self, job: Job, update: Callable[[JobRepository], Awaitable[bool]]
+    ) -> None:
+        async with self.session_maker() as session:
+            applied = await update(SQLAlchemyJobRepository(session))
+            await session.commit()
+        if not applied:
+            logger.warning(f"Job {job.id} lost its lease to another worker")
+
+    async def _purge_finished(self) -> None:
+        while True:
+            try:
+                async with self.session_maker() as session:
+                    purged = await SQLAlchemyJobRepository(session).purge_finished(
+                        datetime.now() - self.retention, PURGE_BATCH_SIZE
+                    )
+                    await session.commit()
+                if purged:
+                    logger.info(f"Purged {purged} finished jobs")
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Finished job purge failed: {e}")
+            await asyncio.sleep(60 * 60)
@@ -0,0 +1,84 @@
+import hashlib
+import re
+
+from starlette.requests import Request
+from starlette.routing import compile_path
+
+from src.infrastructure.config import RateLimitRule
+from src.infrastructure.rate_limit.store import TokenBucketStore
+
+API_KEY_HEADER = "x-api-key"
+
+
+def compile_route(route: str) -> tuple[str, re.Pattern]:
+    method, path = route.split(" ", 1)
+    return method.upper(), compile_path(path)[0]
+
+
+class RateLimiter:
+    """Token-bucket limits per client, with per-route rules.
+
+    Clients are identified by their API key, or by address when they send
+    none. Each request takes a token from the bucket of its route rule (or
+    the default rule), and expensive requests also take one from a separate,
+    smaller budget so they cannot exhaust the cheap ones.
+    """
+
+    def __init__(
+        self,
+        store: TokenBucketStore,
+        default: RateLimitRule,
+        routes: dict[str, RateLimitRule],
+        expensive: RateLimitRule,
+        expensive_routes: list[str],
+        deep_page: int,
+        max_page_size: int,
+    ):
+        self.store = store
+        self.default = default
+        self.expensive = expensive
+        self.deep_page = deep_page
+        self.max_page_size = max_page_size
+        self._routes = [
+            (route, *compile_route(route), rule) for route, rule in routes.items()
+        ]
+        self._expensive_routes = [compile_route(route) for route in expensive_routes]
+
+    def client_key(self, request: Request) -> str:
+        api_key = request.headers.get(API_KEY_HEADER)
+        if api_key:
+            return "key:" + hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        return "ip:" + (request.client.host if request.client else "unknown")
+
+    def route_rule(self, request: Request) -> tuple[str, RateLimitRule]:
+        for route, method, pattern, rule in self._routes:
+            if request.method == method and pattern.match(request.url.path):
+                return route, rule
+        return "default", self.default
+
+    def is_expensive(self, request: Request) -> bool:
+        if any(
+            request.method == method and pattern.match(request.url.path)
+            for method, pattern in self._expensive_routes
+        ):
+            return True
+        if request.method == "GET" and request.url.path == "/api/v1/products":
+            if request.query_params.get("name"):
+                return True
+            page = request.query_params.get("page", "1")
+            size = request.query_params.get("size", "1")
+            return (page.isdigit() and int(page) > self.deep_page) or (
+                size.isdigit() and int(size) > self.max_page_size
+            )
+        return False
+
+    async def retry_after(self, request: Request) -> float:
+        """Seconds the client must wait, or 0 when the request may proceed."""
+        client = self.client_key(request)
+        route, rule = self.route_rule(request)
+        retry_after = await self.store.take(f"{client}:{route}", rule.rate, rule.burst)
+        if retry_after or not self.is_expensive(request):
+            return retry_after
+        return await self.store.take(
+            f"{client}:expensive", self.expensive.rate, self.expensive.burst
+        )
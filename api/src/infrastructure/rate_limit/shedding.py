@@ -0,0 +1,46 @@
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.database.pool import TimedAsyncAdaptedQueuePool
+from src.utils.loop_lag import LoopLagMonitor
+
+
+class LoadShedder:
+    """Rejects work while the event loop or the connection pools are saturated.
+
+    Once requests queue for connections or the loop falls behind, accepting
+    more only makes every request slower, so new ones are turned away until
+    the signals recover. The engines are looked up on each check, so they
+    are only built once the first request comes in.
+    """
+
+    def __init__(
+        self,
+        loop_lag: LoopLagMonitor,
+        engines: Callable[[], list[AsyncEngine]],
+        max_loop_lag: float,
+        max_pool_wait: float,
+    ):
+        self.loop_lag = loop_lag
+        self.engines = engines
+        self.max_loop_lag = max_loop_lag
+        self.max_pool_wait = max_pool_wait
+
+    def pool_wait(self) -> float:
+        return max(
+            (
+                engine.pool.checkout_wait.value
+                for engine in self.engines()
+                if isinstance(engine.pool, TimedAsyncAdaptedQueuePool)
+            ),
+            default=0.0,
+        )
+
+    def overloaded(self) -> str | None:
+        """Name the saturated resource, or None when there is capacity."""
+        if self.loop_lag.lag > self.max_loop_lag:
+            return "event loop"
+        if self.pool_wait() > self.max_pool_wait:
+            return "database pool"
+        return None
@@ -0,0 +1,36 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class TokenBucketStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, rate: float, burst: int, cost: float = 1) -> float:
+        """Take cost tokens from the bucket at key.
+
+        Returns 0 when the tokens were taken, otherwise the seconds until
+        enough tokens will be available.
+        """
+        raise NotImplementedError
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """Per-process buckets, keeping at most max_keys recently used clients."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: int, cost: float = 1) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated_at) * rate)
+        if tokens >= cost:
+            tokens -= cost
+            retry_after = 0.0
+        else:
+            retry_after = (cost - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.exceptions.exceptions import (
+    DatabaseException,
+    QueryTimeoutException,
+)
+from src.infrastructure.database.connection import current_session
+
+# query_canceled: raised for statement_timeout and cancelled queries
+QUERY_CANCELED = "57014"
+
+
+def database_exception(error: Exception) -> Exception:
+    """Translate a database error into the application exception to raise"""
+    if getattr(getattr(error, "orig", None), "sqlstate", None) == QUERY_CANCELED:
+        return QueryTimeoutException()
+    return DatabaseException(str(error))
+
+
+class SQLAlchemyRepository:
+    """Runs on the given session, or on the current request's session.
+
+    Repositories built without a session hold no per-request state, so the
+    API container can share a single instance across requests.
+    """
+
+    def __init__(self, session: AsyncSession | None = None):
+        self._session = session
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is not None:
+            return self._session
+        return current_session()
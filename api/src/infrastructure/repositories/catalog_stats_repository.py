@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import Date, cast, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.catalog_stats import (
+    CatalogStats,
+    DailyCount,
+    PriceStats,
+    round_price,
+)
+from src.domain.repositories.catalog_stats_repository import CatalogStatsRepository
+from src.infrastructure.database.models import CatalogStatsModel, ProductModel
+from src.infrastructure.repositories.base import (
+    SQLAlchemyRepository,
+    database_exception,
+)
+
+CATALOG_STATS_ID = 1
+# Arbitrary key shared by every worker refreshing the summary row.
+REFRESH_LOCK_KEY = 29_000_001
+
+
+class SQLAlchemyCatalogStatsRepository(SQLAlchemyRepository, CatalogStatsRepository):
+    def __init__(self, session: AsyncSession | None = None, *, daily_window_days: int):
+        super().__init__(session)
+        self.daily_window_days = daily_window_days
+
+    async def get_stats(self) -> CatalogStats | None:
+        result = await self.session.get(CatalogStatsModel, CATALOG_STATS_ID)
+        if result:
+            return CatalogStats.model_validate(result.payload)
+        return None
+
+    async def refresh_stats(self, max_age: timedelta) -> CatalogStats:
+        try:
+            await self.session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"), {"key": REFRESH_LOCK_KEY}
+            )
+            current = await self.session.get(
+                CatalogStatsModel, CATALOG_STATS_ID, populate_existing=True
+            )
+            if current and current.computed_at > datetime.now() - max_age:
+                return CatalogStats.model_validate(current.payload)
+
+            stats = await self._compute_stats()
+            query = insert(CatalogStatsModel).values(
+                id=CATALOG_STATS_ID,
+                computed_at=stats.computed_at,
+                payload=stats.model_dump(mode="json"),
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[CatalogStatsModel.id],
+                set_={
+                    "computed_at": query.excluded.computed_at,
+                    "payload": query.excluded.payload,
+                },
+            )
+            await self.session.execute(query)
+            return stats
+        except Exception as e:
+            raise database_exception(e)
+
+    async def _compute_stats(self) -> CatalogStats:
+        computed_at = datetime.now()
+        price = ProductModel.price
+        live = ProductModel.archived_at.is_(None)
+
+        price_row = (
+            await self.session.execute(
+                select(
+                    func.count(),
+                    func.min(price),
+                    func.max(price),
+                    func.avg(price),
+                    func.percentile_cont(0.5).within_group(price),
+                    func.percentile_cont(0.9).within_group(price),
+                    func.percentile_cont(0.99).within_group(price),
+                ).where(live)
+            )
+        ).one()
+
+        groups = (
+            await self.session.execute(
+                select(ProductModel.selling_place, ProductModel.active, func.count())
+                .where(live)
+                .group_by(ProductModel.selling_place, ProductModel.active)
+            )
+        ).all()
+        by_selling_place: dict[str, int] = {}
+        by_active = {"active": 0, "inactive": 0}
+        for selling_place, active, count in groups:
+            by_selling_place[selling_place.value] = (
+                by_selling_place.get(selling_place.value, 0) + count
+            )
+            by_active["active" if active else "inactive"] += count
+
+        day = cast(ProductModel.inserted_at, Date)
+        since = computed_at - timedelta(days=self.daily_window_days)
+        daily = (
+            await self.session.execute(
+                select(day, func.count())
+                .where(live, ProductModel.inserted_at >= since)
+                .group_by(day)
+                .order_by(day)
+            )
+        ).all()
+
+        total, min_price, max_price, avg_price, p50, p90, p99 = price_row
+        return CatalogStats(
+            computed_at=computed_at,
+            total=total,
+            by_selling_place=by_selling_place,
+            by_active=by_active,
+            price=PriceStats(
+                min=round_price(min_price),
+                max=round_price(max_price),
+                avg=round_price(avg_price),
+                p50=round_price(p50),
+                p90=round_price(p90),
+                p99=round_price(p99),
+            ),
+            added_per_day=[
+                DailyCount(day=bucket, count=count) for bucket, count in daily
+            ],
+        )
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.domain.entities.idempotency import IdempotencyRecord
+from src.domain.repositories.idempotency_repository import IdempotencyRepository
+from src.infrastructure.database.models import IdempotencyKeyModel
+from src.infrastructure.repositories.base import (
+    SQLAlchemyRepository,
+    database_exception,
+)
+
+
+class SQLAlchemyIdempotencyRepository(SQLAlchemyRepository, IdempotencyRepository):
+    async def claim(
+        self, key: str, request_hash: str, ttl: timedelta
+    ) -> IdempotencyRecord | None:
+        try:
+            now = datetime.now()
+            # A concurrent insert of the same key blocks on the primary key
+            # until the first transaction ends, so a duplicate request waits
+            # for the original and then reads its outcome. Expired keys are
+            # taken over as if they were new.
+            statement = insert(IdempotencyKeyModel).values(
+                key=key, request_hash=request_hash, created_at=now, expires_at=now + ttl
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[IdempotencyKeyModel.key],
+                set_={
+                    "request_hash": statement.excluded.request_hash,
+                    "response": None,
+                    "created_at": statement.excluded.created_at,
+                    "expires_at": statement.excluded.expires_at,
+                },
+                where=IdempotencyKeyModel.expires_at <= now,
+            ).returning(IdempotencyKeyModel.key)
+            result = await self.session.execute(statement)
+            if result.scalar_one_or_none() is not None:
+                return None
+
+            result = await self.session.execute(
+                select(
+                    IdempotencyKeyModel.key,
+                    IdempotencyKeyModel.request_hash,
+                    IdempotencyKeyModel.response,
+                ).where(IdempotencyKeyModel.key == key)
+            )
+            return IdempotencyRecord.model_validate(result.mappings().one())
+        except Exception as e:
+            raise database_exception(e)
+
+    async def complete(self, key: str, response: dict[str, Any]) -> None:
+        try:
+            await self.session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == key)
+                .values(response=response)
+            )
+        except Exception as e:
+            raise database_exception(e)
+
+    async def purge_expired(self, batch_size: int) -> int:
+        try:
+            expired = (
+                select(IdempotencyKeyModel.key)
+                .where(IdempotencyKeyModel.expires_at <= datetime.now())
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(IdempotencyKeyModel).where(IdempotencyKeyModel.key.in_(expired))
+            )
+            return result.rowcount
+        except Exception as e:
+            raise database_exception(e)
@@ -0,0 +1,295 @@
+import bisect
+import itertools
+import uuid
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime
+from operator import itemgetter
+from typing import Any
+from uuid import UUID
+
+from src.application.exceptions.exceptions import (
+    NoResultFoundException,
+    ReadOnlyCatalogException,
+)
+from src.domain.entities.change_feed import ChangeFeed
+from src.domain.entities.product import Product
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.domain.repositories.product_repository import ProductRepository
+from src.utils.prefix_index import trigrams
+
+# Sort order -> (indexed field, descending). Ties break on id, as in SQL.
+SORTS = {
+    ProductSortEnum.NAME: ("name", False),
+    ProductSortEnum.NAME_DESC: ("name", True),
+    ProductSortEnum.PRICE: ("price", False),
+    ProductSortEnum.PRICE_DESC: ("price", True),
+    ProductSortEnum.INSERTED_AT: ("inserted_at", False),
+    ProductSortEnum.INSERTED_AT_DESC: ("inserted_at", True),
+}
+
+# Name filters matching fewer candidates than this share of the catalog are
+# sorted directly instead of scanning the sort index
+CANDIDATE_SORT_RATIO = 0.1
+
+
+def matches(product: Product, filters: ProductFilter) -> bool:
+    """Every filter except name, which the trigram index resolves"""
+    return (
+        (filters.include_archived or product.archived_at is None)
+        and (filters.min_price is None or product.price >= filters.min_price)
+        and (filters.max_price is None or product.price <= filters.max_price)
+        and (filters.active is None or product.active == filters.active)
+        and (
+            filters.selling_place is None
+            or product.selling_place == filters.selling_place
+        )
+        and (
+            filters.inserted_from is None
+            or (
+                product.inserted_at is not None
+                and product.inserted_at >= filters.inserted_from
+            )
+        )
+        and (
+            filters.inserted_to is None
+            or (
+                product.inserted_at is not None
+                and product.inserted_at < filters.inserted_to
+            )
+        )
+    )
+
+
+class InMemoryProductRepository(ProductRepository):
+    """Product repository held in process memory, with its own indexes.
+
+    Products are hashed by id, kept in a sorted (value, id) index per sort
+    field and in change_seq order for the change feed, and their names are
+    indexed by trigram for substring filters. It needs no database, so it
+    serves unit tests, benchmarks of the layers above the repository and,
+    with read_only, small deployments that serve a fixed catalog.
+
+    Unlike the SQLAlchemy repository it publishes no product events.
+    """
+
+    def __init__(self, products: Iterable[Product] = (), read_only: bool = False):
+        self.read_only = read_only
+        self._by_id: dict[UUID, Product] = {}
+        self._sorted: dict[str, list[tuple[Any, UUID]]] = {
+            field: [] for field, _ in SORTS.values()
+        }
+        self._changes: list[tuple[int, UUID]] = []
+        self._trigrams: dict[str, set[UUID]] = {}
+        self._change_seq = itertools.count(1)
+        for product in products:
+            self._add(product.model_copy())
+        if self._changes:
+            self._change_seq = itertools.count(self._changes[-1][0] + 1)
+
+    @classmethod
+    def from_ndjson(
+        cls, path: str, read_only: bool = True
+    ) -> "InMemoryProductRepository":
+        """Load a catalog exported as NDJSON, one product per line, such as
+        the stream returned by GET /products for large pages"""
+        with open(path, encoding="utf-8") as file:
+            return cls(
+                (Product.model_validate_json(line) for line in file if line.strip()),
+                read_only=read_only,
+            )
+
+    async def get_product_by_id(self, product_id: UUID) -> Product | None:
+        product = self._by_id.get(product_id)
+        if product and product.archived_at is None:
+            return product.model_copy()
+        return None
+
+    async def count_products(self, filters: ProductFilter) -> int:
+        candidates = self._name_candidates(filters.name)
+        products = (
+            self._by_id.values()
+            if candidates is None
+            else (self._by_id[product_id] for product_id in candidates)
+        )
+        return sum(1 for product in products if matches(product, filters))
+
+    async def list_products(
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
+    ) -> list[Product]:
+        offset = (page - 1) * size
+        selected = itertools.islice(self._select(filters, sort), offset, offset + size)
+        return [self._listed(product) for product in selected]
+
+    async def stream_products(
+        self,
+        offset: int,
+        limit: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
+        batch_size: int,
+    ) -> AsyncIterator[list[Product]]:
+        # Taken up front, as writes between batches would shift the indexes
+        selected = list(
+            itertools.islice(self._select(filters, sort), offset, offset + limit)
+        )
+        for batch in itertools.batched(selected, batch_size):
+            yield [self._listed(product) for product in batch]
+
+    async def create_product(self, product_data: Product) -> Product:
+        self._check_writable()
+        now = datetime.now()
+        product = product_data.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "inserted_at": product_data.inserted_at or now,
+                "updated_at": now,
+                "change_seq": next(self._change_seq),
+            }
+        )
+        self._add(product)
+        return product.model_copy()
+
+    async def update_product(
+        self, product_id: UUID, update_fields: dict[str, Any]
+    ) -> None:
+        self._check_writable()
+        self._replace(product_id, update_fields)
+
+    async def archive_product(self, product_id: UUID) -> None:
+        self._check_writable()
+        self._replace(product_id, {"archived_at": datetime.now()})
+
+    async def list_changes(self, since: int, limit: int) -> ChangeFeed:
+        start = bisect.bisect_right(self._changes, (since, UUID(int=2**128 - 1)))
+        changes = self._changes[start : start + limit + 1]
+        listed = changes[:limit]
+        return ChangeFeed(
+            items=[self._listed(self._by_id[product_id]) for _, product_id in listed],
+            next_token=listed[-1][0] if listed else since,
+            has_more=len(changes) > limit,
+        )
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise ReadOnlyCatalogException()
+
+    def _replace(self, product_id: UUID, update_fields: dict[str, Any]) -> None:
+        existing = self._by_id.get(product_id)
+        if existing is None or existing.archived_at is not None:
+            raise NoResultFoundException("Product not found")
+        updated = existing.model_copy(
+            update={
+                **update_fields,
+                "updated_at": datetime.now(),
+                "change_seq": next(self._change_seq),
+            }
+        )
+        self._remove(existing)
+        self._add(updated)
+
+    @staticmethod
+    def _keys(product: Product) -> tuple[UUID, int]:
+        """The id and change_seq the indexes are keyed on"""
+        # Stored products were created here or exported with both set
+        if product.id is None or product.change_seq is None:
+            raise ValueError(f"Product {product.ean} has no id or change_seq")
+        return product.id, product.change_seq
+
+    def _add(self, product: Product) -> None:
+        product_id, change_seq = self._keys(product)
+        self._by_id[product_id] = product
+        for field, index in self._sorted.items():
+            bisect.insort(index, (getattr(product, field), product_id))
+        bisect.insort(self._changes, (change_seq, product_id))
+        for trigram in trigrams(product.name):
+            self._trigrams.setdefault(trigram, set()).add(product_id)
+
+    def _remove(self, product: Product) -> None:
+        product_id, change_seq = self._keys(product)
+        del self._by_id[product_id]
+        for field, index in self._sorted.items():
+            del index[bisect.bisect_left(index, (getattr(product, field), product_id))]
+        del self._changes[bisect.bisect_left(self._changes, (change_seq, product_id))]
+        for trigram in trigrams(product.name):
+            ids = self._trigrams[trigram]
+            ids.discard(product_id)
+            if not ids:
+                del self._trigrams[trigram]
+
+    def _name_candidates(self, name: str | None) -> set[UUID] | None:
+        """Ids whose name contains name, or None when every id qualifies"""
+        if not name:
+            return None
+        needle = name.lower()
+        if len(needle) < 3:
+            ids: Iterable[UUID] = self._by_id
+        else:
+            postings = sorted(
+                (self._trigrams.get(trigram, set()) for trigram in trigrams(needle)),
+                key=len,
+            )
+            ids = postings[0].intersection(*postings[1:])
+        return {
+            product_id
+            for product_id in ids
+            if needle in self._by_id[product_id].name.lower()
+        }
+
+    def _select(
+        self, filters: ProductFilter, sort: ProductSortEnum
+    ) -> Iterator[Product]:
+        field, descending = SORTS[sort]
+        candidates = self._name_candidates(filters.name)
+        if (
+            candidates is not None
+            and len(candidates) < len(self._by_id) * CANDIDATE_SORT_RATIO
+        ):
+            ids: Iterable[UUID] = sorted(
+                candidates,
+                key=lambda product_id: (
+                    getattr(self._by_id[product_id], field),
+                    product_id,
+                ),
+                reverse=descending,
+            )
+        else:
+            index = self._sorted[field]
+            positions = range(*self._bounds(field, filters))
+            ids = (
+                index[position][1]
+                for position in (reversed(positions) if descending else positions)
+                if candidates is None or index[position][1] in candidates
+            )
+        for product_id in ids:
+            product = self._by_id[product_id]
+            if matches(product, filters):
+                yield product
+
+    def _bounds(self, field: str, filters: ProductFilter) -> tuple[int, int]:
+        """Positions of the sort index within the filtered range of its field"""
+        index = self._sorted[field]
+        lower, upper = 0, len(index)
+        if field == "price":
+            if filters.min_price is not None:
+                lower = bisect.bisect_left(index, filters.min_price, key=itemgetter(0))
+            if filters.max_price is not None:
+                upper = bisect.bisect_right(index, filters.max_price, key=itemgetter(0))
+        elif field == "inserted_at":
+            if filters.inserted_from is not None:
+                lower = bisect.bisect_left(
+                    index, filters.inserted_from, key=itemgetter(0)
+                )
+            if filters.inserted_to is not None:
+                upper = bisect.bisect_left(
+                    index, filters.inserted_to, key=itemgetter(0)
+                )
+        return lower, max(lower, upper)
+
+    @staticmethod
+    def _listed(product: Product) -> Product:
+        # Listings leave the picture out, like the SQL listing columns
+        return product.model_copy(update={"picture": None})
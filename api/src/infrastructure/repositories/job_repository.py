@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import delete, select, update
+
+from src.domain.entities.job import Job, JobKindEnum, JobStatusEnum
+from src.domain.repositories.job_repository import JobRepository
+from src.infrastructure.database.models import JobModel
+from src.infrastructure.repositories.base import (
+    SQLAlchemyRepository,
+    database_exception,
+)
+
+PENDING_STATUSES = (JobStatusEnum.QUEUED, JobStatusEnum.RUNNING)
+
+
+class SQLAlchemyJobRepository(SQLAlchemyRepository, JobRepository):
+    async def enqueue(
+        self, kind: JobKindEnum, payload: dict[str, Any], max_attempts: int
+    ) -> Job:
+        try:
+            now = datetime.now()
+            job = JobModel(
+                kind=kind,
+                payload=payload,
+                status=JobStatusEnum.QUEUED,
+                attempts=0,
+                max_attempts=max_attempts,
+                run_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            self.session.add(job)
+            await self.session.flush()
+            return Job.model_validate(job, from_attributes=True)
+        except Exception as e:
+            raise database_exception(e)
+
+    async def get_job(self, job_id: UUID) -> Job | None:
+        try:
+            job = await self.session.get(JobModel, job_id)
+            if job:
+                return Job.model_validate(job, from_attributes=True)
+            return None
+        except Exception as e:
+            raise database_exception(e)
+
+    async def claim(self, lease: timedelta) -> Job | None:
+        try:
+            now = datetime.now()
+            # SKIP LOCKED lets concurrent workers each take a different job
+            # instead of queueing behind the row another worker is claiming.
+            # Expired leases of running jobs are due like queued jobs.
+            due = (
+                select(JobModel.id)
+                .where(JobModel.status.in_(PENDING_STATUSES), JobModel.run_at <= now)
+                .order_by(JobModel.run_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                update(JobModel)
+                .where(JobModel.id == due)
+                .values(
+                    status=JobStatusEnum.RUNNING,
+                    attempts=JobModel.attempts + 1,
+                    run_at=now + lease,
+                    updated_at=now,
+                )
+                .returning(*JobModel.__table__.c)
+                .execution_options(synchronize_session=False)
+            )
+            row = result.mappings().one_or_none()
+            if row:
+                return Job.model_validate(row)
+            return None
+        except Exception as e:
+            raise database_exception(e)
+
+    async def extend_lease(self, job_id: UUID, attempt: int, lease: timedelta) -> bool:
+        now = datetime.now()
+        return await self._update_running(
+            job_id, attempt, run_at=now + lease, updated_at=now
+        )
+
+    async def complete(
+        self, job_id: UUID, attempt: int, result: dict[str, Any] | None
+    ) -> bool:
+        now = datetime.now()
+        return await self._update_running(
+            job_id,
+            attempt,
+            status=JobStatusEnum.SUCCEEDED,
+            result=result,
+            last_error=None,
+            updated_at=now,
+            finished_at=now,
+        )
+
+    async def fail(
+        self, job_id: UUID, attempt: int, error: str, retry_at: datetime | None
+    ) -> bool:
+        now = datetime.now()
+        if retry_at is not None:
+            return await self._update_running(
+                job_id,
+                attempt,
+                status=JobStatusEnum.QUEUED,
+                run_at=retry_at,
+                last_error=error,
+                updated_at=now,
+            )
+        return await self._update_running(
+            job_id,
+            attempt,
+            status=JobStatusEnum.FAILED,
+            last_error=error,
+            updated_at=now,
+            finished_at=now,
+        )
+
+    async def purge_finished(self, before: datetime, batch_size: int) -> int:
+        try:
+            finished = (
+                select(JobModel.id)
+                .where(JobModel.finished_at < before)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(JobModel).where(JobModel.id.in_(finished))
+            )
+            return result.rowcount
+        except Exception as e:
+            raise database_exception(e)
+
+    async def _update_running(self, job_id: UUID, attempt: int, **values) -> bool:
+        # Fenced on the attempt: once a lease expires and another worker
+        # claims the job, the late worker can no longer change it.
+        try:
+            result = await self.session.execute(
+                update(JobModel)
+                .where(
+                    JobModel.id == job_id,
+                    JobModel.attempts == attempt,
+                    JobModel.status == JobStatusEnum.RUNNING,
+                )
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount > 0
+        except Exception as e:
+            raise database_exception(e)
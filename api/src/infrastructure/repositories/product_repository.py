@@ -1,77 +1,219 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 from uuid import UUID
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Select, bindparam, func, select
 
-from src.application.exceptions.exceptions import (
-    DatabaseException,
-    NoResultFoundException,
+from src.application.exceptions.exceptions import NoResultFoundException
+from src.adapters.convert_db_model import (
+    convert_db_model_to_entity,
+    convert_row_to_entity,
 )
-from src.adapters.convert_db_model import convert_db_model_to_entity
+from src.domain.entities.change_feed import ChangeFeed
 from src.domain.entities.product import Product
+from src.domain.entities.product_event import ProductEvent, ProductEventTypeEnum
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
 from src.domain.repositories.product_repository import ProductRepository
 from src.infrastructure.database.models import ProductModel
+from src.infrastructure.events.broker import PRODUCT_EVENTS_CHANNEL
+from src.infrastructure.repositories.base import (
+    SQLAlchemyRepository,
+    database_exception,
+)
+
+# Hot read paths select plain columns instead of ORM entities: the statement
+# is compiled once, prepared once per connection, and rows skip identity-map
+# hydration. Only the single-product read loads the picture.
+PRODUCT_COLUMNS = tuple(
+    column for column in ProductModel.__table__.c if column.key != "picture"
+)
+SELECT_PRODUCT_ROWS = select(*PRODUCT_COLUMNS)
+SELECT_PRODUCT_BY_ID = select(*PRODUCT_COLUMNS, ProductModel.picture).where(
+    ProductModel.id == bindparam("product_id"), ProductModel.archived_at.is_(None)
+)
+
+SORT_COLUMNS = {
+    ProductSortEnum.NAME: (ProductModel.name.asc(), ProductModel.id.asc()),
+    ProductSortEnum.NAME_DESC: (ProductModel.name.desc(), ProductModel.id.desc()),
+    ProductSortEnum.PRICE: (ProductModel.price.asc(), ProductModel.id.asc()),
+    ProductSortEnum.PRICE_DESC: (ProductModel.price.desc(), ProductModel.id.desc()),
+    ProductSortEnum.INSERTED_AT: (
+        ProductModel.inserted_at.asc(),
+        ProductModel.id.asc(),
+    ),
+    ProductSortEnum.INSERTED_AT_DESC: (
+        ProductModel.inserted_at.desc(),
+        ProductModel.id.desc(),
+    ),
+}
+
 
+def apply_filters(query: Select, filters: ProductFilter) -> Select:
+    # Live-row predicate matching the partial indexes on products
+    if not filters.include_archived:
+        query = query.where(ProductModel.archived_at.is_(None))
+    if filters.name:
+        query = query.where(ProductModel.name.ilike(f"%{filters.name}%"))
+    if filters.min_price is not None:
+        query = query.where(ProductModel.price >= filters.min_price)
+    if filters.max_price is not None:
+        query = query.where(ProductModel.price <= filters.max_price)
+    if filters.active is not None:
+        query = query.where(ProductModel.active == filters.active)
+    if filters.selling_place is not None:
+        query = query.where(ProductModel.selling_place == filters.selling_place)
+    if filters.inserted_from is not None:
+        query = query.where(ProductModel.inserted_at >= filters.inserted_from)
+    if filters.inserted_to is not None:
+        query = query.where(ProductModel.inserted_at < filters.inserted_to)
+    return query
 
-class SQLAlchemyProductRepository(ProductRepository):
-    def __init__(self, session: AsyncSession):
-        self.session = session
 
+class SQLAlchemyProductRepository(SQLAlchemyRepository, ProductRepository):
     async def get_product_by_id(self, product_id: UUID) -> Product | None:
-        result = await self.session.get(ProductModel, product_id)
-        if result:
-            return convert_db_model_to_entity(result)
+        try:
+            result = await self.session.execute(
+                SELECT_PRODUCT_BY_ID, {"product_id": product_id}
+            )
+        except Exception as e:
+            raise database_exception(e)
+        row = result.mappings().one_or_none()
+        if row:
+            return convert_row_to_entity(row)
         return None
 
-    async def count_products(self, filter_name: str | None) -> int:
+    async def count_products(self, filters: ProductFilter) -> int:
         try:
-            query = select(func.count()).select_from(ProductModel)
-            if filter_name:
-                query = query.where(ProductModel.name.ilike(f"%{filter_name}%"))
+            query = apply_filters(
+                select(func.count()).select_from(ProductModel), filters
+            )
             result = await self.session.execute(query)
             return result.scalar_one()
         except Exception as e:
-            raise DatabaseException(str(e))
+            raise database_exception(e)
 
     async def list_products(
-        self, page: int, size: int, filter_name: str | None
+        self,
+        page: int,
+        size: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
     ) -> list[Product]:
         try:
             offset = (page - 1) * size
-            query = select(ProductModel).offset(offset).limit(size)
-            if filter_name:
-                query = query.where(ProductModel.name.ilike(f"%{filter_name}%"))
+            query = (
+                apply_filters(SELECT_PRODUCT_ROWS, filters)
+                .order_by(*SORT_COLUMNS[sort])
+                .offset(offset)
+                .limit(size)
+            )
             result = await self.session.execute(query)
-            return [
-                convert_db_model_to_entity(product)
-                for product in result.scalars().all()
-            ]
+            return [convert_row_to_entity(row) for row in result.mappings()]
+        except Exception as e:
+            raise database_exception(e)
+
+    async def stream_products(
+        self,
+        offset: int,
+        limit: int,
+        filters: ProductFilter,
+        sort: ProductSortEnum,
+        batch_size: int,
+    ) -> AsyncIterator[list[Product]]:
+        # Runs while the response is being sent, after the request's session
+        # scope has closed: the session checks out a connection again for
+        # the server-side cursor and must release it once the stream ends.
+        session = self.session
+        try:
+            query = (
+                apply_filters(SELECT_PRODUCT_ROWS, filters)
+                .order_by(*SORT_COLUMNS[sort])
+                .offset(offset)
+                .limit(limit)
+                .execution_options(yield_per=batch_size)
+            )
+            result = await session.stream(query)
+            async for rows in result.mappings().partitions():
+                yield [convert_row_to_entity(row) for row in rows]
         except Exception as e:
-            raise DatabaseException(str(e))
+            raise database_exception(e)
+        finally:
+            await session.close()
 
     async def create_product(self, product_data: Product) -> Product:
         try:
-            new_product = ProductModel(**product_data.model_dump(exclude={"id"}))
+            new_product = ProductModel(
+                **product_data.model_dump(exclude={"id", "thumbnails"})
+            )
             self.session.add(new_product)
             await self.session.flush()
             await self.session.refresh(new_product)
+            await self._notify(ProductEventTypeEnum.CREATED, new_product)
             return convert_db_model_to_entity(new_product)
         except Exception as e:
-            raise DatabaseException(str(e))
+            raise database_exception(e)
 
     async def update_product(
         self, product_id: UUID, update_fields: dict[str, Any]
     ) -> None:
         try:
             existing_product = await self.session.get(ProductModel, product_id)
-            if existing_product:
+            if existing_product and existing_product.archived_at is None:
                 for key, value in update_fields.items():
                     setattr(existing_product, key, value)
                 self.session.add(existing_product)
                 await self.session.flush()
+                await self.session.refresh(existing_product, ["change_seq"])
+                await self._notify(ProductEventTypeEnum.UPDATED, existing_product)
             else:
                 raise NoResultFoundException("Product not found")
         except NoResultFoundException:
             raise
         except Exception as e:
-            raise DatabaseException(str(e))
+            raise database_exception(e)
+
+    async def archive_product(self, product_id: UUID) -> None:
+        try:
+            existing_product = await self.session.get(ProductModel, product_id)
+            if not existing_product or existing_product.archived_at is not None:
+                raise NoResultFoundException("Product not found")
+            existing_product.archived_at = datetime.now()
+            await self.session.flush()
+            await self.session.refresh(existing_product, ["change_seq"])
+            await self._notify(ProductEventTypeEnum.ARCHIVED, existing_product)
+        except NoResultFoundException:
+            raise
+        except Exception as e:
+            raise database_exception(e)
+
+    async def list_changes(self, since: int, limit: int) -> ChangeFeed:
+        try:
+            query = (
+                # Rows past the horizon may still be joined by lower ones
+                # from running transactions, so they wait for a later read
+                SELECT_PRODUCT_ROWS.where(
+                    ProductModel.change_seq > since,
+                    ProductModel.change_seq < func.product_change_horizon(),
+                )
+                .order_by(ProductModel.change_seq)
+                .limit(limit + 1)
+            )
+            result = await self.session.execute(query)
+            products = result.mappings().all()
+            items = [convert_row_to_entity(product) for product in products[:limit]]
+            return ChangeFeed(
+                items=items,
+                next_token=items[-1].change_seq if items else since,
+                has_more=len(products) > limit,
+            )
+        except Exception as e:
+            raise database_exception(e)
+
+    async def _notify(self, event_type: ProductEventTypeEnum, model: ProductModel):
+        # NOTIFY is transactional: listeners only see it once the write commits
+        event = ProductEvent(
+            type=event_type, product_id=model.id, change_seq=model.change_seq
+        )
+        await self.session.execute(
+            select(func.pg_notify(PRODUCT_EVENTS_CHANNEL, event.model_dump_json()))
+        )
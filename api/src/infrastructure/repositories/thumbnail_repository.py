@@ -0,0 +1,35 @@
+from sqlalchemy.dialects.postgresql import insert
+
+from src.adapters.convert_db_model import convert_thumbnail_model_to_entity
+from src.domain.entities.thumbnail import Thumbnail
+from src.domain.repositories.thumbnail_repository import ThumbnailRepository
+from src.infrastructure.database.models import ThumbnailModel
+from src.infrastructure.repositories.base import (
+    SQLAlchemyRepository,
+    database_exception,
+)
+
+
+class SQLAlchemyThumbnailRepository(SQLAlchemyRepository, ThumbnailRepository):
+    async def save_thumbnails(self, thumbnails: list[Thumbnail]) -> None:
+        if not thumbnails:
+            return
+        try:
+            # Renditions are content-addressed, so a picture that was already
+            # processed keeps its existing rows.
+            query = (
+                insert(ThumbnailModel)
+                .values([thumbnail.model_dump() for thumbnail in thumbnails])
+                .on_conflict_do_nothing()
+            )
+            await self.session.execute(query)
+        except Exception as e:
+            raise database_exception(e)
+
+    async def get_thumbnail(
+        self, digest: str, size: int, image_format: str
+    ) -> Thumbnail | None:
+        result = await self.session.get(ThumbnailModel, (digest, size, image_format))
+        if result:
+            return convert_thumbnail_model_to_entity(result)
+        return None
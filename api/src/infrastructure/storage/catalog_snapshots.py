@@ -0,0 +1,309 @@
+import os
+import re
+import shutil
+import sqlite3
+import tempfile
+from collections.abc import AsyncIterator
+from contextlib import closing, suppress
+from datetime import datetime
+
+from src.domain.entities.catalog_snapshot import CatalogChanges, CatalogSnapshot
+from src.domain.entities.product import Product, SellingPlaceEnum
+from src.domain.services.catalog_snapshot_store import CatalogSnapshotStore
+from src.infrastructure.executors.pools import thread_pool
+
+FORMAT_VERSION = 1
+MEDIA_TYPE = "application/vnd.sqlite3"
+
+# Ids are the 16 bytes of the UUID and prices are in cents, which keeps rows
+# small; pictures are left out, devices fetch thumbnails when online.
+PRODUCTS_TABLE = """
+    CREATE TABLE products (
+        id BLOB PRIMARY KEY,
+        ean TEXT NOT NULL,
+        name TEXT NOT NULL,
+        description TEXT NOT NULL,
+        price_cents INTEGER NOT NULL,
+        selling_place TEXT NOT NULL,
+        change_seq INTEGER NOT NULL
+    ) WITHOUT ROWID
+"""
+META_TABLE = "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID"
+REMOVED_TABLE = "CREATE TABLE removed (id BLOB PRIMARY KEY) WITHOUT ROWID"
+# Built once the rows are in, which is faster than keeping it up while loading
+EAN_INDEX = "CREATE INDEX IF NOT EXISTS ix_products_ean ON products (ean)"
+
+UPSERT_PRODUCT = "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?, ?, ?, ?)"
+DELETE_PRODUCT = "DELETE FROM products WHERE id = ?"
+DELTA_LISTED = """
+    INSERT INTO main.products
+    SELECT new_product.* FROM new.products AS new_product
+    LEFT JOIN old.products AS old_product ON old_product.id = new_product.id
+    WHERE old_product.id IS NULL
+        OR old_product.change_seq != new_product.change_seq
+"""
+DELTA_REMOVED = """
+    INSERT INTO main.removed
+    SELECT old_product.id FROM old.products AS old_product
+    WHERE NOT EXISTS (
+        SELECT 1 FROM new.products AS new_product
+        WHERE new_product.id = old_product.id
+    )
+"""
+
+SNAPSHOT_NAME = re.compile(r"snapshot-(?P<scope>\w+)-(?P<version>\d+)\.sqlite")
+DELTA_NAME = re.compile(r"delta-(?P<scope>\w+)-(?P<since>\d+)-(?P<version>\d+)\.sqlite")
+
+
+def _product_row(product: Product) -> tuple:
+    # Products come from the change feed, so they always have an id
+    if product.id is None:
+        raise ValueError(f"Product {product.ean} has no id")
+    return (
+        product.id.bytes,
+        product.ean,
+        product.name,
+        product.description,
+        int(product.price * 100),
+        product.selling_place.value,
+        product.change_seq,
+    )
+
+
+class SQLiteCatalogSnapshotStore(CatalogSnapshotStore):
+    """Catalog snapshots and deltas as SQLite files on the local filesystem.
+
+    A snapshot has a products table indexed by EAN and a meta table with its
+    version and selling place. A delta has the products to insert or replace
+    and the ids to delete in a removed table. Files are written under a
+    temporary name and renamed once complete, so readers never see a
+    partial one, and are named by version, so workers sharing the directory
+    reuse each other's files.
+    """
+
+    def __init__(self, base_path: str):
+        self.base_path = base_path
+
+    async def latest(
+        self, selling_place: SellingPlaceEnum | None
+    ) -> CatalogSnapshot | None:
+        versions = await thread_pool.run(self._snapshot_versions, selling_place)
+        if not versions:
+            return None
+        return await self.get(selling_place, versions[-1])
+
+    async def get(
+        self, selling_place: SellingPlaceEnum | None, version: int
+    ) -> CatalogSnapshot | None:
+        with suppress(FileNotFoundError):
+            return await thread_pool.run(
+                self._read, self._snapshot_path(selling_place, version)
+            )
+        return None
+
+    async def write_snapshot(
+        self,
+        selling_place: SellingPlaceEnum | None,
+        base: CatalogSnapshot | None,
+        changes: AsyncIterator[CatalogChanges],
+    ) -> CatalogSnapshot:
+        os.makedirs(self.base_path, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.base_path, suffix=".part")
+        os.close(fd)
+        try:
+            if base:
+                await thread_pool.run(shutil.copyfile, base.location, temp_path)
+            db = await thread_pool.run(self._open, temp_path)
+            try:
+                db.execute("BEGIN")
+                if not base:
+                    db.execute(META_TABLE)
+                    db.execute(PRODUCTS_TABLE)
+                version = base.version if base else 0
+                async for batch in changes:
+                    await thread_pool.run(self._apply, db, batch)
+                    version = batch.version
+                await thread_pool.run(self._finish_snapshot, db, selling_place, version)
+            finally:
+                db.close()
+            location = self._snapshot_path(selling_place, version)
+            os.replace(temp_path, location)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return await thread_pool.run(self._read, location)
+
+    async def get_delta(
+        self, base: CatalogSnapshot, snapshot: CatalogSnapshot
+    ) -> CatalogSnapshot:
+        location = self._delta_path(
+            snapshot.selling_place, base.version, snapshot.version
+        )
+        with suppress(FileNotFoundError):
+            return await thread_pool.run(self._read, location)
+        await thread_pool.run(self._write_delta, base, snapshot, location)
+        return await thread_pool.run(self._read, location)
+
+    async def prune(
+        self, selling_place: SellingPlaceEnum | None, created_before: datetime
+    ) -> int:
+        return await thread_pool.run(self._prune, selling_place, created_before)
+
+    @staticmethod
+    def _open(location: str) -> sqlite3.Connection:
+        # Used from one pool thread at a time; the file is only renamed into
+        # place once complete, so a crash needs no journal to recover from
+        db = sqlite3.connect(location, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        return db
+
+    @staticmethod
+    def _apply(db: sqlite3.Connection, changes: CatalogChanges) -> None:
+        db.executemany(
+            UPSERT_PRODUCT, [_product_row(product) for product in changes.listed]
+        )
+        db.executemany(
+            DELETE_PRODUCT, [(product_id.bytes,) for product_id in changes.removed]
+        )
+
+    def _finish_snapshot(
+        self,
+        db: sqlite3.Connection,
+        selling_place: SellingPlaceEnum | None,
+        version: int,
+    ) -> None:
+        db.execute(EAN_INDEX)
+        (products,) = db.execute("SELECT count(*) FROM products").fetchone()
+        self._write_meta(
+            db,
+            kind="snapshot",
+            selling_place=selling_place.value if selling_place else None,
+            version=version,
+            products=products,
+        )
+        db.execute("COMMIT")
+        # Rows arrive in change order, not id order, and the rows replaced
+        # since the base leave free pages; rewriting the file packs them
+        db.execute("VACUUM")
+
+    def _write_delta(
+        self, base: CatalogSnapshot, snapshot: CatalogSnapshot, location: str
+    ) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.base_path, suffix=".part")
+        os.close(fd)
+        try:
+            with closing(self._open(temp_path)) as db:
+                db.execute("ATTACH DATABASE ? AS old", (base.location,))
+                db.execute("ATTACH DATABASE ? AS new", (snapshot.location,))
+                db.execute("BEGIN")
+                for statement in (META_TABLE, PRODUCTS_TABLE, REMOVED_TABLE):
+                    db.execute(statement)
+                listed = db.execute(DELTA_LISTED).rowcount
+                removed = db.execute(DELTA_REMOVED).rowcount
+                self._write_meta(
+                    db,
+                    kind="delta",
+                    selling_place=(
+                        snapshot.selling_place.value if snapshot.selling_place else None
+                    ),
+                    since_version=base.version,
+                    version=snapshot.version,
+                    products=listed,
+                    removed=removed,
+                )
+                db.execute("COMMIT")
+            os.replace(temp_path, location)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    @staticmethod
+    def _write_meta(db: sqlite3.Connection, **values) -> None:
+        values |= {"format": FORMAT_VERSION, "created_at": datetime.now().isoformat()}
+        db.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [
+                (key, None if value is None else str(value))
+                for key, value in values.items()
+            ],
+        )
+
+    @staticmethod
+    def _read(location: str) -> CatalogSnapshot:
+        size = os.path.getsize(location)
+        with closing(sqlite3.connect(f"file:{location}?mode=ro", uri=True)) as db:
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+        return CatalogSnapshot(
+            selling_place=meta["selling_place"],
+            version=meta["version"],
+            since_version=meta.get("since_version"),
+            products=meta["products"],
+            removed=meta.get("removed", 0),
+            size=size,
+            created_at=meta["created_at"],
+            location=location,
+        )
+
+    def _prune(
+        self, selling_place: SellingPlaceEnum | None, created_before: datetime
+    ) -> int:
+        versions = self._snapshot_versions(selling_place)
+        kept = set(versions[-1:])
+        deleted = 0
+        for version in versions[:-1]:
+            location = self._snapshot_path(selling_place, version)
+            with suppress(FileNotFoundError):
+                if datetime.fromtimestamp(os.path.getmtime(location)) < created_before:
+                    os.remove(location)
+                    deleted += 1
+                    continue
+            kept.add(version)
+        for name in self._names():
+            location = os.path.join(self.base_path, name)
+            match = DELTA_NAME.fullmatch(name)
+            with suppress(FileNotFoundError):
+                # A delta is only of use while both of its snapshots are
+                # kept, and a temporary file was left by a writer that crashed
+                stale_delta = (
+                    match
+                    and match["scope"] == self._scope(selling_place)
+                    and not {int(match["since"]), int(match["version"])} <= kept
+                )
+                if stale_delta or (
+                    name.endswith(".part")
+                    and datetime.fromtimestamp(os.path.getmtime(location))
+                    < created_before
+                ):
+                    os.remove(location)
+        return deleted
+
+    def _snapshot_versions(self, selling_place: SellingPlaceEnum | None) -> list[int]:
+        scope = self._scope(selling_place)
+        return sorted(
+            int(match["version"])
+            for name in self._names()
+            if (match := SNAPSHOT_NAME.fullmatch(name)) and match["scope"] == scope
+        )
+
+    def _names(self) -> list[str]:
+        try:
+            return os.listdir(self.base_path)
+        except FileNotFoundError:
+            return []
+
+    def _snapshot_path(
+        self, selling_place: SellingPlaceEnum | None, version: int
+    ) -> str:
+        name = f"snapshot-{self._scope(selling_place)}-{version}.sqlite"
+        return os.path.join(self.base_path, name)
+
+    def _delta_path(
+        self, selling_place: SellingPlaceEnum | None, since: int, version: int
+    ) -> str:
+        name = f"delta-{self._scope(selling_place)}-{since}-{version}.sqlite"
+        return os.path.join(self.base_path, name)
+
+    @staticmethod
+    def _scope(selling_place: SellingPlaceEnum | None) -> str:
+        return selling_place.value if selling_place else "all"
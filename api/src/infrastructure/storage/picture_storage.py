@@ -0,0 +1,135 @@
+import hashlib
+import os
+import tempfile
+from contextlib import suppress
+from collections.abc import AsyncIterator
+from typing import BinaryIO
+
+from src.application.exceptions.exceptions import (
+    InvalidPictureException,
+    PictureTooLargeException,
+)
+from src.domain.entities.picture import (
+    PICTURE_CONTENT_TYPES,
+    StoredPicture,
+    sniff_content_type,
+)
+from src.domain.services.picture_storage import PictureStorage
+from src.infrastructure.executors.pools import thread_pool
+
+SNIFF_BYTES = 16
+
+
+class FilesystemPictureStorage(PictureStorage):
+    """Content-addressed picture storage on the local filesystem.
+
+    Uploads are written chunk by chunk to a temporary file and renamed to
+    their sha256 digest once complete, so a picture is never held in memory.
+    """
+
+    def __init__(self, base_path: str, max_bytes: int):
+        self.base_path = base_path
+        self.max_bytes = max_bytes
+
+    async def save(
+        self, chunks: AsyncIterator[bytes], content_type: str
+    ) -> StoredPicture:
+        content_type = content_type.split(";")[0].strip().lower()
+        if content_type not in PICTURE_CONTENT_TYPES:
+            raise InvalidPictureException(
+                f"Unsupported picture content type: {content_type or 'none'}"
+            )
+
+        fd, temp_path = await thread_pool.run(self._create_temp_file)
+        digest = hashlib.sha256()
+        head = b""
+        size = 0
+        try:
+            file = os.fdopen(fd, "wb")
+            try:
+                async for chunk in chunks:
+                    if len(head) < SNIFF_BYTES:
+                        head += chunk[: SNIFF_BYTES - len(head)]
+                        if len(head) == SNIFF_BYTES:
+                            self._check_content_type(head, content_type)
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise PictureTooLargeException(
+                            f"Picture exceeds the limit of {self.max_bytes} bytes"
+                        )
+                    await thread_pool.run(self._write, file, digest, chunk)
+            finally:
+                await thread_pool.run(file.close)
+            if size == 0:
+                raise InvalidPictureException("Picture is empty")
+            if len(head) < SNIFF_BYTES:
+                self._check_content_type(head, content_type)
+            location = os.path.join(self.base_path, digest.hexdigest())
+            created = await thread_pool.run(self._publish, temp_path, location)
+        except BaseException:
+            await thread_pool.run(self._discard, temp_path)
+            raise
+
+        return StoredPicture(
+            digest=digest.hexdigest(),
+            size=size,
+            content_type=content_type,
+            location=location,
+            created=created,
+        )
+
+    def _create_temp_file(self) -> tuple[int, str]:
+        os.makedirs(self.base_path, exist_ok=True)
+        return tempfile.mkstemp(dir=self.base_path, suffix=".part")
+
+    @staticmethod
+    def _publish(temp_path: str, location: str) -> bool:
+        # Linking fails if the file exists, so of two uploads of the same
+        # picture only one reports creating it and may delete it on failure
+        try:
+            os.link(temp_path, location)
+            return True
+        except FileExistsError:
+            return False
+        finally:
+            os.remove(temp_path)
+
+    @staticmethod
+    def _discard(temp_path: str) -> None:
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+
+    @staticmethod
+    def _write(file: BinaryIO, digest, chunk: bytes) -> None:
+        # Hashing releases the GIL, so it runs alongside the loop too
+        digest.update(chunk)
+        file.write(chunk)
+
+    def _check_content_type(self, head: bytes, content_type: str) -> None:
+        if sniff_content_type(head) != content_type:
+            raise InvalidPictureException(
+                f"Picture content does not match {content_type}"
+            )
+
+    async def get(self, digest: str) -> StoredPicture | None:
+        location = os.path.join(self.base_path, os.path.basename(digest))
+        try:
+            head, size = await thread_pool.run(self._read_head, location)
+        except FileNotFoundError:
+            return None
+        return StoredPicture(
+            digest=digest,
+            size=size,
+            content_type=sniff_content_type(head) or "application/octet-stream",
+            location=location,
+        )
+
+    @staticmethod
+    def _read_head(location: str) -> tuple[bytes, int]:
+        with open(location, "rb") as file:
+            return file.read(SNIFF_BYTES), os.fstat(file.fileno()).st_size
+
+    async def delete(self, digest: str) -> None:
+        location = os.path.join(self.base_path, os.path.basename(digest))
+        with suppress(FileNotFoundError):
+            await thread_pool.run(os.remove, location)
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import ProductModel, ThumbnailModel
+from src.infrastructure.storage.picture_storage import FilesystemPictureStorage
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+async def purge_archived_products(older_than: timedelta, batch_size: int) -> int:
+    """Hard-delete products archived before the cutoff, one batch per transaction
+
+    Pictures and thumbnails are content-addressed and may be shared, so they
+    are only removed once no remaining product refers to their digest.
+    """
+    picture_storage = FilesystemPictureStorage(
+        base_path=settings.picture_storage_path,
+        max_bytes=settings.picture_max_bytes,
+    )
+    cutoff = datetime.now() - older_than
+    purged = 0
+    async with connection.async_session_maker() as session:
+        while True:
+            # Served by the partial index on archived_at; short transactions
+            # keep row locks and WAL bursts small on large purges.
+            batch = (
+                select(ProductModel.id)
+                .where(
+                    ProductModel.archived_at.is_not(None),
+                    ProductModel.archived_at < cutoff,
+                )
+                .order_by(ProductModel.archived_at)
+                .limit(batch_size)
+            )
+            result = await session.execute(
+                delete(ProductModel)
+                .where(ProductModel.id.in_(batch.scalar_subquery()))
+                .returning(ProductModel.picture_digest)
+            )
+            deleted = result.scalars().all()
+            if not deleted:
+                break
+            digests = {digest for digest in deleted if digest}
+            referenced = await session.execute(
+                select(ProductModel.picture_digest).where(
+                    ProductModel.picture_digest.in_(digests)
+                )
+            )
+            unreferenced = digests - set(referenced.scalars())
+            if unreferenced:
+                await session.execute(
+                    delete(ThumbnailModel).where(
+                        ThumbnailModel.digest.in_(unreferenced)
+                    )
+                )
+            await session.commit()
+            # Files go once the rows are gone, so a failed commit keeps them
+            for digest in unreferenced:
+                await picture_storage.delete(digest)
+            purged += len(deleted)
+            logger.info(f"Purged {purged} archived products so far")
+
+    return purged
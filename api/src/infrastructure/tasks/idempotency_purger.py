@@ -0,0 +1,38 @@
+import asyncio
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.repositories.idempotency_repository import (
+    SQLAlchemyIdempotencyRepository,
+)
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+PURGE_BATCH_SIZE = 1000
+
+
+async def purge_idempotency_keys() -> int:
+    """Delete expired idempotency keys in batches"""
+    purged = 0
+    while True:
+        async with connection.async_session_maker() as session:
+            repository = SQLAlchemyIdempotencyRepository(session)
+            deleted = await repository.purge_expired(PURGE_BATCH_SIZE)
+            await session.commit()
+        purged += deleted
+        if deleted < PURGE_BATCH_SIZE:
+            return purged
+
+
+async def run_idempotency_purger() -> None:
+    while True:
+        try:
+            purged = await purge_idempotency_keys()
+            if purged:
+                logger.info(f"Purged {purged} expired idempotency keys")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Idempotency key purge failed: {e}")
+        await asyncio.sleep(settings.idempotency_purge_interval_seconds)
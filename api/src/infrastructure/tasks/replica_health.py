@@ -0,0 +1,18 @@
+import asyncio
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+async def run_replica_health_checks() -> None:
+    while True:
+        try:
+            await connection.replica_router.check_health()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Read replica health check failed: {e}")
+        await asyncio.sleep(settings.replica_health_check_seconds)
@@ -0,0 +1,33 @@
+import asyncio
+from datetime import timedelta
+
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.repositories.catalog_stats_repository import (
+    SQLAlchemyCatalogStatsRepository,
+)
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+async def refresh_catalog_stats() -> None:
+    """Refresh the catalog stats summary unless another worker just did"""
+    interval = timedelta(seconds=settings.stats_refresh_interval_seconds)
+    async with connection.async_session_maker() as session:
+        repository = SQLAlchemyCatalogStatsRepository(
+            session, daily_window_days=settings.stats_daily_window_days
+        )
+        await repository.refresh_stats(max_age=interval)
+        await session.commit()
+
+
+async def run_stats_refresher() -> None:
+    while True:
+        try:
+            await refresh_catalog_stats()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Catalog stats refresh failed: {e}")
+        await asyncio.sleep(settings.stats_refresh_interval_seconds)
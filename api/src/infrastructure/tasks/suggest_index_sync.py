@@ -0,0 +1,142 @@
+import asyncio
+from uuid import UUID
+
+from src.domain.entities.product_suggestion import ProductSuggestion
+from src.domain.repositories.product_repository import ProductRepository
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.events.broker import ProductEventBroker, Subscription
+from src.infrastructure.executors.pools import thread_pool
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+from src.utils.logs import get_logger
+from src.utils.prefix_index import PrefixIndex
+
+logger = get_logger(__name__)
+
+SuggestIndex = PrefixIndex[UUID, ProductSuggestion]
+
+
+async def read_changes(
+    repository: ProductRepository, since: int
+) -> tuple[dict[UUID, ProductSuggestion | None], int]:
+    """Latest change of each product after since, None once archived, and
+    the last change_seq read"""
+    # Products changed while the feed is paged through show up again further on
+    changes: dict[UUID, ProductSuggestion | None] = {}
+    while True:
+        feed = await repository.list_changes(
+            since=since, limit=settings.suggest_sync_batch_size
+        )
+        for product in feed.items:
+            # The feed only returns stored products, which all have an id
+            if product.id is None:
+                raise ValueError(f"Product {product.ean} in the feed has no id")
+            changes[product.id] = (
+                None
+                if product.archived_at is not None
+                else ProductSuggestion(
+                    id=product.id, name=product.name, ean=product.ean
+                )
+            )
+        since = feed.next_token
+        if not feed.has_more:
+            return changes, since
+
+
+def apply_changes(
+    index: SuggestIndex, changes: dict[UUID, ProductSuggestion | None]
+) -> None:
+    # Applied together, so loading the catalog sorts the index only once
+    for product_id, suggestion in changes.items():
+        if suggestion is None:
+            index.remove(product_id)
+    index.put_many(
+        (product_id, suggestion.name, suggestion, (suggestion.ean,))
+        for product_id, suggestion in changes.items()
+        if suggestion is not None
+    )
+
+
+async def sync_suggest_index(
+    index: SuggestIndex, repository: ProductRepository, since: int
+) -> int:
+    """Apply the product changes after since, returning the last one applied"""
+    changes, since = await read_changes(repository, since)
+    apply_changes(index, changes)
+    return since
+
+
+async def sync_from_database(index: SuggestIndex, since: int) -> int:
+    # Catching up reads the primary, which has every change a notification
+    # announces
+    async with connection.async_session_maker() as session:
+        return await sync_suggest_index(
+            index, SQLAlchemyProductRepository(session), since
+        )
+
+
+async def load_suggest_index(index: SuggestIndex) -> int:
+    """Replace the index with one of the whole catalog.
+
+    The catalog is read from a replica and indexed on the thread pool into a
+    separate index, which takes seconds of CPU for large catalogs, so the
+    worker serves requests meanwhile; suggestions are empty until the new
+    index is swapped in.
+    """
+    read_engine = connection.replica_router.read_engine()
+    async with connection.async_session_maker(bind=read_engine) as session:
+        changes, since = await read_changes(SQLAlchemyProductRepository(session), 0)
+    loaded = SuggestIndex(max_scan=index.max_scan)
+    await thread_pool.run(apply_changes, loaded, changes)
+    index.replace(loaded)
+    logger.info(f"Loaded {len(index)} products into the suggest index")
+    return since
+
+
+async def run_suggest_index_sync(
+    index: SuggestIndex, broker: ProductEventBroker
+) -> None:
+    """Load the catalog, then follow the change feed, waking on product
+    events from any worker.
+
+    Events only say that something changed; the feed is read from the last
+    applied change_seq, so missed or dropped events are caught up on the
+    next wake-up, at the latest after suggest_sync_interval_seconds.
+    """
+    subscription: Subscription | None = None
+    since: int | None = None
+    try:
+        while True:
+            # Subscribed before reading the feed, so no change slips between
+            if subscription is None or subscription.dropped:
+                subscription = await subscribe(broker)
+            try:
+                if since is None:
+                    since = await load_suggest_index(index)
+                else:
+                    since = await sync_from_database(index, since)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Suggest index sync failed: {e}")
+
+            if subscription is None or since is None:
+                await asyncio.sleep(settings.suggest_sync_interval_seconds)
+                continue
+            await subscription.get(timeout=settings.suggest_sync_interval_seconds)
+            # A burst of writes is caught up in a single read of the feed
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+    finally:
+        if subscription is not None:
+            broker.unsubscribe(subscription)
+
+
+async def subscribe(broker: ProductEventBroker) -> Subscription | None:
+    try:
+        return await broker.subscribe()
+    except Exception as e:
+        logger.warning(f"Suggest index falls back to polling: {e}")
+        return None
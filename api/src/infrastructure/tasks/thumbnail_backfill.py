@@ -0,0 +1,48 @@
+from sqlalchemy import select
+
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import ProductModel
+from src.infrastructure.images.thumbnails import PillowThumbnailGenerator
+from src.infrastructure.repositories.thumbnail_repository import (
+    SQLAlchemyThumbnailRepository,
+)
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+async def backfill_thumbnails(batch_size: int) -> int:
+    """Generate thumbnails for products whose picture has none yet"""
+    generator = PillowThumbnailGenerator()
+    processed = 0
+    async with connection.async_session_maker() as session:
+        repository = SQLAlchemyThumbnailRepository(session)
+        while True:
+            result = await session.execute(
+                select(ProductModel)
+                .where(
+                    ProductModel.picture.is_not(None),
+                    ProductModel.picture_digest.is_(None),
+                )
+                .limit(batch_size)
+            )
+            products = result.scalars().all()
+            if not products:
+                break
+
+            for product in products:
+                try:
+                    thumbnails = await generator.generate(product.picture)
+                except Exception as e:
+                    logger.warning(f"Skipping picture of product {product.id}: {e}")
+                    # Empty digest marks the row as processed without thumbnails
+                    product.picture_digest = ""
+                    continue
+                await repository.save_thumbnails(thumbnails)
+                product.picture_digest = thumbnails[0].digest
+                processed += 1
+
+            await session.commit()
+            logger.info(f"Generated thumbnails for {processed} products so far")
+
+    return processed
@@ -0,0 +1,29 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class LRUCache[T]:
+    """Least-recently-used cache bounded by the total size of its values."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._items: OrderedDict[Hashable, tuple[T, int]] = OrderedDict()
+
+    def get(self, key: Hashable) -> T | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def set(self, key: Hashable, value: T, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        if key in self._items:
+            self.current_bytes -= self._items.pop(key)[1]
+        self._items[key] = (value, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.current_bytes -= evicted_size
@@ -0,0 +1,83 @@
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    """Import times of a module and everything it imports, in import order"""
+
+    module: str
+    timings: list[ImportTiming]
+
+    @property
+    def total_ms(self) -> float:
+        return sum(timing.self_ms for timing in self.timings)
+
+    def imported(self, module: str) -> bool:
+        """Whether module, or any of its submodules, was imported"""
+        return any(
+            timing.module == module or timing.module.startswith(f"{module}.")
+            for timing in self.timings
+        )
+
+    def slowest(self, count: int) -> list[ImportTiming]:
+        return sorted(self.timings, key=lambda timing: -timing.self_ms)[:count]
+
+    def by_package(self) -> dict[str, float]:
+        """Own import time summed per top-level package, slowest first"""
+        totals: defaultdict[str, float] = defaultdict(float)
+        for timing in self.timings:
+            totals[timing.module.split(".")[0]] += timing.self_ms
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def profile_imports(module: str) -> ImportProfile:
+    """Import module in a fresh interpreter under -X importtime.
+
+    Modules the interpreter imports at startup and exit are left out.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or line.endswith("imported package"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    # The module's own imports are the lines since the previous top-level
+    # one; the interpreter's startup and exit imports are around them
+    end = max(
+        position
+        for position, timing in enumerate(timings)
+        if timing.depth == 0 and timing.module == module
+    )
+    start = max(
+        (position + 1 for position in range(end) if timings[position].depth == 0),
+        default=0,
+    )
+    return ImportProfile(module=module, timings=timings[start : end + 1])
@@ -0,0 +1,136 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import asdict, dataclass
+
+from src.utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class SlowCallback:
+    detected_at: float
+    blocked_ms: float
+    stack: list[str]
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop runs a timer scheduled every interval.
+
+    The last window samples give lag percentiles. A watchdog thread notices
+    when the loop stops ticking for longer than slow_callback seconds and
+    samples the stack of the loop thread, which is the callback blocking it.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        window: int = 600,
+        slow_callback: float = 0.1,
+        max_slow_callbacks: int = 20,
+    ):
+        self.interval = interval
+        self.slow_callback = slow_callback
+        self.lag = 0.0
+        self.slow_callback_count = 0
+        self._samples: deque[float] = deque(maxlen=window)
+        self._slow_callbacks: deque[SlowCallback] = deque(maxlen=max_slow_callbacks)
+        self._last_tick = time.monotonic()
+        self._ticks = 0
+        self._stall: SlowCallback | None = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopped = threading.Event()
+        watchdog = threading.Thread(
+            target=self._watch,
+            args=(threading.get_ident(), stopped),
+            name="loop-lag-watchdog",
+            daemon=True,
+        )
+        self._last_tick = time.monotonic()
+        watchdog.start()
+        try:
+            while True:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                self.record(max(0.0, loop.time() - expected))
+        finally:
+            stopped.set()
+
+    def record(self, lag: float) -> None:
+        self.lag = lag
+        self._samples.append(lag)
+        self._last_tick = time.monotonic()
+        self._ticks += 1
+        stall, self._stall = self._stall, None
+        if stall and lag * 1000 > stall.blocked_ms:
+            # The watchdog only saw the start of the stall
+            stall.blocked_ms = round(lag * 1000, 3)
+
+    def percentiles(self) -> dict[str, float]:
+        """Lag percentiles of the recent samples, in milliseconds"""
+        samples = sorted(self._samples)
+        if not samples:
+            return {**{f"p{p}": 0.0 for p in PERCENTILES}, "max": 0.0}
+        stats = {
+            f"p{p}": samples[min(len(samples) - 1, len(samples) * p // 100)] * 1000
+            for p in PERCENTILES
+        }
+        stats["max"] = samples[-1] * 1000
+        return {name: round(value, 3) for name, value in stats.items()}
+
+    def slow_callbacks(self) -> list[dict]:
+        return [asdict(callback) for callback in self._slow_callbacks]
+
+    def _watch(self, loop_thread: int, stopped: threading.Event) -> None:
+        reported = -1
+        while not stopped.wait(self.slow_callback / 2):
+            ticks = self._ticks
+            blocked = time.monotonic() - self._last_tick - self.interval
+            if blocked < self.slow_callback or ticks == reported:
+                continue
+            frame = sys._current_frames().get(loop_thread)
+            if frame is None:
+                continue
+            # Reported once per stall, with the stack the loop is stuck in
+            reported = ticks
+            stack = traceback.format_stack(frame)
+            self.slow_callback_count += 1
+            self._stall = SlowCallback(
+                detected_at=time.time(),
+                blocked_ms=round(blocked * 1000, 3),
+                stack=stack,
+            )
+            self._slow_callbacks.append(self._stall)
+            logger.warning(
+                f"Event loop blocked for over {blocked * 1000:.0f}ms in:\n"
+                + "".join(stack[-5:])
+            )
+
+
+class RecentMax:
+    """Largest value recorded within the last window seconds."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._value = 0.0
+        self._recorded_at = 0.0
+
+    def record(self, value: float) -> None:
+        now = time.monotonic()
+        if value >= self._value or now - self._recorded_at > self.window:
+            self._value = value
+            self._recorded_at = now
+
+    @property
+    def value(self) -> float:
+        if time.monotonic() - self._recorded_at > self.window:
+            return 0.0
+        return self._value
@@ -0,0 +1,158 @@
+import bisect
+import heapq
+import itertools
+from collections.abc import Iterable, Iterator
+
+# Past this many new rows, appending and sorting once is cheaper than moving
+# the tail of the sorted lists for each insert
+BULK_SORT_MIN_ROWS = 64
+
+
+def trigrams(text: str) -> set[str]:
+    text = text.lower()
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class PrefixIndex[K, V]:
+    """Typeahead index over short texts, such as product names.
+
+    Matches are ranked in three stages, each only run while fewer than limit
+    results were found:
+
+    1. texts starting with the query, read in order from a sorted list of
+       the lowercase texts;
+    2. entries where every query word starts one of their terms, found in a
+       sorted (term, handle) list of the words of each text plus any extra
+       terms such as codes, and ranked by text;
+    3. texts containing the query anywhere, found through a trigram index.
+
+    Stages 2 and 3 rank at most max_scan entries, which bounds the cost of
+    short queries that match much of the index.
+
+    The lists and trigram sets refer to entries by an int handle rather than
+    by key, so sorting them never falls back to comparing keys in Python.
+    """
+
+    def __init__(self, max_scan: int):
+        self.max_scan = max_scan
+        self._handles: dict[K, int] = {}
+        self._entries: dict[int, tuple[str, tuple[str, ...], V]] = {}
+        self._texts: list[tuple[str, int]] = []
+        self._terms: list[tuple[str, int]] = []
+        self._trigrams: dict[str, set[int]] = {}
+        self._next_handle = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def put(self, key: K, text: str, value: V, terms: Iterable[str] = ()) -> None:
+        self.put_many([(key, text, value, terms)])
+
+    def put_many(self, entries: Iterable[tuple[K, str, V, Iterable[str]]]) -> None:
+        texts: list[tuple[str, int]] = []
+        terms: list[tuple[str, int]] = []
+        # Only the last entry of a key counts, as the new rows are not in the
+        # sorted lists yet for remove to find
+        latest = {entry[0]: entry for entry in entries}
+        for key, text, value, extra_terms in latest.values():
+            self.remove(key)
+            handle = self._handles[key] = next(self._next_handle)
+            lowered = text.lower()
+            indexed = tuple(
+                set(lowered.split()) | {term.lower() for term in extra_terms}
+            )
+            self._entries[handle] = (lowered, indexed, value)
+            texts.append((lowered, handle))
+            terms.extend((term, handle) for term in indexed)
+            for trigram in trigrams(lowered):
+                self._trigrams.setdefault(trigram, set()).add(handle)
+        for rows, new_rows in ((self._texts, texts), (self._terms, terms)):
+            if len(new_rows) < BULK_SORT_MIN_ROWS:
+                for row in new_rows:
+                    bisect.insort(rows, row)
+            else:
+                rows.extend(new_rows)
+                rows.sort()
+
+    def replace(self, other: "PrefixIndex[K, V]") -> None:
+        """Take over the entries of other, such as an index built elsewhere"""
+        self._handles = other._handles
+        self._entries = other._entries
+        self._texts = other._texts
+        self._terms = other._terms
+        self._trigrams = other._trigrams
+        self._next_handle = other._next_handle
+
+    def remove(self, key: K) -> None:
+        handle = self._handles.pop(key, None)
+        if handle is None:
+            return
+        lowered, indexed, _ = self._entries.pop(handle)
+        del self._texts[bisect.bisect_left(self._texts, (lowered, handle))]
+        for term in indexed:
+            del self._terms[bisect.bisect_left(self._terms, (term, handle))]
+        for trigram in trigrams(lowered):
+            handles = self._trigrams[trigram]
+            handles.discard(handle)
+            if not handles:
+                del self._trigrams[trigram]
+
+    def search(self, query: str, limit: int) -> list[V]:
+        words = query.lower().split()
+        if not words or limit < 1:
+            return []
+        phrase = " ".join(words)
+
+        found = list(
+            itertools.islice(
+                self._with_prefix(self._texts, phrase, unique=False), limit
+            )
+        )
+        seen = set(found)
+
+        if len(found) < limit:
+            ranked = []
+            # The longest word has the narrowest range of terms starting with it
+            candidates = self._with_prefix(self._terms, max(words, key=len))
+            for handle in itertools.islice(candidates, self.max_scan):
+                lowered, indexed, _ = self._entries[handle]
+                if handle not in seen and all(
+                    any(term.startswith(word) for term in indexed) for word in words
+                ):
+                    ranked.append((lowered, handle))
+            for _, handle in heapq.nsmallest(limit - len(found), ranked):
+                found.append(handle)
+                seen.add(handle)
+
+        if len(found) < limit and len(phrase) >= 3:
+            postings = min(
+                (self._trigrams.get(trigram, set()) for trigram in trigrams(phrase)),
+                key=len,
+            )
+            ranked = [
+                (lowered, handle)
+                for handle in itertools.islice(postings, self.max_scan)
+                if handle not in seen
+                and phrase in (lowered := self._entries[handle][0])
+            ]
+            found.extend(
+                handle for _, handle in heapq.nsmallest(limit - len(found), ranked)
+            )
+
+        return [self._entries[handle][2] for handle in found]
+
+    @staticmethod
+    def _with_prefix(
+        rows: list[tuple[str, int]], prefix: str, unique: bool = True
+    ) -> Iterator[int]:
+        """Handles of the rows whose text starts with prefix, in row order"""
+        seen: set[int] = set()
+        for position in range(bisect.bisect_left(rows, (prefix,)), len(rows)):
+            text, handle = rows[position]
+            if not text.startswith(prefix):
+                return
+            if not unique:
+                yield handle
+            elif handle not in seen:
+                seen.add(handle)
+                yield handle
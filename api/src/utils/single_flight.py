@@ -0,0 +1,80 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    executions: int = 0
+    shared: int = 0
+    errors: int = 0
+
+
+class SingleFlight[T]:
+    """Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight await the same result or exception. If the running caller
+    is cancelled, a waiting caller takes over and runs the function itself.
+    Calls only share a flight when scope, if given, returns the same value
+    for them. Per-key stats are kept for the most recent max_tracked_keys keys.
+    """
+
+    def __init__(
+        self,
+        max_tracked_keys: int = 1000,
+        scope: Callable[[], str] | None = None,
+    ):
+        self.max_tracked_keys = max_tracked_keys
+        self.scope = scope
+        self._in_flight: dict[tuple[str, str], asyncio.Future[T]] = {}
+        self._stats: OrderedDict[str, SingleFlightStats] = OrderedDict()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        stats = self._track(key)
+        stats.calls += 1
+        flight = (self.scope() if self.scope else "", key)
+        while (future := self._in_flight.get(flight)) is not None:
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    continue
+                raise
+            stats.shared += 1
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[flight] = future
+        stats.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            stats.errors += 1
+            future.set_exception(e)
+            # Mark retrieved so a flight without waiters does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[flight]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {key: asdict(stats) for key, stats in self._stats.items()}
+
+    def _track(self, key: str) -> SingleFlightStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = SingleFlightStats()
+            while len(self._stats) > self.max_tracked_keys:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        return stats
@@ -0,0 +1,101 @@
+import asyncio
+import pytest
+from collections.abc import Awaitable, Callable
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from testcontainers.postgres import PostgresContainer
+
+from src.infrastructure.database.connection import Base
+from src.infrastructure.database.models import ProductModel  # noqa: F401
+
+# The schema is created once in the template; each test worker clones it
+TEMPLATE_DATABASE = "stoq_template"
+
+postgres_key = pytest.StashKey[PostgresContainer]()
+server_url_key = pytest.StashKey[str]()
+
+
+async def create_template_database(server_url: str) -> None:
+    admin = create_async_engine(server_url, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as conn:
+        await conn.execute(text(f"CREATE DATABASE {TEMPLATE_DATABASE}"))
+    await admin.dispose()
+
+    engine = create_async_engine(make_url(server_url).set(database=TEMPLATE_DATABASE))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+async def clone_template_database(server_url: str, database: str) -> str:
+    """Create database as a copy of the template, returning its URL"""
+    admin = create_async_engine(server_url, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as conn:
+        await conn.execute(text(f"DROP DATABASE IF EXISTS {database}"))
+        await conn.execute(
+            text(f"CREATE DATABASE {database} TEMPLATE {TEMPLATE_DATABASE}")
+        )
+    await admin.dispose()
+    url = make_url(server_url).set(database=database)
+    return url.render_as_string(hide_password=False)
+
+
+def pytest_configure(config: pytest.Config):
+    """Start one PostgreSQL container and build the template database.
+
+    Runs in the controller only; with pytest-xdist (``pytest -n auto``) the
+    workers receive the server URL through pytest_configure_node.
+    """
+    if hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    postgres = PostgresContainer("postgres:16-alpine", driver="asyncpg")
+    postgres.start()
+    config.stash[postgres_key] = postgres
+    config.stash[server_url_key] = postgres.get_connection_url()
+    asyncio.run(create_template_database(config.stash[server_url_key]))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["test_server_url"] = node.config.stash[server_url_key]
+
+
+def pytest_unconfigure(config: pytest.Config):
+    postgres = config.stash.get(postgres_key, None)
+    if postgres is not None:
+        postgres.stop()
+
+
+@pytest.fixture(scope="session")
+def worker_name(request: pytest.FixtureRequest) -> str:
+    """Name of the test worker, unique among parallel workers"""
+    workerinput = getattr(request.config, "workerinput", None)
+    return workerinput["workerid"] if workerinput else "main"
+
+
+@pytest.fixture(scope="session")
+def test_server_url(request: pytest.FixtureRequest) -> str:
+    """Get the URL of the container's default database"""
+    workerinput = getattr(request.config, "workerinput", None)
+    if workerinput:
+        return workerinput["test_server_url"]
+    return request.config.stash[server_url_key]
+
+
+@pytest.fixture(scope="session")
+def clone_database(
+    test_server_url: str, worker_name: str
+) -> Callable[[str], Awaitable[str]]:
+    """Clone the template into a database of this worker, given its suffix"""
+
+    def clone(suffix: str) -> Awaitable[str]:
+        return clone_template_database(test_server_url, f"stoq_{worker_name}_{suffix}")
+
+    return clone
+
+
+@pytest.fixture(scope="session")
+async def test_database_url(clone_database) -> str:
+    """Clone the template into the main database of this worker"""
+    return await clone_database("test")
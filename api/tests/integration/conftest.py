@@ -1,6 +1,6 @@
 import pytest
 from typing import AsyncGenerator
-from testcontainers.postgres import PostgresContainer
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -10,30 +10,14 @@ from sqlalchemy.ext.asyncio import (
 from httpx import ASGITransport, AsyncClient
 
 from src.infrastructure.api.main import create_app
-from src.infrastructure.database.connection import Base, get_db
+from src.infrastructure.api.sessions import get_db, get_read_db
+from src.infrastructure.database.connection import Base
 
 
 @pytest.fixture(scope="session")
-async def postgres_container() -> AsyncGenerator[PostgresContainer, None]:
-    """Start a PostgreSQL container for testing"""
-    with PostgresContainer("postgres:16-alpine", driver="asyncpg") as postgres:
-        yield postgres
-
-
-@pytest.fixture(scope="session")
-async def test_database_url(postgres_container: PostgresContainer) -> str:
-    """Get the database URL from the container"""
-    return postgres_container.get_connection_url()
-
-
-@pytest.fixture(scope="function")
 async def test_engine(test_database_url: str) -> AsyncGenerator[AsyncEngine, None]:
     """Create a test database engine"""
-    engine = create_async_engine(test_database_url, echo=True)
-
-    # Create all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    engine = create_async_engine(test_database_url)
 
     yield engine
 
@@ -42,7 +26,48 @@ async def test_engine(test_database_url: str) -> AsyncGenerator[AsyncEngine, Non
 
 @pytest.fixture
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session for each test"""
+    """Create a test database session whose changes are rolled back
+
+    The session runs inside a transaction that is never committed, and its
+    commits only release a SAVEPOINT, so nothing a test writes through it
+    is seen by other connections or outlives the test.
+    """
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+async def committed_data(test_engine) -> AsyncGenerator[None, None]:
+    """Empty every table once the test ends
+
+    For tests whose writes are really committed to the worker's database,
+    so that none of their rows reach the tests that run after them.
+    """
+    yield
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with test_engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables}"))
+
+
+@pytest.fixture
+async def committed_session(
+    test_engine, committed_data
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session whose commits are real
+
+    For tests that need other connections to see their writes; the tables
+    are emptied after the test.
+    """
     async_session_maker = async_sessionmaker(
         test_engine, class_=AsyncSession, expire_on_commit=False
     )
@@ -61,6 +86,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
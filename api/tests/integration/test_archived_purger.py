@@ -0,0 +1,82 @@
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.domain.entities.product import SellingPlaceEnum
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import ProductModel, ThumbnailModel
+from src.infrastructure.tasks.archived_purger import purge_archived_products
+
+
+@pytest.fixture
+def storage_path(tmp_path, monkeypatch):
+    """Store pictures in a temporary directory"""
+    monkeypatch.setattr(settings, "picture_storage_path", str(tmp_path))
+    return tmp_path
+
+
+def build_product(digest: str, archived_at: datetime | None) -> ProductModel:
+    return ProductModel(
+        id=uuid.uuid4(),
+        name=f"purged_{uuid.uuid4()}",
+        ean="1234567890123",
+        price=10,
+        description="Product with a picture",
+        active=True,
+        selling_place=SellingPlaceEnum.EVENT,
+        picture_digest=digest,
+        archived_at=archived_at,
+    )
+
+
+def build_thumbnail(digest: str) -> ThumbnailModel:
+    return ThumbnailModel(
+        digest=digest, size=64, format="webp", content_type="image/webp", data=b"x"
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_purge_removes_pictures_no_longer_referenced(
+    committed_session: AsyncSession, test_engine: AsyncEngine, storage_path, monkeypatch
+):
+    """Test purged products take their pictures along unless still shared"""
+    # Arrange
+    session_maker = async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    monkeypatch.setitem(
+        connection.LAZY_ATTRIBUTES, "async_session_maker", lambda: session_maker
+    )
+    shared, unique = uuid.uuid4().hex, uuid.uuid4().hex
+    long_ago = datetime.now() - timedelta(days=400)
+    live = build_product(shared, archived_at=None)
+    committed_session.add_all(
+        [
+            live,
+            build_product(shared, archived_at=long_ago),
+            build_product(unique, archived_at=long_ago),
+            build_thumbnail(shared),
+            build_thumbnail(unique),
+        ]
+    )
+    await committed_session.commit()
+    for digest in (shared, unique):
+        (storage_path / digest).write_bytes(b"picture")
+
+    # Act
+    purged = await purge_archived_products(timedelta(days=365), batch_size=1)
+
+    # Assert
+    assert purged == 2
+    assert (storage_path / shared).exists()
+    assert not (storage_path / unique).exists()
+    thumbnails = await committed_session.execute(
+        select(ThumbnailModel.digest).where(ThumbnailModel.digest.in_([shared, unique]))
+    )
+    assert set(thumbnails.scalars()) == {shared}
+    await committed_session.delete(live)
+    await committed_session.commit()
@@ -0,0 +1,112 @@
+import sqlite3
+import pytest
+from uuid import UUID
+from httpx import AsyncClient
+
+from src.infrastructure.api import container
+from src.infrastructure.config import settings
+
+
+@pytest.fixture(autouse=True)
+def snapshot_storage(tmp_path, monkeypatch):
+    """Keep each test's snapshot files apart, as its products are rolled back"""
+    monkeypatch.setattr(container.catalog_snapshot_store, "base_path", str(tmp_path))
+    monkeypatch.setattr(settings, "snapshot_max_age_seconds", 0)
+
+
+def build_payload(name: str, ean: str, selling_place: str = "event", active=True):
+    return {
+        "name": name,
+        "ean": ean,
+        "price": 12.5,
+        "description": f"{name} description",
+        "active": active,
+        "selling_place": selling_place,
+    }
+
+
+def open_catalog(content: bytes, tmp_path, name: str) -> sqlite3.Connection:
+    path = tmp_path / f"downloaded-{name}"
+    path.write_bytes(content)
+    return sqlite3.connect(path)
+
+
+def ids(db: sqlite3.Connection, table: str) -> set[str]:
+    return {str(UUID(bytes=row[0])) for row in db.execute(f"SELECT id FROM {table}")}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_snapshot_lists_products_on_sale(client: AsyncClient, tmp_path):
+    """Test the snapshot holds the active products of the place, by EAN"""
+    # Arrange
+    on_sale = await client.post(
+        "/api/v1/products", json=build_payload("Snapshot A", "5000000000001")
+    )
+    inactive = await client.post(
+        "/api/v1/products",
+        json=build_payload("Snapshot B", "5000000000002", active=False),
+    )
+    in_store = await client.post(
+        "/api/v1/products",
+        json=build_payload("Snapshot C", "5000000000003", selling_place="store"),
+    )
+
+    # Act
+    response = await client.get("/api/v1/products/snapshot?selling_place=event")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.sqlite3"
+    db = open_catalog(response.content, tmp_path, "snapshot")
+    listed = ids(db, "products")
+    assert on_sale.json()["id"] in listed
+    assert inactive.json()["id"] not in listed
+    assert in_store.json()["id"] not in listed
+    row = db.execute(
+        "SELECT name, price_cents FROM products WHERE ean = '5000000000001'"
+    ).fetchone()
+    assert row == ("Snapshot A", 1250)
+    meta = dict(db.execute("SELECT key, value FROM meta"))
+    assert meta["version"] == response.headers["x-catalog-version"]
+    assert meta["selling_place"] == "event"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delta_has_changes_since_version(client: AsyncClient, tmp_path):
+    """Test a delta lists the products changed and removed since a version"""
+    # Arrange
+    updated = await client.post(
+        "/api/v1/products", json=build_payload("Delta A", "5000000000011")
+    )
+    archived = await client.post(
+        "/api/v1/products", json=build_payload("Delta B", "5000000000012")
+    )
+    await client.post(
+        "/api/v1/products", json=build_payload("Delta C", "5000000000013")
+    )
+    snapshot = await client.get("/api/v1/products/snapshot?selling_place=event")
+    version = snapshot.headers["x-catalog-version"]
+    await client.put(f"/api/v1/products/{updated.json()['id']}", json={"price": 20})
+    await client.delete(f"/api/v1/products/{archived.json()['id']}")
+
+    # Act
+    response = await client.get(
+        f"/api/v1/products/snapshot/delta?selling_place=event&since={version}"
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert int(response.headers["x-catalog-version"]) > int(version)
+    db = open_catalog(response.content, tmp_path, "delta")
+    assert ids(db, "products") == {updated.json()["id"]}
+    assert ids(db, "removed") == {archived.json()["id"]}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_delta_from_unknown_version_is_gone(client: AsyncClient):
+    """Test a delta from a version no longer kept asks for a full download"""
+    # Act
+    response = await client.get("/api/v1/products/snapshot/delta?since=1")
+
+    # Assert
+    assert response.status_code == 410
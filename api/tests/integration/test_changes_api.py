@@ -0,0 +1,185 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.domain.entities.product import Product
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+def build_payload(name: str, ean: str):
+    return {
+        "name": name,
+        "ean": ean,
+        "price": 10.0,
+        "description": f"{name} description",
+        "active": True,
+        "selling_place": "store",
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_changes_since_token(client: AsyncClient):
+    """Test the change feed only returns rows changed after the token"""
+    # Arrange
+    token = (await client.get("/api/v1/products/changes?limit=1000")).json()
+    while token["has_more"]:
+        token = (
+            await client.get(
+                f"/api/v1/products/changes?since={token['next_token']}&limit=1000"
+            )
+        ).json()
+    first = await client.post(
+        "/api/v1/products", json=build_payload("Change A", "4000000000001")
+    )
+    await client.post(
+        "/api/v1/products", json=build_payload("Change B", "4000000000002")
+    )
+
+    # Act
+    response = await client.get(f"/api/v1/products/changes?since={token['next_token']}")
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == ["Change A", "Change B"]
+    assert data["next_token"] == data["items"][-1]["change_seq"]
+    assert data["has_more"] is False
+
+    # Act - An update moves the product to the end of the feed
+    await client.put(
+        f"/api/v1/products/{first.json()['id']}", json={"name": "Change A2"}
+    )
+    response = await client.get(f"/api/v1/products/changes?since={data['next_token']}")
+
+    # Assert
+    items = response.json()["items"]
+    assert [item["name"] for item in items] == ["Change A2"]
+    assert items[0]["updated_at"] >= items[0]["inserted_at"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_changes_pagination(client: AsyncClient):
+    """Test the change feed pages through changes in keyset order"""
+    # Arrange
+    for i in range(3):
+        await client.post(
+            "/api/v1/products", json=build_payload(f"Paged {i}", f"400000000010{i}")
+        )
+
+    # Act
+    response = await client.get("/api/v1/products/changes?limit=2")
+
+    # Assert
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["has_more"] is True
+    sequences = [item["change_seq"] for item in data["items"]]
+    assert sequences == sorted(sequences)
+
+    response = await client.get(
+        f"/api/v1/products/changes?since={data['next_token']}&limit=2"
+    )
+    assert all(
+        item["change_seq"] > data["next_token"] for item in response.json()["items"]
+    )
+
+
+async def read_feed(engine: AsyncEngine, since: int) -> tuple[list[Product], int]:
+    """Read the whole change feed after since on a connection of its own"""
+    items = []
+    async with AsyncSession(engine) as session:
+        repository = SQLAlchemyProductRepository(session)
+        while True:
+            feed = await repository.list_changes(since=since, limit=1000)
+            items += feed.items
+            since = feed.next_token
+            if not feed.has_more:
+                return items, since
+
+
+def build_product(name: str) -> Product:
+    return Product(id=None, picture=None, **build_payload(name, "4000000000201"))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_feed_waits_for_running_writers(test_engine: AsyncEngine, committed_data):
+    """Test the feed does not pass a row that an older transaction may precede
+
+    The older transaction writes last, so a feed ordered by the moment each
+    write happened would hand out a token past its row before it commits.
+    """
+    # Arrange
+    _, token = await read_feed(test_engine, since=0)
+    suffix = uuid.uuid4()
+    async with AsyncSession(test_engine) as older, AsyncSession(test_engine) as newer:
+        older_repository = SQLAlchemyProductRepository(older)
+        newer_repository = SQLAlchemyProductRepository(newer)
+        first = await older_repository.create_product(build_product(f"Older {suffix}"))
+        newer_product = await newer_repository.create_product(
+            build_product(f"Newer {suffix}")
+        )
+        await newer.commit()
+
+        # Act
+        while_running, _ = await read_feed(test_engine, since=token)
+        last = await older_repository.create_product(build_product(f"Last {suffix}"))
+        await older.commit()
+        after_commit, _ = await read_feed(test_engine, since=token)
+
+    # Assert
+    ours = {first.id, newer_product.id, last.id}
+    assert [item.id for item in while_running if item.id in ours] == []
+    assert [item.id for item in after_commit if item.id in ours] == [
+        first.id,
+        last.id,
+        newer_product.id,
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_writer_reads_its_own_changes(test_engine: AsyncEngine, committed_data):
+    """Test the feed read inside a writing transaction returns its writes"""
+    # Arrange
+    _, token = await read_feed(test_engine, since=0)
+    async with AsyncSession(test_engine) as writer:
+        repository = SQLAlchemyProductRepository(writer)
+        product = await repository.create_product(build_product(f"Own {uuid.uuid4()}"))
+
+        # Act
+        feed = await repository.list_changes(since=token, limit=1000)
+        await writer.rollback()
+
+    # Assert
+    assert [item.id for item in feed.items] == [product.id]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_feed_skips_writers_of_other_databases(
+    test_engine: AsyncEngine, clone_database, committed_data
+):
+    """Test a transaction running in another database does not hold the feed"""
+    # Arrange
+    _, token = await read_feed(test_engine, since=0)
+    other_engine = create_async_engine(await clone_database("other_writer"))
+    try:
+        async with other_engine.connect() as other:
+            await other.execute(select(func.pg_current_xact_id()))
+            async with AsyncSession(test_engine) as session:
+                product = await SQLAlchemyProductRepository(session).create_product(
+                    build_product(f"Behind {uuid.uuid4()}")
+                )
+                await session.commit()
+
+            # Act
+            items, _ = await read_feed(test_engine, since=token)
+            await other.rollback()
+    finally:
+        await other_engine.dispose()
+
+    # Assert
+    assert [item.id for item in items] == [product.id]
@@ -0,0 +1,163 @@
+import asyncio
+import hashlib
+import uuid
+from datetime import timedelta
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.application.dtos.create_product import CreateProductDTO
+from src.infrastructure.api.main import create_app
+from src.infrastructure.api.sessions import get_db, get_read_db
+from src.infrastructure.repositories.idempotency_repository import (
+    SQLAlchemyIdempotencyRepository,
+)
+
+
+@pytest.fixture
+async def concurrent_client(
+    test_engine: AsyncEngine, committed_data
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create a client giving each request its own committed session
+
+    Requests then run on separate connections, as in production, instead
+    of sharing the rolled back test session.
+    """
+    app = create_app()
+    session_maker = async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def override_get_db():
+        async with session_maker() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+    app.dependency_overrides.clear()
+
+
+def build_payload(sample_product: dict) -> dict:
+    return {
+        key: sample_product[key]
+        for key in ("name", "ean", "price", "description", "active", "selling_place")
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_retry_with_same_key(client: AsyncClient, sample_product):
+    """Test a retried create with the same Idempotency-Key returns the first product"""
+    # Arrange
+    payload = build_payload(sample_product)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    # Act
+    first = await client.post("/api/v1/products", json=payload, headers=headers)
+    retry = await client.post("/api/v1/products", json=payload, headers=headers)
+
+    # Assert
+    assert first.status_code == 200
+    assert retry.status_code == 200
+    assert retry.json()["id"] == first.json()["id"]
+    listed = await client.get(f"/api/v1/products?name={payload['name']}")
+    assert listed.json()["total"] == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_key_reused_for_other_payload(
+    client: AsyncClient, sample_product
+):
+    """Test reusing an Idempotency-Key with a different payload is rejected"""
+    # Arrange
+    payload = build_payload(sample_product)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    await client.post("/api/v1/products", json=payload, headers=headers)
+
+    # Act
+    response = await client.post(
+        "/api/v1/products",
+        json={**payload, "name": f"{payload['name']}_other"},
+        headers=headers,
+    )
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_retry_after_archive(client: AsyncClient, sample_product):
+    """Test a retry replays the stored response after the product was archived"""
+    # Arrange
+    payload = build_payload(sample_product)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+    first = await client.post("/api/v1/products", json=payload, headers=headers)
+    await client.delete(f"/api/v1/products/{first.json()['id']}")
+
+    # Act
+    retry = await client.post("/api/v1/products", json=payload, headers=headers)
+
+    # Assert
+    assert retry.status_code == 200
+    assert retry.json() == first.json()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_concurrent_requests_with_same_key(
+    concurrent_client: AsyncClient, sample_product
+):
+    """Test two concurrent creates with the same key make a single product"""
+    # Arrange
+    payload = build_payload(sample_product)
+    headers = {"Idempotency-Key": str(uuid.uuid4())}
+
+    # Act
+    first, second = await asyncio.gather(
+        concurrent_client.post("/api/v1/products", json=payload, headers=headers),
+        concurrent_client.post("/api/v1/products", json=payload, headers=headers),
+    )
+
+    # Assert
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["id"] == first.json()["id"]
+    listed = await concurrent_client.get(f"/api/v1/products?name={payload['name']}")
+    assert listed.json()["total"] == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_key_claimed_but_not_completed(
+    client: AsyncClient, db_session: AsyncSession, sample_product
+):
+    """Test a request whose key is claimed but not completed answers 409"""
+    # Arrange
+    payload = build_payload(sample_product)
+    idempotency_key = str(uuid.uuid4())
+    request_hash = hashlib.sha256(
+        CreateProductDTO(**payload).model_dump_json().encode()
+    ).hexdigest()
+    await SQLAlchemyIdempotencyRepository(db_session).claim(
+        f"create_product:{idempotency_key}", request_hash, timedelta(hours=1)
+    )
+
+    # Act
+    response = await client.post(
+        "/api/v1/products",
+        json=payload,
+        headers={"Idempotency-Key": idempotency_key},
+    )
+
+    # Assert
+    assert response.status_code == 409
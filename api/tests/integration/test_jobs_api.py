@@ -0,0 +1,218 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.entities.job import JobKindEnum, JobStatusEnum
+from src.infrastructure.database.models import JobModel
+from src.infrastructure.jobs.worker import JobWorker
+from src.infrastructure.repositories.job_repository import SQLAlchemyJobRepository
+
+
+@pytest.fixture(autouse=True)
+async def no_jobs(test_engine):
+    """Start and leave each test with an empty queue, as workers claim any
+    due job, including ones committed by earlier tests"""
+    await delete_jobs(test_engine)
+    yield
+    await delete_jobs(test_engine)
+
+
+async def delete_jobs(test_engine):
+    async with async_sessionmaker(test_engine, class_=AsyncSession)() as session:
+        await session.execute(delete(JobModel))
+        await session.commit()
+
+
+def build_worker(test_engine, handlers) -> JobWorker:
+    return JobWorker(
+        session_maker=async_sessionmaker(test_engine, class_=AsyncSession),
+        handlers=handlers,
+        concurrency=1,
+        poll_interval=0.1,
+        lease=timedelta(seconds=30),
+        backoff_base=60,
+        backoff_max=600,
+        retention=timedelta(days=1),
+    )
+
+
+async def enqueue(test_engine, kind: JobKindEnum, max_attempts: int = 3, **payload):
+    async with async_sessionmaker(test_engine, class_=AsyncSession)() as session:
+        job = await SQLAlchemyJobRepository(session).enqueue(
+            kind, payload, max_attempts
+        )
+        await session.commit()
+    return job
+
+
+async def load(test_engine, job_id):
+    async with async_sessionmaker(test_engine, class_=AsyncSession)() as session:
+        return await SQLAlchemyJobRepository(session).get_job(job_id)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_enqueue_job_returns_accepted(client: AsyncClient):
+    """Test enqueueing a job returns 202 with a pollable location"""
+    # Arrange
+    payload = {"kind": "purge_archived", "payload": {"older_than_days": 90}}
+
+    # Act
+    response = await client.post("/api/v1/jobs", json=payload)
+
+    # Assert
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "queued"
+    assert data["attempts"] == 0
+    assert response.headers["location"] == f"/api/v1/jobs/{data['id']}"
+    status = await client.get(response.headers["location"])
+    assert status.status_code == 200
+    assert status.json()["payload"] == {"older_than_days": 90}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_enqueue_job_unknown_kind(client: AsyncClient):
+    """Test enqueueing a job of an unknown kind is rejected"""
+    # Act
+    response = await client.post("/api/v1/jobs", json={"kind": "reticulate"})
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_enqueue_job_invalid_payload(client: AsyncClient):
+    """Test a payload its job's handler would reject is refused at enqueue"""
+    # Arrange
+    payloads = [
+        {"kind": "purge_archived", "payload": {"older_than_days": "soon"}},
+        {"kind": "backfill_thumbnails", "payload": {"batch_size": 0}},
+        {"kind": "refresh_stats", "payload": {"force": True}},
+    ]
+
+    # Act
+    responses = [await client.post("/api/v1/jobs", json=p) for p in payloads]
+
+    # Assert
+    assert [response.status_code for response in responses] == [422, 422, 422]
+    locations = [response.json()["detail"][0]["loc"] for response in responses]
+    assert locations == [
+        ["body", "payload", "older_than_days"],
+        ["body", "payload", "batch_size"],
+        ["body", "payload", "force"],
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_worker_fails_job_with_invalid_payload(test_engine):
+    """Test a job stored with a bad payload fails at once instead of retrying"""
+
+    # Arrange
+    async def handler(batch_size: int):
+        return {"processed": batch_size}
+
+    job = await enqueue(test_engine, JobKindEnum.BACKFILL_THUMBNAILS, size=7)
+    worker = build_worker(test_engine, {JobKindEnum.BACKFILL_THUMBNAILS: handler})
+
+    # Act
+    await worker.run_once()
+
+    # Assert
+    failed = await load(test_engine, job.id)
+    assert failed.status == JobStatusEnum.FAILED
+    assert failed.last_error.startswith("Invalid payload")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_job_not_found(client: AsyncClient):
+    """Test getting a non-existent job"""
+    # Act
+    response = await client.get("/api/v1/jobs/00000000-0000-0000-0000-000000000000")
+
+    # Assert
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_worker_runs_job_and_records_result(test_engine):
+    """Test the worker runs a due job and stores its result"""
+
+    # Arrange
+    async def handler(batch_size: int):
+        return {"processed": batch_size}
+
+    job = await enqueue(test_engine, JobKindEnum.BACKFILL_THUMBNAILS, batch_size=7)
+    worker = build_worker(test_engine, {JobKindEnum.BACKFILL_THUMBNAILS: handler})
+
+    # Act
+    ran = await worker.run_once()
+
+    # Assert
+    assert ran.id == job.id
+    finished = await load(test_engine, job.id)
+    assert finished.status == JobStatusEnum.SUCCEEDED
+    assert finished.attempts == 1
+    assert finished.result == {"processed": 7}
+    assert finished.finished_at is not None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_worker_retries_with_backoff_then_fails(test_engine):
+    """Test a failing job is retried later and fails after max attempts"""
+
+    # Arrange
+    async def handler():
+        raise RuntimeError("boom")
+
+    job = await enqueue(test_engine, JobKindEnum.REFRESH_STATS, max_attempts=2)
+    worker = build_worker(test_engine, {JobKindEnum.REFRESH_STATS: handler})
+
+    # Act
+    await worker.run_once()
+
+    # Assert - Requeued with a delay rather than retried at once
+    retried = await load(test_engine, job.id)
+    assert retried.status == JobStatusEnum.QUEUED
+    assert retried.attempts == 1
+    assert retried.last_error == "RuntimeError: boom"
+    assert retried.run_at > datetime.now() + timedelta(seconds=20)
+    assert await worker.run_once() is None
+
+    # Act - Make the retry due
+    async with async_sessionmaker(test_engine, class_=AsyncSession)() as session:
+        model = await session.get(JobModel, job.id)
+        model.run_at = datetime.now()
+        await session.commit()
+    await worker.run_once()
+
+    # Assert
+    failed = await load(test_engine, job.id)
+    assert failed.status == JobStatusEnum.FAILED
+    assert failed.attempts == 2
+    assert failed.finished_at is not None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_claims_skip_locked_jobs(test_engine):
+    """Test concurrent workers each claim a different job"""
+    # Arrange
+    jobs = [await enqueue(test_engine, JobKindEnum.REFRESH_STATS) for _ in range(3)]
+    session_maker = async_sessionmaker(test_engine, class_=AsyncSession)
+    sessions = [session_maker() for _ in range(3)]
+
+    # Act - Claims stay uncommitted so their row locks are held together
+    claimed = await asyncio.gather(
+        *(
+            SQLAlchemyJobRepository(session).claim(timedelta(seconds=30))
+            for session in sessions
+        )
+    )
+
+    # Assert
+    assert {job.id for job in claimed} == {job.id for job in jobs}
+    for session in sessions:
+        await session.rollback()
+        await session.close()
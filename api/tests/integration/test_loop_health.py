@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+import time
+from contextlib import suppress
+from httpx import AsyncClient
+
+from src.infrastructure.api import main
+from src.infrastructure.config import settings
+from src.utils.loop_lag import LoopLagMonitor
+
+
+def block_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_monitor_reports_blocking_callback_with_stack():
+    """Test a callback blocking the loop is reported with its stack and lag"""
+    # Arrange
+    monitor = LoopLagMonitor(interval=0.01, slow_callback=0.05)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+
+    # Act
+    block_loop(0.3)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+    # Assert
+    assert monitor.slow_callback_count == 1
+    slow_callback = monitor.slow_callbacks()[-1]
+    assert "block_loop" in "".join(slow_callback["stack"])
+    assert slow_callback["blocked_ms"] >= 250
+    assert monitor.percentiles()["max"] >= 250
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_health_is_not_ready_while_loop_lags(client: AsyncClient, monkeypatch):
+    """Test /health reports 503 while the p99 loop lag is over the limit"""
+    # Arrange
+    monitor = LoopLagMonitor()
+    monkeypatch.setattr(main, "loop_lag_monitor", monitor)
+    healthy = await client.get("/health")
+
+    # Act
+    for _ in range(100):
+        monitor.record(settings.health_max_loop_lag_p99_ms * 2 / 1000)
+    degraded = await client.get("/health")
+
+    # Assert
+    assert healthy.status_code == 200
+    assert healthy.json()["status"] == "ok"
+    assert degraded.status_code == 503
+    assert degraded.json()["status"] == "degraded"
+    assert degraded.json()["loop_lag_ms"]["p99"] > settings.health_max_loop_lag_p99_ms
@@ -0,0 +1,78 @@
+import base64
+import io
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+
+from src.infrastructure.config import settings
+from src.infrastructure.executors.pools import process_pool, thread_pool
+
+
+def build_payload(sample_product, picture: bool) -> dict:
+    payload = {key: value for key, value in sample_product.items() if key != "id"}
+    if picture:
+        buffer = io.BytesIO()
+        Image.effect_noise((512, 512), 64).save(buffer, format="PNG")
+        payload["picture"] = base64.b64encode(buffer.getvalue()).decode()
+    return payload
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_large_products_are_processed_in_pools(
+    client: AsyncClient, sample_product, monkeypatch
+):
+    """Test large bodies and responses are parsed and encoded on threads,
+    and thumbnails rendered in another process"""
+    # Arrange
+    monkeypatch.setattr(settings, "executor_offload_min_bytes", 1024)
+    payload = build_payload(sample_product, picture=True)
+    threaded = thread_pool.completed
+    completed = process_pool.completed
+
+    # Act
+    created = await client.post("/api/v1/products", json=payload)
+    fetched = await client.get(f"/api/v1/products/{created.json()['id']}")
+
+    # Assert
+    assert created.status_code == 200
+    assert fetched.status_code == 200
+    assert fetched.headers["content-type"] == "application/json"
+    assert fetched.json() == created.json()
+    # Body parsing and response encoding
+    assert thread_pool.completed - threaded == 2
+    assert process_pool.completed - completed == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_small_products_are_processed_in_place(
+    client: AsyncClient, sample_product
+):
+    """Test small bodies and responses do not go through the pool"""
+    # Arrange
+    payload = build_payload(sample_product, picture=False)
+    threaded = thread_pool.completed
+    completed = process_pool.completed
+
+    # Act
+    created = await client.post("/api/v1/products", json=payload)
+    fetched = await client.get(f"/api/v1/products/{created.json()['id']}")
+
+    # Assert
+    assert fetched.json() == created.json()
+    assert thread_pool.completed == threaded
+    assert process_pool.completed == completed
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_metrics_report_executor_queues(client: AsyncClient):
+    """Test the metrics expose the queue of each pool"""
+    # Act
+    response = await client.get("/api/v1/metrics")
+
+    # Assert
+    executors = response.json()["executors"]
+    assert set(executors) == {"thread", "process"}
+    assert executors["process"]["workers"] == settings.executor_processes
+    assert {"in_flight", "queued", "completed", "max_queue_wait_ms"} <= set(
+        executors["thread"]
+    )
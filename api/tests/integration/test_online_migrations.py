@@ -0,0 +1,186 @@
+import pytest
+from typing import AsyncGenerator, Callable
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.infrastructure.config import settings
+from src.infrastructure.database.online_migrations import (
+    backfill,
+    create_index_concurrently,
+    execute_with_lock_timeout,
+    is_lock_timeout,
+)
+from src.infrastructure.database.partitioning import partition_products
+
+INSERT_PRODUCTS = """
+    INSERT INTO products (
+        id, name, ean, price, active, selling_place,
+        inserted_at, updated_at, change_seq
+    )
+    SELECT
+        gen_random_uuid(), 'Product ' || i, lpad(i::text, 13, '0'), 10, true,
+        'STORE', now(), now(), next_product_change_seq()
+    FROM generate_series(1, :count) AS i
+"""
+INDEX_IS_VALID = """
+    SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)
+"""
+
+
+@pytest.fixture
+async def migration_engine(clone_database) -> AsyncGenerator[AsyncEngine, None]:
+    """Create a separate database, as migrations change the schema"""
+    engine = create_async_engine(await clone_database("online_migrations"))
+
+    yield engine
+
+    await engine.dispose()
+
+
+async def run_migration[T](engine: AsyncEngine, operation: Callable[[], T]) -> T:
+    """Run operation with op bound to a migration context, as in a revision"""
+
+    def run(connection) -> T:
+        with Operations.context(MigrationContext.configure(connection)):
+            return operation()
+
+    async with engine.connect() as conn:
+        result = await conn.run_sync(run)
+        await conn.commit()
+    return result
+
+
+async def index_is_valid(engine: AsyncEngine, name: str) -> bool | None:
+    async with engine.connect() as conn:
+        return await conn.scalar(text(INDEX_IS_VALID), {"name": name})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_index_concurrently_rebuilds_invalid_index(migration_engine):
+    """Test an index left invalid by a failed concurrent build is rebuilt"""
+    # Arrange
+    async with migration_engine.begin() as conn:
+        await conn.execute(text(INSERT_PRODUCTS), {"count": 50})
+        await conn.execute(text("CREATE INDEX ix_products_ean ON products (ean)"))
+        await conn.execute(
+            text(
+                "UPDATE pg_index SET indisvalid = false "
+                "WHERE indexrelid = 'ix_products_ean'::regclass"
+            )
+        )
+
+    # Act
+    await run_migration(
+        migration_engine,
+        lambda: create_index_concurrently("ix_products_ean", "products", ["ean"]),
+    )
+
+    # Assert
+    assert await index_is_valid(migration_engine, "ix_products_ean") is True
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_index_concurrently_on_partitioned_table(migration_engine):
+    """Test a partitioned table gets the index one partition at a time"""
+    # Arrange
+    async with migration_engine.begin() as conn:
+        for statement in partition_products(4):
+            await conn.execute(text(statement))
+        await conn.execute(text(INSERT_PRODUCTS), {"count": 50})
+
+    # Act
+    await run_migration(
+        migration_engine,
+        lambda: create_index_concurrently(
+            "ix_products_ean", "products", ["ean"], where="archived_at IS NULL"
+        ),
+    )
+
+    # Assert
+    assert await index_is_valid(migration_engine, "ix_products_ean") is True
+    for partition in range(4):
+        name = f"ix_products_p{partition}_ean"
+        assert await index_is_valid(migration_engine, name) is True
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_execute_with_lock_timeout_gives_up_on_held_lock(
+    migration_engine, monkeypatch
+):
+    """Test DDL stops waiting behind a long transaction after its attempts"""
+    # Arrange
+    monkeypatch.setattr(settings, "migration_lock_backoff_seconds", 0.01)
+    statement = "ALTER TABLE products ADD COLUMN slug text"
+
+    # Act
+    async with migration_engine.connect() as holder:
+        await holder.execute(text("LOCK TABLE products IN ACCESS SHARE MODE"))
+        with pytest.raises(DBAPIError) as error:
+            await run_migration(
+                migration_engine,
+                lambda: execute_with_lock_timeout(statement, timeout_ms=50, attempts=3),
+            )
+        await holder.rollback()
+    await run_migration(migration_engine, lambda: execute_with_lock_timeout(statement))
+
+    # Assert
+    assert is_lock_timeout(error.value)
+    async with migration_engine.connect() as conn:
+        assert await conn.scalar(text("SELECT count(slug) FROM products")) == 0
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_backfill_resumes_after_last_batch(migration_engine):
+    """Test a backfill updates in batches from where a previous run stopped"""
+    # Arrange
+    async with migration_engine.begin() as conn:
+        await conn.execute(text(INSERT_PRODUCTS), {"count": 25})
+        await conn.execute(text("ALTER TABLE products ADD COLUMN slug text"))
+        ids = (
+            await conn.execute(text("SELECT id FROM products ORDER BY id"))
+        ).scalars()
+        stopped_at = list(ids)[9]
+        # As if a previous run committed the first 10 rows and was interrupted
+        await conn.execute(
+            text(
+                "INSERT INTO migration_progress (name, last_key, rows, updated_at) "
+                "VALUES ('products_slug', :last_key, 10, now())"
+            ),
+            {"last_key": str(stopped_at)},
+        )
+
+    def run_backfill() -> int:
+        return backfill(
+            "products_slug",
+            "products",
+            "slug = lower(name)",
+            where="slug IS NULL",
+            batch_size=4,
+            pause_seconds=0,
+        )
+
+    # Act
+    updated = await run_migration(migration_engine, run_backfill)
+    rerun = await run_migration(migration_engine, run_backfill)
+
+    # Assert
+    assert updated == 15
+    assert rerun == 0
+    async with migration_engine.connect() as conn:
+        skipped = await conn.scalar(
+            text("SELECT count(*) FROM products WHERE id <= :id AND slug IS NULL"),
+            {"id": stopped_at},
+        )
+        filled = await conn.scalar(
+            text("SELECT count(*) FROM products WHERE slug = lower(name)")
+        )
+        progress = (
+            await conn.execute(text("SELECT rows, finished_at FROM migration_progress"))
+        ).one()
+    assert skipped == 10
+    assert filled == 15
+    assert progress.rows == 25
+    assert progress.finished_at is not None
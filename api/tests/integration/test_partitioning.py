@@ -0,0 +1,129 @@
+import json
+import pytest
+from typing import AsyncGenerator
+from sqlalchemy import Select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.domain.entities.product import Product, SellingPlaceEnum
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.infrastructure.database.partitioning import (
+    IS_PARTITIONED,
+    partition_products,
+    unpartition_products,
+)
+from src.infrastructure.repositories.product_repository import (
+    SELECT_PRODUCT_BY_ID,
+    SELECT_PRODUCT_ROWS,
+    SQLAlchemyProductRepository,
+    apply_filters,
+)
+
+PARTITIONS = 4
+
+
+@pytest.fixture
+async def partitioned_session(
+    clone_database,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a separate database whose products table is hash-partitioned"""
+    engine = create_async_engine(await clone_database("partitioned"))
+    async with engine.begin() as conn:
+        for statement in partition_products(PARTITIONS):
+            await conn.execute(text(statement))
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+
+    await engine.dispose()
+
+
+def build_product(index: int) -> Product:
+    return Product(
+        id=None,
+        name=f"Partitioned {index}",
+        ean=f"{index:013d}",
+        price=10,
+        description="Partitioned product",
+        active=True,
+        selling_place=SellingPlaceEnum.STORE,
+        picture=None,
+    )
+
+
+async def scanned_partitions(session: AsyncSession, query: Select) -> set[str]:
+    sql = query.compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    plan = (await session.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    relations = set()
+    nodes = [plan[0]["Plan"]]
+    while nodes:
+        node = nodes.pop()
+        if "Relation Name" in node:
+            relations.add(node["Relation Name"])
+        nodes.extend(node.get("Plans", []))
+    return relations
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_partitioned_get_by_id_prunes_to_one_partition(partitioned_session):
+    """Test reading a product by id only scans the partition holding it"""
+    # Arrange
+    repository = SQLAlchemyProductRepository(partitioned_session)
+    products = [await repository.create_product(build_product(i)) for i in range(20)]
+    assert await partitioned_session.scalar(text(IS_PARTITIONED))
+
+    # Act
+    product = await repository.get_product_by_id(products[7].id)
+    scanned = await scanned_partitions(
+        partitioned_session, SELECT_PRODUCT_BY_ID.params(product_id=products[7].id)
+    )
+
+    # Assert
+    assert product.name == "Partitioned 7"
+    assert len(scanned) == 1
+    assert scanned.pop().startswith("products_p")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_partitioned_name_filter_scans_every_partition(partitioned_session):
+    """Test the name filter, which cannot prune on a hash of id, still works"""
+    # Arrange
+    repository = SQLAlchemyProductRepository(partitioned_session)
+    for i in range(20):
+        await repository.create_product(build_product(i))
+    filters = ProductFilter(name="Partitioned 1")
+
+    # Act
+    products = await repository.list_products(1, 50, filters, ProductSortEnum.NAME)
+    scanned = await scanned_partitions(
+        partitioned_session, apply_filters(SELECT_PRODUCT_ROWS, filters)
+    )
+
+    # Assert
+    assert sorted(product.name for product in products) == [
+        "Partitioned 1",
+        *(f"Partitioned {i}" for i in range(10, 20)),
+    ]
+    assert scanned == {f"products_p{i}" for i in range(PARTITIONS)}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_unpartition_products_keeps_rows(partitioned_session):
+    """Test converting back to a plain table keeps every product"""
+    # Arrange
+    repository = SQLAlchemyProductRepository(partitioned_session)
+    product = await repository.create_product(build_product(1))
+
+    # Act
+    for statement in unpartition_products():
+        await partitioned_session.execute(text(statement))
+
+    # Assert
+    assert not await partitioned_session.scalar(text(IS_PARTITIONED))
+    fetched = await repository.get_product_by_id(product.id)
+    assert fetched.change_seq == product.change_seq
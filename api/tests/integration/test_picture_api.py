@@ -0,0 +1,291 @@
+import asyncio
+import base64
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.api.container import picture_storage
+
+PICTURE_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+PICTURE_BYTES = base64.b64decode(PICTURE_BASE64)
+
+
+@pytest.fixture
+def storage_path(tmp_path, monkeypatch):
+    """Store uploaded pictures in a temporary directory"""
+    monkeypatch.setattr(picture_storage, "base_path", str(tmp_path))
+    return tmp_path
+
+
+def build_payload(sample_product, picture=PICTURE_BASE64):
+    return {
+        "name": sample_product["name"],
+        "ean": sample_product["ean"],
+        "price": sample_product["price"],
+        "description": sample_product["description"],
+        "active": sample_product["active"],
+        "selling_place": sample_product["selling_place"],
+        "picture": picture,
+    }
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_generates_thumbnails(client: AsyncClient, sample_product):
+    """Test creating a product with picture generates thumbnail renditions"""
+    # Act
+    response = await client.post("/api/v1/products", json=build_payload(sample_product))
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["picture_digest"] is not None
+    assert set(data["thumbnails"].keys()) == {"64", "256"}
+    assert set(data["thumbnails"]["64"].keys()) == {"webp", "avif"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_thumbnail_is_immutable(client: AsyncClient, sample_product):
+    """Test thumbnails are served with long-lived cache headers"""
+    # Arrange
+    response = await client.post("/api/v1/products", json=build_payload(sample_product))
+    thumbnail_url = response.json()["thumbnails"]["64"]["webp"]
+
+    # Act
+    response = await client.get(thumbnail_url)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["etag"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_thumbnail_not_found(client: AsyncClient):
+    """Test getting a thumbnail of an unknown picture"""
+    # Act
+    response = await client.get("/api/v1/pictures/unknown/64.webp")
+
+    # Assert
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_references_thumbnails(client: AsyncClient, sample_product):
+    """Test list pages ship thumbnail URLs instead of picture bytes"""
+    # Arrange
+    await client.post("/api/v1/products", json=build_payload(sample_product))
+
+    # Act
+    response = await client.get("/api/v1/products")
+
+    # Assert
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["picture"] is None
+    assert item["thumbnails"]["64"]["webp"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_update_product_replaces_thumbnails(client: AsyncClient, sample_product):
+    """Test removing a picture clears its thumbnails"""
+    # Arrange
+    response = await client.post("/api/v1/products", json=build_payload(sample_product))
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}", json={"picture": None}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    data = (await client.get(f"/api/v1/products/{product_id}")).json()
+    assert data["picture_digest"] is None
+    assert data["thumbnails"] is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_product_invalid_picture(client: AsyncClient, sample_product):
+    """Test creating a product with a picture that is not an image"""
+    # Act
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture="aGVsbG8=")
+    )
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_multipart(
+    client: AsyncClient, sample_product, storage_path
+):
+    """Test uploading a picture as multipart/form-data"""
+    # Arrange
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        files={"picture": ("picture.png", PICTURE_BYTES, "image/png")},
+    )
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["picture"] is None
+    assert data["thumbnails"]["64"]["webp"]
+    assert (storage_path / data["picture_digest"]).read_bytes() == PICTURE_BYTES
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_raw_body(
+    client: AsyncClient, sample_product, storage_path
+):
+    """Test uploading a picture as a raw request body and reading it back"""
+    # Arrange
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        content=PICTURE_BYTES,
+        headers={"Content-Type": "image/png"},
+    )
+
+    # Assert
+    assert response.status_code == 200
+    response = await client.get(f"/api/v1/products/{product_id}/picture")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content == PICTURE_BYTES
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_content_type_mismatch(
+    client: AsyncClient, sample_product, storage_path
+):
+    """Test uploading a picture whose content does not match its type"""
+    # Arrange
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        content=PICTURE_BYTES,
+        headers={"Content-Type": "image/jpeg"},
+    )
+
+    # Assert
+    assert response.status_code == 422
+    assert list(storage_path.iterdir()) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_too_large(
+    client: AsyncClient, sample_product, storage_path, monkeypatch
+):
+    """Test uploading a picture above the size limit"""
+    # Arrange
+    monkeypatch.setattr(picture_storage, "max_bytes", 32)
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        files={"picture": ("picture.png", PICTURE_BYTES, "image/png")},
+    )
+
+    # Assert
+    assert response.status_code == 413
+    assert list(storage_path.iterdir()) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_product_not_found(client: AsyncClient, storage_path):
+    """Test uploading a picture for a non-existent product"""
+    # Act
+    response = await client.put(
+        "/api/v1/products/00000000-0000-0000-0000-000000000000/picture",
+        content=PICTURE_BYTES,
+        headers={"Content-Type": "image/png"},
+    )
+
+    # Assert
+    assert response.status_code == 404
+    assert list(storage_path.iterdir()) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_invalid_image_is_not_kept(
+    client: AsyncClient, sample_product, storage_path
+):
+    """Test an upload whose thumbnails cannot be generated leaves no file"""
+    # Arrange
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        content=PICTURE_BYTES[:32],
+        headers={"Content-Type": "image/png"},
+    )
+
+    # Assert
+    assert response.status_code == 422
+    assert list(storage_path.iterdir()) == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_picture_malformed_content_length(
+    client: AsyncClient, sample_product, storage_path
+):
+    """Test a raw upload with a Content-Length that is not a number"""
+    # Arrange
+    response = await client.post(
+        "/api/v1/products", json=build_payload(sample_product, picture=None)
+    )
+    product_id = response.json()["id"]
+
+    # Act
+    response = await client.put(
+        f"/api/v1/products/{product_id}/picture",
+        content=PICTURE_BYTES,
+        headers={"Content-Type": "image/png", "Content-Length": "abc"},
+    )
+
+    # Assert
+    assert response.status_code == 400
+
+
+async def picture_chunks():
+    yield PICTURE_BYTES
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_saves_of_one_picture_create_it_once(storage_path):
+    """Test only one of two saves of the same picture reports creating it"""
+    # Act
+    saved = await asyncio.gather(
+        picture_storage.save(picture_chunks(), "image/png"),
+        picture_storage.save(picture_chunks(), "image/png"),
+    )
+
+    # Assert
+    assert sorted(stored.created for stored in saved) == [False, True]
+    assert [path.name for path in storage_path.iterdir()] == [saved[0].digest]
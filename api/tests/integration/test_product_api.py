@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
 from uuid import UUID
@@ -521,3 +522,138 @@ async def test_list_after_create_update(client: AsyncClient, sample_product):
     products = list_response.json()["items"]
     updated_product = next(p for p in products if p["id"] == product_ids[0])
     assert updated_product["active"] is False
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_filter_by_price_active_and_selling_place(
+    client: AsyncClient,
+):
+    """Test filtering products by price range, status and selling place"""
+    # Arrange
+    products = [
+        ("Cheap Store", "1000000000001", 5.0, True, "store"),
+        ("Mid Store", "1000000000002", 15.5, True, "store"),
+        ("Mid Store Inactive", "1000000000003", 16.0, False, "store"),
+        ("Mid Event", "1000000000004", 17.0, True, "event"),
+        ("Expensive Store", "1000000000005", 99.9, True, "store"),
+    ]
+    for name, ean, price, active, selling_place in products:
+        await client.post(
+            "/api/v1/products",
+            json={
+                "name": name,
+                "ean": ean,
+                "price": price,
+                "description": f"{name} description",
+                "active": active,
+                "selling_place": selling_place,
+            },
+        )
+
+    # Act
+    response = await client.get(
+        "/api/v1/products?min_price=10&max_price=20&active=true&selling_place=store"
+    )
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["items"][0]["name"] == "Mid Store"
+    assert data["items"][0]["price"] == 15.5
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_sort_by_price(client: AsyncClient, sample_product):
+    """Test sorting products by price in both directions"""
+    # Arrange
+    for i, price in enumerate([30.0, 10.0, 20.0]):
+        await client.post(
+            "/api/v1/products",
+            json={
+                "name": f"{sample_product['name']}_{i}",
+                "ean": f"200000000000{i}",
+                "price": price,
+                "description": f"Description {i}",
+                "active": True,
+                "selling_place": "store",
+            },
+        )
+
+    # Act
+    ascending = await client.get("/api/v1/products?sort=price")
+    descending = await client.get("/api/v1/products?sort=-price")
+
+    # Assert
+    assert [item["price"] for item in ascending.json()["items"]] == [10.0, 20.0, 30.0]
+    assert [item["price"] for item in descending.json()["items"]] == [30.0, 20.0, 10.0]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_invalid_sort(client: AsyncClient):
+    """Test listing products with an unknown sort option"""
+    # Act
+    response = await client.get("/api/v1/products?sort=unknown")
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_get_product_is_coalesced(client: AsyncClient, sample_product):
+    """Test concurrent reads of the same product share one query"""
+    # Arrange
+    payload = {
+        key: sample_product[key]
+        for key in ("name", "ean", "price", "description", "active", "selling_place")
+    }
+    product_id = (await client.post("/api/v1/products", json=payload)).json()["id"]
+
+    # Act
+    responses = await asyncio.gather(
+        *(client.get(f"/api/v1/products/{product_id}") for _ in range(5))
+    )
+
+    # Assert
+    assert all(response.status_code == 200 for response in responses)
+    assert {response.json()["id"] for response in responses} == {product_id}
+    metrics = (await client.get("/api/v1/metrics")).json()
+    stats = metrics["single_flight"]["get_product"][f"get_product:{product_id}"]
+    assert stats["calls"] == 5
+    assert stats["executions"] + stats["shared"] == 5
+    assert stats["executions"] < 5
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_archive_product_hides_it_from_reads(client: AsyncClient, sample_product):
+    """Test an archived product is excluded from reads unless requested"""
+    # Arrange
+    payload = {
+        key: sample_product[key]
+        for key in ("name", "ean", "price", "description", "active", "selling_place")
+    }
+    created = (await client.post("/api/v1/products", json=payload)).json()
+    product_id = created["id"]
+
+    # Act
+    response = await client.delete(f"/api/v1/products/{product_id}")
+
+    # Assert
+    assert response.status_code == 204
+    assert (await client.get(f"/api/v1/products/{product_id}")).status_code == 404
+    listed = await client.get(f"/api/v1/products?name={payload['name']}")
+    assert listed.json()["items"] == []
+    archived = await client.get(
+        f"/api/v1/products?name={payload['name']}&include_archived=true"
+    )
+    assert [item["id"] for item in archived.json()["items"]] == [product_id]
+    assert archived.json()["items"][0]["archived_at"] is not None
+    changes = await client.get(
+        f"/api/v1/products/changes?since={created['change_seq']}"
+    )
+    assert [item["id"] for item in changes.json()["items"]] == [product_id]
+    assert changes.json()["items"][0]["archived_at"] is not None
+    update = await client.put(f"/api/v1/products/{product_id}", json={"name": "x"})
+    assert update.status_code == 404
+    again = await client.delete(f"/api/v1/products/{product_id}")
+    assert again.status_code == 404
@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.product import Product
+from src.domain.entities.product_event import ProductEvent, ProductEventTypeEnum
+from src.infrastructure.api.container import list_product_changes
+from src.infrastructure.api.routes.events import stream_product_events
+from src.infrastructure.config import settings
+from src.infrastructure.database.connection import bind_session
+from src.infrastructure.events.broker import ProductEventBroker
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_committed_writes_are_pushed_to_subscribers(
+    committed_session: AsyncSession, test_database_url: str, sample_product: dict
+):
+    """Test product writes reach subscribers through LISTEN/NOTIFY on commit"""
+    # Arrange
+    broker = ProductEventBroker(test_database_url, queue_size=10)
+    subscription = await broker.subscribe()
+    repository = SQLAlchemyProductRepository(committed_session)
+
+    try:
+        # Act
+        product = await repository.create_product(Product(**sample_product))
+        pending = await subscription.get(timeout=0.5)
+        await committed_session.commit()
+        created = await subscription.get(timeout=5)
+        await repository.update_product(product.id, {"name": "Pushed update"})
+        await committed_session.commit()
+        updated = await subscription.get(timeout=5)
+
+        # Assert
+        assert pending is None
+        assert created.type == ProductEventTypeEnum.CREATED
+        assert created.product_id == product.id
+        assert updated.type == ProductEventTypeEnum.UPDATED
+        assert updated.change_seq > created.change_seq
+    finally:
+        await broker.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_slow_subscriber_is_dropped(test_database_url: str):
+    """Test a subscriber whose queue is full is dropped without blocking others"""
+    # Arrange
+    broker = ProductEventBroker(test_database_url, queue_size=1)
+    slow = await broker.subscribe()
+    fast = await broker.subscribe()
+    events = [
+        ProductEvent(
+            type=ProductEventTypeEnum.UPDATED, product_id=uuid.uuid4(), change_seq=i
+        )
+        for i in range(2)
+    ]
+
+    try:
+        # Act
+        broker.publish(events[0])
+        assert await fast.get(timeout=1) == events[0]
+        broker.publish(events[1])
+
+        # Assert
+        assert slow.dropped is True
+        assert await slow.get(timeout=1) is None
+        assert await fast.get(timeout=1) == events[1]
+        assert broker.subscriber_count == 1
+    finally:
+        await broker.close()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reconnect_after_missed_changes_gets_one_resync(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    test_database_url: str,
+    sample_product: dict,
+    monkeypatch,
+):
+    """Test a reconnect with Last-Event-ID gets a single resync for missed changes"""
+    # Arrange
+    monkeypatch.setattr(settings, "events_heartbeat_seconds", 0.01)
+    broker = ProductEventBroker(test_database_url, queue_size=10)
+    sample_product.pop("id")
+    created = await client.post("/api/v1/products", json=sample_product)
+    last_seen = created.json()["change_seq"] - 1
+    product_url = f"/api/v1/products/{created.json()['id']}"
+    await client.put(product_url, json={"name": "Missed update"})
+    # PUT does not return the product, so its new change_seq comes from a read
+    updated = await client.get(product_url)
+    bind_session(db_session)
+
+    try:
+        # Act
+        missed = await stream_product_events(
+            last_event_id=last_seen,
+            broker=broker,
+            list_product_changes_usecase=list_product_changes,
+        )
+        up_to_date = await stream_product_events(
+            last_event_id=created.json()["change_seq"] + 10**9,
+            broker=broker,
+            list_product_changes_usecase=list_product_changes,
+        )
+        missed_events = missed.body_iterator
+        up_to_date_events = up_to_date.body_iterator
+        await anext(missed_events)
+        resync = await anext(missed_events)
+        await anext(up_to_date_events)
+        keepalive = await anext(up_to_date_events)
+
+        # Assert
+        assert "event: product.resync" in resync
+        assert f"id: {updated.json()['change_seq']}\n" in resync
+        assert keepalive == ": keepalive\n\n"
+    finally:
+        await broker.close()
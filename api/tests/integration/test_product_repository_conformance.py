@@ -0,0 +1,275 @@
+import uuid
+import pytest
+from decimal import Decimal
+
+from src.application.exceptions.exceptions import (
+    NoResultFoundException,
+    ReadOnlyCatalogException,
+)
+from src.domain.entities.product import Product, SellingPlaceEnum
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.domain.repositories.product_repository import ProductRepository
+from src.infrastructure.repositories.in_memory_product_repository import (
+    InMemoryProductRepository,
+)
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+@pytest.fixture(params=["sqlalchemy", "in_memory"])
+async def repository(request, db_session) -> ProductRepository:
+    """Run each test against every ProductRepository implementation"""
+    if request.param == "in_memory":
+        return InMemoryProductRepository()
+    return SQLAlchemyProductRepository(db_session)
+
+
+@pytest.fixture
+def token() -> str:
+    """Name prefix no other test's products share"""
+    return f"conformance {uuid.uuid4().hex[:12]}"
+
+
+def build_product(name: str, price: int = 10, **fields) -> Product:
+    return Product(
+        **{
+            "id": None,
+            "name": name,
+            "ean": "7891234567890",
+            "price": Decimal(price),
+            "description": "Conformance product",
+            "active": True,
+            "selling_place": SellingPlaceEnum.STORE,
+            "picture": None,
+            **fields,
+        }
+    )
+
+
+async def create_products(repository, token: str) -> list[Product]:
+    return [
+        await repository.create_product(build_product(f"{token} {letter}", price))
+        for letter, price in zip("cabed", (30, 10, 50, 20, 40))
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_and_get_product(repository, token):
+    """Test a created product is read back with its generated fields"""
+    # Act
+    created = await repository.create_product(build_product(token, picture=b"aGVsbG8="))
+    fetched = await repository.get_product_by_id(created.id)
+
+    # Assert
+    assert created.id is not None
+    assert created.inserted_at is not None
+    assert created.change_seq is not None
+    assert fetched.name == token
+    assert fetched.picture == b"aGVsbG8="
+    assert fetched.change_seq == created.change_seq
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_missing_product(repository):
+    """Test reading an unknown id returns None"""
+    # Act
+    product = await repository.get_product_by_id(uuid.uuid4())
+
+    # Assert
+    assert product is None
+
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize(
+    "sort, expected",
+    [
+        (ProductSortEnum.NAME, "abcde"),
+        (ProductSortEnum.NAME_DESC, "edcba"),
+        (ProductSortEnum.PRICE, "aecdb"),
+        (ProductSortEnum.PRICE_DESC, "bdcea"),
+        (ProductSortEnum.INSERTED_AT, "cabed"),
+        (ProductSortEnum.INSERTED_AT_DESC, "debac"),
+    ],
+)
+async def test_list_products_sorted_pages(repository, token, sort, expected):
+    """Test pages follow the requested order without gaps or repeats"""
+    # Arrange
+    await create_products(repository, token)
+    filters = ProductFilter(name=token)
+
+    # Act
+    pages = [
+        await repository.list_products(page, 2, filters, sort) for page in (1, 2, 3)
+    ]
+
+    # Assert
+    names = [product.name[-1] for page in pages for product in page]
+    assert "".join(names) == expected
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_leaves_out_pictures(repository, token):
+    """Test listed products come without their picture"""
+    # Arrange
+    await repository.create_product(build_product(token, picture=b"aGVsbG8="))
+
+    # Act
+    products = await repository.list_products(
+        1, 10, ProductFilter(name=token), ProductSortEnum.NAME
+    )
+
+    # Assert
+    assert [product.picture for product in products] == [None]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_name_filter_is_case_insensitive_substring(repository, token):
+    """Test the name filter matches anywhere in the name, ignoring case"""
+    # Arrange
+    await repository.create_product(build_product(f"{token} Red Shirt"))
+    await repository.create_product(build_product(f"{token} Blue Shirt"))
+    await repository.create_product(build_product(f"{token} Red Hat"))
+
+    # Act
+    filters = ProductFilter(name=f"{token.upper()} RED")
+    products = await repository.list_products(1, 10, filters, ProductSortEnum.NAME)
+    count = await repository.count_products(filters)
+    blue = await repository.count_products(ProductFilter(name=f"{token} b"))
+
+    # Assert
+    assert [product.name for product in products] == [
+        f"{token} Red Hat",
+        f"{token} Red Shirt",
+    ]
+    assert count == 2
+    assert blue == 1
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_filters_combine(repository, token):
+    """Test price, active and selling place filters apply together"""
+    # Arrange
+    await create_products(repository, token)
+    await repository.create_product(build_product(f"{token} f", 20, active=False))
+    await repository.create_product(
+        build_product(f"{token} g", 20, selling_place=SellingPlaceEnum.EVENT)
+    )
+    filters = ProductFilter(
+        name=token,
+        min_price=Decimal(20),
+        max_price=Decimal(40),
+        active=True,
+        selling_place=SellingPlaceEnum.STORE,
+    )
+
+    # Act
+    products = await repository.list_products(1, 10, filters, ProductSortEnum.PRICE)
+    count = await repository.count_products(filters)
+
+    # Assert
+    assert [product.name[-1] for product in products] == ["e", "c", "d"]
+    assert count == 3
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_update_product(repository, token):
+    """Test an update changes the fields and moves the product in the feed"""
+    # Arrange
+    product = await repository.create_product(build_product(token))
+
+    # Act
+    await repository.update_product(product.id, {"price": Decimal(99)})
+    updated = await repository.get_product_by_id(product.id)
+
+    # Assert
+    assert updated.price == Decimal(99)
+    assert updated.name == token
+    assert updated.change_seq > product.change_seq
+    with pytest.raises(NoResultFoundException):
+        await repository.update_product(uuid.uuid4(), {"price": Decimal(1)})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_archive_product(repository, token):
+    """Test archived products are hidden unless asked for"""
+    # Arrange
+    product = await repository.create_product(build_product(token))
+
+    # Act
+    await repository.archive_product(product.id)
+
+    # Assert
+    assert await repository.get_product_by_id(product.id) is None
+    assert await repository.count_products(ProductFilter(name=token)) == 0
+    archived = await repository.list_products(
+        1, 10, ProductFilter(name=token, include_archived=True), ProductSortEnum.NAME
+    )
+    assert archived[0].archived_at is not None
+    with pytest.raises(NoResultFoundException):
+        await repository.archive_product(product.id)
+    with pytest.raises(NoResultFoundException):
+        await repository.update_product(product.id, {"name": "Revived"})
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_changes(repository, token):
+    """Test the change feed pages through changes in change_seq order"""
+    # Arrange
+    products = await create_products(repository, token)
+    since = products[0].change_seq - 1
+    await repository.update_product(products[0].id, {"name": f"{token} z"})
+
+    # Act
+    first = await repository.list_changes(since, 3)
+    second = await repository.list_changes(first.next_token, 3)
+
+    # Assert
+    names = [product.name[-1] for product in first.items + second.items]
+    assert names == ["a", "b", "e", "d", "z"]
+    assert first.has_more is True
+    assert second.has_more is False
+    assert second.next_token == second.items[-1].change_seq
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_products(repository, token):
+    """Test streaming yields the listing order in batches"""
+    # Arrange
+    await create_products(repository, token)
+    filters = ProductFilter(name=token)
+    listed = await repository.list_products(1, 10, filters, ProductSortEnum.PRICE)
+
+    # Act - Streaming closes the SQLAlchemy session, so it runs last
+    batches = [
+        batch
+        async for batch in repository.stream_products(
+            1, 10, filters, ProductSortEnum.PRICE, batch_size=2
+        )
+    ]
+
+    # Assert
+    assert [len(batch) for batch in batches] == [2, 2]
+    assert [product.id for batch in batches for product in batch] == [
+        product.id for product in listed[1:]
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_read_only_catalog_rejects_writes(token):
+    """Test a read-only in-memory catalog serves reads and rejects writes"""
+    # Arrange
+    source = InMemoryProductRepository()
+    product = await source.create_product(build_product(token))
+    catalog = InMemoryProductRepository([product], read_only=True)
+
+    # Act
+    fetched = await catalog.get_product_by_id(product.id)
+
+    # Assert
+    assert fetched.name == token
+    with pytest.raises(ReadOnlyCatalogException):
+        await catalog.create_product(build_product(token))
+    with pytest.raises(ReadOnlyCatalogException):
+        await catalog.archive_product(product.id)
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import pytest
+import tracemalloc
+from dataclasses import dataclass, field
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from src.domain.entities.product_filter import ProductFilter, ProductSortEnum
+from src.infrastructure.api.main import create_app
+from src.infrastructure.api.sessions import get_db, get_read_db
+from src.infrastructure.config import settings
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+STREAMED_ROWS = 20_000
+
+
+async def insert_products(db_session, prefix: str, count: int):
+    await db_session.execute(
+        text(
+            """
+            INSERT INTO products (
+                id, name, ean, description, inserted_at, price, active,
+                selling_place, updated_at, change_seq
+            )
+            SELECT
+                gen_random_uuid(), :prefix || g, lpad(g::text, 13, '0'),
+                repeat('x', 250), now(), 1, true, 'STORE', now(),
+                next_product_change_seq()
+            FROM generate_series(1, :count) AS g
+            """
+        ),
+        {"prefix": prefix, "count": count},
+    )
+
+
+async def peak_memory(fn) -> int:
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        await fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@dataclass
+class StreamedResponse:
+    status: int = 0
+    headers: dict[str, str] = field(default_factory=dict)
+    lines: int = 0
+    body_bytes: int = 0
+    largest_chunk: int = 0
+
+
+async def stream_get(app, path: str, query: str) -> StreamedResponse:
+    """Send a GET through the ASGI app, counting the body as it is sent.
+
+    httpx's ASGITransport collects the whole body before returning, which
+    would hide whether the app streams, so the app is called directly and
+    each chunk is dropped once counted.
+    """
+    response = StreamedResponse()
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # The client stays connected until the response ends
+        await asyncio.Event().wait()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response.status = message["status"]
+            response.headers = {
+                key.decode(): value.decode() for key, value in message["headers"]
+            }
+        elif message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            response.lines += chunk.count(b"\n")
+            response.body_bytes += len(chunk)
+            response.largest_chunk = max(response.largest_chunk, len(chunk))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"test")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return response
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_rejects_invalid_page_size(client: AsyncClient):
+    """Test page sizes below one are rejected"""
+    # Act
+    response = await client.get("/api/v1/products?size=0")
+
+    # Assert
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_products_streams_pages_above_limit(client: AsyncClient, db_session):
+    """Test a page larger than the limit is streamed as NDJSON"""
+    # Arrange
+    await insert_products(db_session, "ndjson ", 3)
+    size = settings.list_max_page_size + 1
+
+    # Act
+    response = await client.get(f"/api/v1/products?size={size}&name=ndjson")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(item["name"] for item in items) == [
+        "ndjson 1",
+        "ndjson 2",
+        "ndjson 3",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_stream_products_memory_is_bounded_by_batch(db_session):
+    """Test streaming a large result keeps far less in memory than a full page"""
+    # Arrange
+    await insert_products(db_session, "streamed ", STREAMED_ROWS)
+    repository = SQLAlchemyProductRepository(db_session)
+    filters = ProductFilter(name="streamed ")
+    sort = ProductSortEnum.INSERTED_AT
+    streamed = 0
+
+    async def materialize():
+        products = await repository.list_products(1, STREAMED_ROWS, filters, sort)
+        assert len(products) == STREAMED_ROWS
+
+    async def stream():
+        nonlocal streamed
+        async for products in repository.stream_products(
+            0, STREAMED_ROWS, filters, sort, batch_size=500
+        ):
+            streamed += len(products)
+
+    # Act - Streaming closes the session, so it runs last
+    materialized_peak = await peak_memory(materialize)
+    streamed_peak = await peak_memory(stream)
+
+    # Assert
+    assert streamed == STREAMED_ROWS
+    assert streamed_peak * 5 < materialized_peak
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ndjson_response_streams_in_bounded_memory(db_session):
+    """Test a huge page goes out over HTTP as NDJSON chunks, one line per
+    product, in as much memory as a page a tenth of its size"""
+    # Arrange
+    await insert_products(db_session, "http streamed ", STREAMED_ROWS)
+    # Each stream closes the session; committing releases the savepoint, so
+    # the rows outlive the first one and are still rolled back at the end
+    await db_session.commit()
+    app = create_app()
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    responses = {}
+
+    def request(size: int):
+        async def send_request():
+            responses[size] = await stream_get(
+                app, "/api/v1/products", f"size={size}&name=http%20streamed"
+            )
+
+        return send_request
+
+    small_size = STREAMED_ROWS // 10
+
+    # Act - The first request also pays for one-off setup, favouring neither
+    small_peak = await peak_memory(request(small_size))
+    full_peak = await peak_memory(request(STREAMED_ROWS * 2))
+
+    # Assert
+    small, full = responses[small_size], responses[STREAMED_ROWS * 2]
+    assert full.status == 200
+    assert full.headers["content-type"].startswith("application/x-ndjson")
+    assert small.lines == small_size
+    assert full.lines == STREAMED_ROWS
+    # Sent a cursor batch at a time, never as one body
+    assert full.largest_chunk * 10 < full.body_bytes
+    assert full_peak < small_peak * 2
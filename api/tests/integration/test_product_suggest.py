@@ -0,0 +1,125 @@
+import random
+import uuid
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.api.container import suggest_index
+from src.infrastructure.repositories.product_repository import (
+    SQLAlchemyProductRepository,
+)
+from src.infrastructure.tasks.suggest_index_sync import sync_suggest_index
+
+
+@pytest.fixture
+def token() -> str:
+    """Word no other test's product names contain"""
+    return f"sg{uuid.uuid4().hex[:10]}"
+
+
+async def create_products(client: AsyncClient, sample_product, *names: str) -> list:
+    products = []
+    for name in names:
+        payload = {
+            **sample_product,
+            "name": name,
+            "ean": "".join(random.choices("0123456789", k=13)),
+        }
+        # The server assigns ids; a UUID object would not serialize anyway
+        payload.pop("id")
+        response = await client.post("/api/v1/products", json=payload)
+        assert response.status_code == 200, response.text
+        products.append(response.json())
+    return products
+
+
+async def sync(db_session, since: int) -> int:
+    # The lifespan sync task does not run under the test client
+    return await sync_suggest_index(
+        suggest_index, SQLAlchemyProductRepository(db_session), since
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_suggest_ranks_name_prefix_first(
+    client, db_session, sample_product, token
+):
+    """Test names starting with the query rank before other word matches"""
+    # Arrange
+    products = await create_products(
+        client,
+        sample_product,
+        f"Diet {token} Cola",
+        f"{token} Colorado Coffee",
+        f"{token} Cola",
+        f"{token} Lemonade",
+    )
+    await sync(db_session, products[0]["change_seq"] - 1)
+
+    # Act
+    response = await client.get(
+        "/api/v1/products/suggest", params={"q": f"{token.upper()} co"}
+    )
+
+    # Assert
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == [
+        f"{token} Cola",
+        f"{token} Colorado Coffee",
+        f"Diet {token} Cola",
+    ]
+    assert set(response.json()[0]) == {"id", "name", "ean"}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_suggest_matches_ean_prefix_and_substring(
+    client, db_session, sample_product, token
+):
+    """Test EAN prefixes and text inside a word also find products"""
+    # Arrange
+    products = await create_products(client, sample_product, f"Pre{token}fix")
+    await sync(db_session, products[0]["change_seq"] - 1)
+
+    # Act
+    by_ean = await client.get(
+        "/api/v1/products/suggest", params={"q": products[0]["ean"][:10]}
+    )
+    by_substring = await client.get("/api/v1/products/suggest", params={"q": token[2:]})
+
+    # Assert
+    assert products[0]["id"] in [item["id"] for item in by_ean.json()]
+    assert [item["id"] for item in by_substring.json()] == [products[0]["id"]]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_suggest_follows_updates_and_archives(
+    client, db_session, sample_product, token
+):
+    """Test renamed products are found by their new name and archived ones are gone"""
+    # Arrange
+    renamed, archived = await create_products(
+        client, sample_product, f"{token} Old", f"{token} Gone"
+    )
+    since = await sync(db_session, renamed["change_seq"] - 1)
+
+    # Act
+    await client.put(f"/api/v1/products/{renamed['id']}", json={"name": f"{token} New"})
+    await client.delete(f"/api/v1/products/{archived['id']}")
+    await sync(db_session, since)
+    response = await client.get("/api/v1/products/suggest", params={"q": token})
+
+    # Assert
+    assert [item["name"] for item in response.json()] == [f"{token} New"]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_suggest_validates_query(client):
+    """Test empty queries and limits above the maximum are rejected"""
+    # Act
+    empty = await client.get("/api/v1/products/suggest", params={"q": ""})
+    too_many = await client.get(
+        "/api/v1/products/suggest", params={"q": "cola", "limit": 10_000}
+    )
+
+    # Assert
+    assert empty.status_code == 422
+    assert too_many.status_code == 422
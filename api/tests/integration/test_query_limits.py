@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.exceptions.exceptions import QueryTimeoutException
+from src.infrastructure.api.disconnect import CancelOnDisconnectMiddleware
+from src.infrastructure.database.connection import set_statement_timeout
+from src.infrastructure.repositories.base import database_exception
+
+
+async def sleeping_queries(test_engine) -> int:
+    async with test_engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT count(*) FROM pg_stat_activity "
+                "WHERE state = 'active' AND query LIKE 'SELECT pg_sleep(10)%'"
+            )
+        )
+        return result.scalar_one()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_statement_timeout_maps_to_query_timeout(test_engine):
+    """Test a statement over the session's limit raises a query timeout"""
+    # Arrange
+    session_maker = async_sessionmaker(test_engine, class_=AsyncSession)
+    async with session_maker() as session:
+        set_statement_timeout(session, 100)
+
+        # Act
+        applied = (await session.execute(text("SHOW statement_timeout"))).scalar_one()
+        with pytest.raises(Exception) as error:
+            await session.execute(text("SELECT pg_sleep(1)"))
+
+    # Assert
+    assert applied == "100ms"
+    assert isinstance(database_exception(error.value), QueryTimeoutException)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_client_disconnect_cancels_query(test_engine):
+    """Test a client disconnect cancels the query its request is running"""
+
+    # Arrange
+    async def app(scope, receive, send):
+        async with test_engine.connect() as conn:
+            await conn.execute(text("SELECT pg_sleep(10)"))
+
+    messages = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive():
+        message = next(messages, None)
+        if message:
+            return message
+        await asyncio.sleep(0.5)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    middleware = CancelOnDisconnectMiddleware(app)
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/products"}
+
+    # Act
+    start = time.perf_counter()
+    await asyncio.wait_for(middleware(scope, receive, send), timeout=5)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.5)
+
+    # Assert
+    assert elapsed < 5
+    assert await sleeping_queries(test_engine) == 0
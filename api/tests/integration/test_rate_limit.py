@@ -0,0 +1,81 @@
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.api import main
+from src.infrastructure.api.main import create_app
+from src.infrastructure.config import RateLimitRule, settings
+from src.infrastructure.api.sessions import get_db, get_read_db
+
+
+@pytest.fixture
+async def limited_client(
+    db_session: AsyncSession, monkeypatch
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create a test client with tight rate limits"""
+    monkeypatch.setattr(
+        settings, "rate_limit_default", RateLimitRule(rate=0.01, burst=2)
+    )
+    monkeypatch.setattr(
+        settings, "rate_limit_expensive", RateLimitRule(rate=0.01, burst=1)
+    )
+    app = create_app()
+
+    async def override_get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_requests_over_budget_are_rejected(limited_client: AsyncClient):
+    """Test a client over its budget gets 429 without affecting other clients"""
+    # Act
+    responses = [
+        await limited_client.get("/api/v1/products", headers={"X-API-Key": "a"})
+        for _ in range(3)
+    ]
+    other = await limited_client.get("/api/v1/products", headers={"X-API-Key": "b"})
+
+    # Assert
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert int(responses[-1].headers["Retry-After"]) >= 1
+    assert other.status_code == 200
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_expensive_requests_have_separate_budget(limited_client: AsyncClient):
+    """Test name searches draw from the expensive budget as well"""
+    # Act
+    first = await limited_client.get("/api/v1/products?name=apple")
+    second = await limited_client.get("/api/v1/products?name=apple")
+
+    # Assert
+    assert first.status_code == 200
+    assert second.status_code == 429
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_requests_are_shed_when_loop_lags(
+    limited_client: AsyncClient, monkeypatch
+):
+    """Test API requests get 503 with Retry-After while the event loop lags"""
+    # Arrange
+    monkeypatch.setattr(main.loop_lag_monitor, "lag", 5.0)
+
+    # Act
+    response = await limited_client.get("/api/v1/products")
+    health = await limited_client.get("/health")
+
+    # Assert
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.shed_retry_after_seconds)
+    assert health.status_code == 200
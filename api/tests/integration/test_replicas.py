@@ -0,0 +1,96 @@
+from typing import AsyncGenerator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.infrastructure.api.main import create_app
+from src.infrastructure.api.sessions import get_db
+from src.infrastructure.config import settings
+from src.infrastructure.database import connection
+from src.infrastructure.database.replicas import ReplicaRouter
+
+
+@pytest.fixture
+async def replica_engine(clone_database) -> AsyncGenerator[AsyncEngine, None]:
+    """Create an engine on a replica stand-in with the schema but no data"""
+    engine = create_async_engine(await clone_database("replica"))
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def replica_router(
+    test_engine: AsyncEngine, replica_engine: AsyncEngine, monkeypatch
+) -> ReplicaRouter:
+    router = ReplicaRouter(
+        primary=test_engine, replicas=[replica_engine], retry_seconds=30
+    )
+    monkeypatch.setitem(connection.LAZY_ATTRIBUTES, "replica_router", lambda: router)
+    monkeypatch.setattr(settings, "database_replica_urls", [str(replica_engine.url)])
+    return router
+
+
+@pytest.fixture
+async def replica_client(
+    committed_session: AsyncSession, replica_router: ReplicaRouter
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create a client whose reads are routed by the replica router"""
+    app = create_app()
+
+    async def override_get_db():
+        yield committed_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reads_are_routed_to_replica(
+    replica_client: AsyncClient,
+    replica_router: ReplicaRouter,
+    replica_engine: AsyncEngine,
+    committed_session: AsyncSession,
+    sample_product,
+):
+    """Test reads use the replica, except right after a write or when it is down"""
+    # Arrange
+    payload = {
+        key: sample_product[key]
+        for key in ("name", "ean", "price", "description", "active", "selling_place")
+    }
+    response = await replica_client.post("/api/v1/products", json=payload)
+    await committed_session.commit()
+    product_id = response.json()["id"]
+
+    # Act
+    sticky = await replica_client.get(f"/api/v1/products/{product_id}")
+    replica_client.cookies.clear()
+    from_replica = await replica_client.get(f"/api/v1/products/{product_id}")
+    replica_router.mark_unhealthy(replica_engine)
+    fallback = await replica_client.get(f"/api/v1/products/{product_id}")
+
+    # Assert
+    assert sticky.status_code == 200
+    assert from_replica.status_code == 404
+    assert fallback.status_code == 200
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_replica_health_check(
+    replica_router: ReplicaRouter, replica_engine: AsyncEngine
+):
+    """Test a replica marked down returns to rotation once it answers again"""
+    # Arrange
+    replica_router.mark_unhealthy(replica_engine)
+
+    # Act
+    await replica_router.check_health()
+
+    # Assert
+    assert replica_router.is_healthy(replica_engine)
+    assert replica_router.read_engine() is replica_engine
@@ -0,0 +1,112 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.domain.entities.product import SellingPlaceEnum
+from src.infrastructure.api.sessions import get_db
+from src.infrastructure.database import connection
+from src.infrastructure.database.models import ProductModel
+
+
+@pytest.fixture
+def request_sessions(test_engine: AsyncEngine, monkeypatch):
+    """Open get_db sessions on the test database"""
+    session_maker = async_sessionmaker(
+        test_engine, class_=AsyncSession, expire_on_commit=False
+    )
+    monkeypatch.setitem(
+        connection.LAZY_ATTRIBUTES, "async_session_maker", lambda: session_maker
+    )
+
+
+@pytest.fixture
+async def stored_product(committed_session: AsyncSession):
+    product = ProductModel(
+        id=uuid.uuid4(),
+        name=f"session_{uuid.uuid4()}",
+        ean="4000000000301",
+        price=10,
+        description="Before",
+        active=True,
+        selling_place=SellingPlaceEnum.EVENT,
+    )
+    committed_session.add(product)
+    await committed_session.commit()
+    yield product
+    await committed_session.delete(product)
+    await committed_session.commit()
+
+
+async def run_request(work) -> bool:
+    """Run work in a get_db session as a request would, returning whether
+    the session committed"""
+    sessions = get_db()
+    session = await anext(sessions)
+    commits = []
+    event.listen(session.sync_session, "after_commit", commits.append)
+    await work(session)
+    await anext(sessions, None)
+    return bool(commits)
+
+
+async def read_description(committed_session: AsyncSession, product_id) -> str:
+    result = await committed_session.execute(
+        select(ProductModel.description)
+        .where(ProductModel.id == product_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_read_only_request_skips_commit(request_sessions, stored_product):
+    """Test a request that only reads does not commit"""
+
+    # Arrange
+    async def read(session: AsyncSession):
+        await session.get(ProductModel, stored_product.id)
+        await session.execute(select(func.count()).select_from(ProductModel))
+
+    # Act
+    committed = await run_request(read)
+
+    # Assert
+    assert not committed
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_text_update_is_committed(
+    request_sessions, stored_product, committed_session: AsyncSession
+):
+    """Test a write through text() is committed, not rolled back"""
+
+    # Arrange
+    async def update(session: AsyncSession):
+        await session.execute(
+            text("UPDATE products SET description = 'After' WHERE id = :id"),
+            {"id": stored_product.id},
+        )
+
+    # Act
+    committed = await run_request(update)
+
+    # Assert
+    assert committed
+    assert await read_description(committed_session, stored_product.id) == "After"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_notify_is_committed(request_sessions):
+    """Test a SELECT sending a notification commits, so it is delivered"""
+
+    # Arrange
+    async def notify(session: AsyncSession):
+        await session.execute(select(func.pg_notify("test_sessions", "payload")))
+
+    # Act
+    committed = await run_request(notify)
+
+    # Assert
+    assert committed
@@ -0,0 +1,80 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.utils.import_time import profile_imports
+
+# Modules only the CLI, migrations and the job worker need; the API must
+# not pay for them at startup
+CLI_ONLY_MODULES = (
+    "typer",
+    "alembic",
+    "src.infrastructure.cli",
+    "src.infrastructure.database.online_migrations",
+    "src.infrastructure.jobs.worker",
+)
+
+# Prints how many engines and replica routers exist once the app is imported
+COUNT_ENGINES_AFTER_APP_IMPORT = """
+import src.infrastructure.api.main
+from src.infrastructure.database import connection
+print(connection._engine.cache_info().currsize)
+print(connection._replica_router.cache_info().currsize)
+"""
+
+
+def test_api_import_skips_cli_modules():
+    """Test importing the API loads nothing only the CLI or worker use"""
+    # Act
+    profile = profile_imports("src.infrastructure.api.main")
+
+    # Assert
+    for module in CLI_ONLY_MODULES:
+        assert not profile.imported(module), module
+
+
+def test_cli_import_skips_command_modules():
+    """Test the CLI only imports a command's dependencies when it runs"""
+    # Act
+    profile = profile_imports("src.infrastructure.cli.main")
+
+    # Assert
+    for module in (
+        "sqlalchemy",
+        "fastapi",
+        "PIL",
+        "alembic",
+        "src.infrastructure.config",
+        "src.infrastructure.cli.commands",
+    ):
+        assert not profile.imported(module), module
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["src.infrastructure.database.models", "src.infrastructure.database.connection"],
+)
+def test_database_modules_build_no_engine(module):
+    """Test importing the models builds no engine and loads no driver or web stack"""
+    # Act
+    profile = profile_imports(module)
+
+    # Assert
+    assert not profile.imported("asyncpg")
+    assert not profile.imported("fastapi")
+    assert not profile.imported("starlette")
+
+
+def test_api_import_builds_no_engine():
+    """Test importing the app leaves building the engines to the first request"""
+    # Act
+    result = subprocess.run(
+        [sys.executable, "-c", COUNT_ENGINES_AFTER_APP_IMPORT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Assert
+    assert result.stdout.split() == ["0", "0"]
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+
+from src.infrastructure.api.container import get_catalog_stats
+
+
+@pytest.fixture
+def always_refresh(monkeypatch):
+    """Make every stats request recompute the summary"""
+    monkeypatch.setattr(get_catalog_stats, "refresh_interval", timedelta(0))
+
+
+def added(after: dict[str, int], before: dict[str, int]) -> dict[str, int]:
+    """Counts that grew between two summaries, by key"""
+    grown = {key: count - before.get(key, 0) for key, count in after.items()}
+    return {key: count for key, count in grown.items() if count}
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_catalog_stats(client: AsyncClient, always_refresh):
+    """Test catalog stats aggregate counts and prices"""
+    # Arrange
+    # Rows other tests committed stay in the summary, so compare with it
+    before = (await client.get("/api/v1/products/stats")).json()
+    products = [
+        ("Stats Store A", "3000000000001", 10.0, True, "store"),
+        ("Stats Store B", "3000000000002", 20.0, False, "store"),
+        ("Stats Event A", "3000000000003", 30.0, True, "event"),
+    ]
+    for name, ean, price, active, selling_place in products:
+        await client.post(
+            "/api/v1/products",
+            json={
+                "name": name,
+                "ean": ean,
+                "price": price,
+                "description": f"{name} description",
+                "active": active,
+                "selling_place": selling_place,
+            },
+        )
+
+    # Act
+    response = await client.get("/api/v1/products/stats")
+
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    before_prices = before["price"]
+    assert data["total"] - before["total"] == 3
+    assert added(data["by_selling_place"], before["by_selling_place"]) == {
+        "store": 2,
+        "event": 1,
+    }
+    assert added(data["by_active"], before["by_active"]) == {
+        "active": 2,
+        "inactive": 1,
+    }
+    assert data["price"]["min"] == min(before_prices["min"] or 10.0, 10.0)
+    assert data["price"]["max"] == max(before_prices["max"] or 30.0, 30.0)
+    assert data["price"]["avg"] == pytest.approx(
+        ((before_prices["avg"] or 0) * before["total"] + 60.0) / (before["total"] + 3),
+        abs=0.01,
+    )
+    assert data["price"]["min"] <= data["price"]["p50"] <= data["price"]["max"]
+    assert (
+        sum(day["count"] for day in data["added_per_day"])
+        - sum(day["count"] for day in before["added_per_day"])
+        == 3
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_catalog_stats_is_served_from_summary(client: AsyncClient):
+    """Test fresh stats are not recomputed on every request"""
+    # Arrange
+    first = (await client.get("/api/v1/products/stats")).json()
+    await client.post(
+        "/api/v1/products",
+        json={
+            "name": "Stats Late Product",
+            "ean": "3000000000004",
+            "price": 5.0,
+            "description": "Added after the summary was built",
+            "active": True,
+            "selling_place": "store",
+        },
+    )
+
+    # Act
+    second = (await client.get("/api/v1/products/stats")).json()
+
+    # Assert
+    assert second["computed_at"] == first["computed_at"]
+    assert second["total"] == first["total"]
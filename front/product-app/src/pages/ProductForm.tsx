@@ -15,9 +15,12 @@ const ProductForm: React.FC = () => {
     description: '',
     active: true,
     selling_place: SellingPlace.STORE,
-    picture: null as string | null,
   });
 
+  const [pictureFile, setPictureFile] = useState<File | null>(null);
+  const [hasPicture, setHasPicture] = useState(false);
+  const [pictureRemoved, setPictureRemoved] = useState(false);
+
   const [picturePreview, setPicturePreview] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
@@ -42,10 +45,10 @@ const ProductForm: React.FC = () => {
         description: product.description,
         active: product.active,
         selling_place: product.selling_place,
-        picture: product.picture || null,
       });
-      if (product.picture) {
-        setPicturePreview(`data:image/jpeg;base64,${product.picture}`);
+      if (product.picture || product.picture_digest) {
+        setHasPicture(true);
+        setPicturePreview(productService.getPictureUrl(productId));
       }
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Failed to load product');
@@ -80,22 +83,14 @@ const ProductForm: React.FC = () => {
       return;
     }
 
-    try {
-      const reader = new FileReader();
-      reader.onloadend = () => {
-        const base64String = reader.result as string;
-        const base64Data = base64String.split(',')[1];
-        setFormData(prev => ({ ...prev, picture: base64Data }));
-        setPicturePreview(base64String);
-      };
-      reader.readAsDataURL(file);
-    } catch (err) {
-      setError('Failed to read image file');
-    }
+    setPictureFile(file);
+    setPictureRemoved(false);
+    setPicturePreview(URL.createObjectURL(file));
   };
 
   const handleRemovePicture = () => {
-    setFormData(prev => ({ ...prev, picture: null }));
+    setPictureFile(null);
+    setPictureRemoved(hasPicture);
     setPicturePreview(null);
   };
 
@@ -128,14 +123,16 @@ const ProductForm: React.FC = () => {
         description: formData.description,
         active: formData.active,
         selling_place: formData.selling_place,
-        picture: formData.picture,
+        ...(pictureRemoved && !pictureFile ? { picture: null } : {}),
       };
 
       if (isEditMode && id) {
         await productService.updateProduct(id, productData);
+        if (pictureFile) await productService.uploadPicture(id, pictureFile);
         setSuccess('Product updated successfully!');
       } else {
-        await productService.createProduct(productData);
+        const product = await productService.createProduct(productData);
+        if (pictureFile) await productService.uploadPicture(product.id, pictureFile);
         setSuccess('Product created successfully!');
         setTimeout(() => navigate('/'), 1500);
       }
@@ -262,10 +259,10 @@ const ProductForm: React.FC = () => {
               Max file size: 5MB. Accepted formats: JPG, PNG, GIF, WebP
             </small>
             
-            {(picturePreview || formData.picture) && (
+            {picturePreview && (
               <div style={{ marginTop: '1rem' }}>
                 <img 
-                  src={picturePreview || `data:image/jpeg;base64,${formData.picture}`} 
+                  src={picturePreview} 
                   alt="Product preview" 
                   style={{ maxWidth: '200px', maxHeight: '200px', objectFit: 'contain', borderRadius: '8px', border: '1px solid #ddd' }}
                 />
@@ -1,9 +1,12 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { Link } from 'react-router-dom';
 import { productService } from '../services/productService';
 import { Product } from '../types/product';
 import Pagination from '../components/Pagination';
 
+// Product events arriving within this window are handled together
+const EVENT_COALESCE_MS = 1000;
+
 const ProductList: React.FC = () => {
   const [products, setProducts] = useState<Product[]>([]);
   const [loading, setLoading] = useState(true);
@@ -16,13 +19,59 @@ const ProductList: React.FC = () => {
   const [nameFilter, setNameFilter] = useState('');
   const [searchInput, setSearchInput] = useState('');
 
+  const productsRef = useRef<Product[]>([]);
+  productsRef.current = products;
+
   useEffect(() => {
     loadProducts();
   }, [page, size, nameFilter]);
 
-  const loadProducts = async () => {
+  // A burst of writes must not turn into a burst of list queries: updates
+  // to rows on the page are patched from one read per product, and creates,
+  // archives and resyncs lead to at most one reload per window
+  useEffect(() => {
+    let timer: ReturnType<typeof setTimeout> | undefined;
+    let reload = false;
+    const updated = new Set<string>();
+
+    const flush = async () => {
+      timer = undefined;
+      if (reload) {
+        reload = false;
+        updated.clear();
+        await loadProducts(true);
+        return;
+      }
+      const ids = [...updated];
+      updated.clear();
+      const fresh = await Promise.all(
+        ids.map((id) => productService.getProductById(id).catch(() => null))
+      );
+      setProducts((current) =>
+        current.map((product) => fresh.find((item) => item?.id === product.id) ?? product)
+      );
+    };
+
+    const unsubscribe = productService.subscribeToEvents((event) => {
+      if (event.type === 'updated') {
+        const productId = event.product_id;
+        if (!productsRef.current.some((product) => product.id === productId)) return;
+        updated.add(productId);
+      } else {
+        reload = true;
+      }
+      timer ??= setTimeout(flush, EVENT_COALESCE_MS);
+    });
+    return () => {
+      clearTimeout(timer);
+      unsubscribe();
+    };
+  }, [page, size, nameFilter]);
+
+  const loadProducts = async (background = false) => {
     try {
-      setLoading(true);
+      // Reloads triggered by events keep the current rows on screen
+      if (!background) setLoading(true);
       setError(null);
       const response = await productService.listProducts(page, size, nameFilter);
       setProducts(response.items);
@@ -39,6 +88,16 @@ const ProductList: React.FC = () => {
     setShowViewModal(true);
   };
 
+  const handleArchiveProduct = async (product: Product) => {
+    if (!window.confirm(`Archive "${product.name}"?`)) return;
+    try {
+      await productService.archiveProduct(product.id);
+      await loadProducts();
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to archive product');
+    }
+  };
+
   const handleCloseModal = () => {
     setShowViewModal(false);
     setViewProduct(null);
@@ -139,12 +198,16 @@ const ProductList: React.FC = () => {
               {products.map((product) => (
                 <tr key={product.id}>
                   <td>
-                    {product.picture ? (
-                      <img 
-                        src={`data:image/jpeg;base64,${product.picture}`} 
-                        alt={product.name}
-                        style={{ width: '50px', height: '50px', objectFit: 'cover', borderRadius: '4px' }}
-                      />
+                    {product.thumbnails ? (
+                      <picture>
+                        <source srcSet={product.thumbnails['64'].avif} type="image/avif" />
+                        <img 
+                          src={product.thumbnails['64'].webp} 
+                          alt={product.name}
+                          loading="lazy"
+                          style={{ width: '50px', height: '50px', objectFit: 'cover', borderRadius: '4px' }}
+                        />
+                      </picture>
                     ) : (
                       <div style={{ width: '50px', height: '50px', backgroundColor: '#e0e0e0', borderRadius: '4px', display: 'flex', alignItems: 'center', justifyContent: 'center', fontSize: '0.75rem', color: '#666' }}>
                         No image
@@ -173,10 +236,17 @@ const ProductList: React.FC = () => {
                       View
                     </button>
                     <Link to={`/products/${product.id}`}>
-                      <button className="secondary" style={{ fontSize: '0.875rem', padding: '0.5rem 1rem' }}>
+                      <button className="secondary" style={{ fontSize: '0.875rem', padding: '0.5rem 1rem', marginRight: '0.5rem' }}>
                         Edit
                       </button>
                     </Link>
+                    <button
+                      onClick={() => handleArchiveProduct(product)}
+                      className="secondary"
+                      style={{ fontSize: '0.875rem', padding: '0.5rem 1rem' }}
+                    >
+                      Archive
+                    </button>
                   </td>
                 </tr>
               ))}
@@ -200,13 +270,16 @@ const ProductList: React.FC = () => {
               <button className="modal-close" onClick={handleCloseModal}>&times;</button>
             </div>
             <div className="modal-body">
-              {viewProduct.picture && (
+              {viewProduct.thumbnails && (
                 <div style={{ textAlign: 'center', marginBottom: '1.5rem' }}>
-                  <img 
-                    src={`data:image/jpeg;base64,${viewProduct.picture}`} 
-                    alt={viewProduct.name}
-                    style={{ maxWidth: '100%', maxHeight: '300px', objectFit: 'contain', borderRadius: '8px', border: '1px solid #ddd' }}
-                  />
+                  <picture>
+                    <source srcSet={viewProduct.thumbnails['256'].avif} type="image/avif" />
+                    <img 
+                      src={viewProduct.thumbnails['256'].webp} 
+                      alt={viewProduct.name}
+                      style={{ maxWidth: '100%', maxHeight: '300px', objectFit: 'contain', borderRadius: '8px', border: '1px solid #ddd' }}
+                    />
+                  </picture>
                 </div>
               )}
               <div className="detail-row">
@@ -1,4 +1,10 @@
-import { Product, CreateProductDTO, UpdateProductDTO, ProductListResponse } from '../types/product';
+import {
+  Product,
+  CreateProductDTO,
+  UpdateProductDTO,
+  ProductListResponse,
+  ProductEvent,
+} from '../types/product';
 
 const API_BASE_URL = '/api/v1';
 
@@ -44,6 +50,38 @@ class ProductService {
     if (!response.ok) throw new Error(`Failed to update product: ${await response.text()}`);
     return response.json();
   }
+
+  async archiveProduct(productId: string): Promise<void> {
+    const response = await fetch(`${API_BASE_URL}/products/${productId}`, {
+      method: 'DELETE',
+    });
+    if (!response.ok) throw new Error(`Failed to archive product: ${await response.text()}`);
+  }
+
+  async uploadPicture(productId: string, picture: File): Promise<Product> {
+    const formData = new FormData();
+    formData.append('picture', picture);
+    const response = await fetch(`${API_BASE_URL}/products/${productId}/picture`, {
+      method: 'PUT',
+      body: formData,
+    });
+    if (!response.ok) throw new Error(`Failed to upload picture: ${await response.text()}`);
+    return response.json();
+  }
+
+  getPictureUrl(productId: string): string {
+    return `${API_BASE_URL}/products/${productId}/picture`;
+  }
+
+  subscribeToEvents(onEvent: (event: ProductEvent) => void): () => void {
+    const source = new EventSource(`${API_BASE_URL}/products/events`);
+    const handler = (message: MessageEvent) => onEvent(JSON.parse(message.data));
+    source.addEventListener('product.created', handler);
+    source.addEventListener('product.updated', handler);
+    source.addEventListener('product.archived', handler);
+    source.addEventListener('product.resync', handler);
+    return () => source.close();
+  }
 }
 
 export const productService = new ProductService();
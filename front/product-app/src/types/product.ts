@@ -3,6 +3,10 @@ export enum SellingPlace {
   STORE = 'store',
 }
 
+export type ThumbnailFormat = 'webp' | 'avif';
+
+export type Thumbnails = Record<string, Record<ThumbnailFormat, string>>;
+
 export interface Product {
   id: string;
   name: string;
@@ -13,8 +17,25 @@ export interface Product {
   active: boolean;
   selling_place: SellingPlace;
   picture?: string | null;
+  picture_digest?: string | null;
+  archived_at?: string | null;
+  thumbnails?: Thumbnails | null;
+}
+
+export interface ProductChangeEvent {
+  type: 'created' | 'updated' | 'archived';
+  product_id: string;
+  change_seq: number;
 }
 
+// Sent on reconnect when changes were missed since the Last-Event-ID
+export interface ProductResyncEvent {
+  type: 'resync';
+  change_seq: number;
+}
+
+export type ProductEvent = ProductChangeEvent | ProductResyncEvent;
+
 export interface CreateProductDTO {
   name: string;
   ean: string;